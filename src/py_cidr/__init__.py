@@ -8,8 +8,15 @@ Public Methods for py_cidr module
 #
 from ._network.cidr_types import (IPvxNetwork, IPvxAddress, IPAddress)
 from ._network.cidr_types import (IPv4, IPv6)
+from ._network.cidr_types import CidrLike
 from ._network.cidr_types import PrefixVal
 from ._network.ip_version import ip_version
+from ._network.net_int import NetInt
+from ._network.parse_cache import (ParseCache, CacheInfo)
+from ._network.compact_set import CompactSet
+from ._network.cidr_set import CidrSet
+from ._network._cidr_overlaps import Overlaps
+from ._network._cidr_normalize import NormalizeCounts
 
 from .cidr_class import Cidr
 
@@ -3,15 +3,18 @@
 """
 Class support functions for cidr addresses
 """
+from functools import partial
 import ipaddress
 import re
 from ipaddress import (AddressValueError)
 
 from .cidr_types import (IPvxAddress, IPvxNetwork)
 from ._cidr_valid import (is_valid_ip4, is_valid_ip6)
+from .parse_cache import (ParseCache, choose_addr_cache)
 
 
-def ip_to_address(ip: str) -> IPvxAddress | None:
+def ip_to_address(ip: str, cache: ParseCache | bool | None = None
+                  ) -> IPvxAddress | None:
     """
     Return ipaddress of given ip string.
 
@@ -21,12 +24,27 @@ def ip_to_address(ip: str) -> IPvxAddress | None:
     :param ip:
         The IP string to convert
 
+    :param cache:
+        Parse cache to use. None (default) uses the global cache
+        if enabled, True always uses the global cache,
+        False never caches or pass a ParseCache instance to use.
+
     :returns:
         IPvxAddress derived from IP or None if not an IP address
     """
     if not ip:
         return None
 
+    addr_cache = choose_addr_cache(cache)
+    if addr_cache is not None:
+        return addr_cache.lookup(ip, partial(_ip_to_address, ip))
+    return _ip_to_address(ip)
+
+
+def _ip_to_address(ip: str) -> IPvxAddress | None:
+    """
+    Convert ip string to address - see ip_to_address()
+    """
     ipin = ip
     if '/' in ip:
         ipin = re.sub(r'/.*$', '',  ip)
@@ -38,17 +56,24 @@ def ip_to_address(ip: str) -> IPvxAddress | None:
     return addr
 
 
-def ips_to_addresses(ips: list[str]) -> list[IPvxAddress]:
+def ips_to_addresses(ips: list[str], cache: ParseCache | bool | None = None
+                     ) -> list[IPvxAddress]:
     """
     Convert list of IP strings to a list of ip addresses.
 
     :param ips:
         list of IP strings to convert
 
+    :param cache:
+        Parse cache to use - see ip_to_address().
+
     :returns:
         list of IPvxAddress derived from input IPs.
     """
-    addresses = [ip_to_address(ip) for ip in ips]
+    addr_cache: ParseCache | bool | None = choose_addr_cache(cache)
+    if addr_cache is None:
+        addr_cache = False
+    addresses = [ip_to_address(ip, addr_cache) for ip in ips]
     good_addresses = [ip for ip in addresses if ip is not None]
     return good_addresses
 
@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Budgeted (lossy) aggregation: reduce a cidr list to at most N prefixes.
+
+Starts from the exact compacted list. Neighbouring prefixes (same IP
+version) are candidates to be replaced by the smallest prefix covering
+both. The cost of a merge is the number of addresses it adds that were
+not in the list. Greedy: a heap keyed on cost picks the cheapest merge
+each time. Prefixes are kept in a doubly linked list so a merge only
+touches its neighbours; stale heap entries are skipped when popped
+(lazy invalidation).
+"""
+from typing import (Any, Sequence)
+import heapq
+
+from ._cidr_intervals import (merge_intervals, cidrs_to_merged_intervals)
+from ._cidr_intervals import (intervals_to_blocks, intervals_to_cidrs)
+
+
+class _Blocks:
+    """
+    Doubly linked list of cidr blocks with a heap of merge candidates.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.versions: list[int] = []
+        self.prev: list[int] = []
+        self.next: list[int] = []
+        self.alive: list[bool] = []
+        self.stamp: list[int] = []
+        self.heap: list[tuple[int, int, int, int, int]] = []
+        self.count: int = 0
+        self.overcover: int = 0
+
+    def append(self, start: int, end: int, version: int):
+        """
+        Add block after current last block.
+        """
+        idx = len(self.starts)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.versions.append(version)
+        self.prev.append(idx - 1)
+        self.next.append(-1)
+        self.alive.append(True)
+        self.stamp.append(0)
+        if idx > 0:
+            self.next[idx - 1] = idx
+        self.count += 1
+
+    def _supernet(self, left: int, right: int) -> tuple[int, int]:
+        """
+        Smallest cidr block covering both blocks.
+        """
+        start = self.starts[left]
+        host_bits = (start ^ self.ends[right]).bit_length()
+        start = start >> host_bits << host_bits
+        return (start, start + (1 << host_bits) - 1)
+
+    def push_pair(self, left: int):
+        """
+        Queue merge of block left with its next block (if same version).
+        """
+        right = self.next[left] if left >= 0 else -1
+        if right < 0 or self.versions[left] != self.versions[right]:
+            return
+
+        (start, end) = self._supernet(left, right)
+        cost = ((end - start + 1)
+                - (self.ends[left] - self.starts[left] + 1)
+                - (self.ends[right] - self.starts[right] + 1))
+        heapq.heappush(self.heap, (cost, left, self.stamp[left], right, self.stamp[right]))
+
+    def merge_next(self, max_overcover: int | None) -> bool:
+        """
+        Do the cheapest merge. False if none left or over max_overcover.
+        """
+        while self.heap:
+            (cost, left, left_stamp, right, right_stamp) = self.heap[0]
+            if (not self.alive[left] or not self.alive[right]
+                    or self.stamp[left] != left_stamp or self.stamp[right] != right_stamp):
+                heapq.heappop(self.heap)
+                continue
+
+            if max_overcover is not None and self.overcover + cost > max_overcover:
+                return False
+            heapq.heappop(self.heap)
+            self._merge(left, right)
+            return True
+        return False
+
+    def _merge(self, left: int, right: int):
+        """
+        Replace left, right and any other blocks inside their supernet
+        by the supernet (kept in node left).
+        """
+        (start, end) = self._supernet(left, right)
+        version = self.versions[left]
+        covered = 0
+
+        # absorb everything in supernet: walk left then right
+        first = left
+        while (self.prev[first] >= 0 and self.versions[self.prev[first]] == version
+               and self.starts[self.prev[first]] >= start):
+            first = self.prev[first]
+
+        node = first
+        while node >= 0 and self.versions[node] == version and self.starts[node] <= end:
+            covered += self.ends[node] - self.starts[node] + 1
+            self.alive[node] = False
+            self.count -= 1
+            node = self.next[node]
+        after = node
+
+        before = self.prev[first]
+        self.alive[left] = True
+        self.count += 1
+        self.starts[left] = start
+        self.ends[left] = end
+        self.stamp[left] += 1
+        self.prev[left] = before
+        self.next[left] = after
+        if before >= 0:
+            self.next[before] = left
+        if after >= 0:
+            self.prev[after] = left
+
+        self.overcover += (end - start + 1) - covered
+        self.push_pair(before)
+        self.push_pair(left)
+
+    def intervals(self, version: int) -> list[tuple[int, int]]:
+        """
+        Remaining blocks of version as merged intervals.
+        """
+        ivs = [(self.starts[idx], self.ends[idx]) for idx in range(len(self.starts))
+               if self.alive[idx] and self.versions[idx] == version]
+        return merge_intervals(ivs)
+
+
+def aggregate_cidrs(cidrs: Sequence[Any], max_prefixes: int,
+                    max_overcover: int | None = None) -> tuple[list[str], int]:
+    """
+    Compact then merge prefixes, adding as few addresses as possible,
+    until there are at most max_prefixes.
+
+    Args:
+        cidrs (Sequence[Any]):
+            cidrs (strings, IPvxNetwork or IPvxAddress) - may be mixed ipv4 and ipv6.
+            Any bad cidr will raise ValueError.
+
+        max_prefixes (int):
+            Target maximum number of prefixes.
+            ipv4 and ipv6 are never merged with each other.
+
+        max_overcover (int | None):
+            If set, stop once the next merge would take the number of
+            added addresses past this - the result may then have more
+            than max_prefixes.
+
+    Returns:
+        tuple[list[str], int]:
+            (cidrs, overcovered) - cidrs (ipv4 then ipv6) and number of
+            addresses they cover that were not in the input.
+    """
+    if not cidrs:
+        return ([], 0)
+
+    (ivs4, ivs6, invalid) = cidrs_to_merged_intervals(cidrs)
+    if invalid:
+        raise ValueError(f'Bad cidr input invalid: {invalid[0]}')
+
+    blocks = _Blocks()
+    for (ivs, version, max_prefixlen) in ((ivs4, 4, 32), (ivs6, 6, 128)):
+        for (num, prefixlen) in intervals_to_blocks(ivs, max_prefixlen):
+            blocks.append(num, num + (1 << (max_prefixlen - prefixlen)) - 1, version)
+
+    if blocks.count > max_prefixes:
+        for idx in range(len(blocks.starts)):
+            blocks.push_pair(idx)
+
+        while blocks.count > max_prefixes:
+            if not blocks.merge_next(max_overcover):
+                break
+
+    # merges can leave siblings that now combine for free
+    result = intervals_to_cidrs(blocks.intervals(4), 4)
+    result += intervals_to_cidrs(blocks.intervals(6), 6)
+    return (result, blocks.overcover)
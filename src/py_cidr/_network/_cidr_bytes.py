@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Bulk parse of a buffer of cidr text lines (e.g. an mmap of a file).
+
+Works on the raw bytes with numpy - no str is made per line.
+Line starts and the end of column 1 are found with vectorized searches,
+comment lines are dropped using the same rules as the text readers,
+and column 1 of each line is gathered into a 2d array of character codes
+for the vectorized ipv4 / ipv6 parsers.
+Rare lines these cannot handle (netmask prefix, scope id, leading
+white space, NUL or non ascii bytes) are decoded and parsed one at a time.
+The buffer is done in chunks of whole lines to keep memory bounded.
+"""
+from typing import (Any)
+
+from py_cidr._utils import require_numpy
+
+from ._cidr_parse import parse_cidr_key
+from ._cidr_nets import (_parse_ip4_codes, _parse_ip6_codes, _IP4_WIDTH, _IP6_WIDTH)
+
+# bytes per chunk - rounded up to end of line
+_CHUNK_BYTES = 4 * 1024 * 1024
+_SCAN_BYTES = 4096
+
+# lines starting with these are comments (see _has_cidr_data)
+_COMMENT_CHARS = b'#$!:'
+
+# ascii characters str.split() treats as white space (includes newlines)
+_WHITE_SPACE = b'\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f '
+
+_MASK_64 = (1 << 64) - 1
+
+
+class _Chunk:
+    """
+    Parse results of one chunk - one row per line with cidr data.
+    """
+    # pylint: disable=too-few-public-methods
+    def __init__(self, np: Any, num: int):
+        self.version = np.zeros(num, dtype=np.uint8)
+        self.addrs = np.zeros(num, dtype=np.uint32)
+        self.prefixlens = np.zeros(num, dtype=np.uint8)
+        self.hi = np.zeros(num, dtype=np.uint64)
+        self.lo = np.zeros(num, dtype=np.uint64)
+
+    def set_one(self, row: int, text: str):
+        """
+        Parse one cidr the slow way.
+        """
+        key = parse_cidr_key(text)
+        if key is None:
+            return
+
+        (version, num, prefixlen) = key
+        self.version[row] = version
+        self.prefixlens[row] = prefixlen
+        if version == 4:
+            self.addrs[row] = num
+        else:
+            self.hi[row] = num >> 64
+            self.lo[row] = num & _MASK_64
+
+
+def _byte_table(np: Any, chars: bytes) -> Any:
+    """
+    Lookup table: table[byte] is True for bytes in chars.
+    """
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(chars, dtype=np.uint8)] = True
+    return table
+
+
+def _count_between(np: Any, mask: Any, starts: Any, ends: Any) -> Any:
+    """
+    Number of True in mask[start:end] for each (start, end).
+    """
+    counts = np.concatenate(([0], np.cumsum(mask, dtype=np.int32)))
+    return counts[ends] - counts[starts]
+
+
+def _gather_codes(np: Any, data: Any, starts: Any, lengths: Any, width: int) -> Any:
+    """
+    2d array of bytes starting at each start, zero filled after lengths.
+    Just wide enough for longest - any longer than width fills last column.
+    """
+    if len(starts):
+        width = min(width, int(lengths.max()) + 1)
+    cols = np.arange(width)
+    idx = np.minimum(starts[:, None] + cols, len(data) - 1)
+    return np.where(cols < lengths[:, None], data[idx], 0).astype(np.uint8)
+
+
+def _parse_chunk(np: Any, data: Any) -> _Chunk:
+    """
+    Parse one chunk of whole lines.
+    """
+    # pylint: disable=too-many-locals
+    size = len(data)
+    is_ws = _byte_table(np, _WHITE_SPACE)[data]
+
+    # non empty lines that are not comments
+    newlines = np.flatnonzero((data == 10) | (data == 13))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [size]))
+    keep = starts < ends
+    (starts, ends) = (starts[keep], ends[keep])
+    keep = ~_byte_table(np, _COMMENT_CHARS)[data[starts]]
+    (starts, ends) = (starts[keep], ends[keep])
+
+    # column 1 ends at first white space (or end of chunk)
+    ws_pos = np.concatenate((np.flatnonzero(is_ws), [size]))
+    col_ends = ws_pos[np.searchsorted(ws_pos, starts)]
+    lengths = col_ends - starts
+
+    # slow path: leading white space or bytes the code parsers can't see
+    odd = _count_between(np, (data == 0) | (data >= 128), starts, col_ends)
+    slow = is_ws[starts] | (odd > 0)
+    is_ip6 = _count_between(np, data == 58, starts, col_ends) > 0
+    rows4 = np.flatnonzero(~is_ip6 & ~slow)
+    rows6 = np.flatnonzero(is_ip6 & ~slow)
+
+    result = _Chunk(np, len(starts))
+    if len(rows4):
+        codes = _gather_codes(np, data, starts[rows4], lengths[rows4], _IP4_WIDTH)
+        (addrs, prefixlens, invalid, fallback) = _parse_ip4_codes(codes)
+        good = ~invalid & ~fallback
+        result.version[rows4[good]] = 4
+        result.addrs[rows4[good]] = addrs[good]
+        result.prefixlens[rows4[good]] = prefixlens[good]
+        slow[rows4[fallback]] = True
+
+    if len(rows6):
+        codes = _gather_codes(np, data, starts[rows6], lengths[rows6], _IP6_WIDTH)
+        (hi, lo, prefixlens, invalid, fallback) = _parse_ip6_codes(codes)
+        good = ~invalid & ~fallback
+        result.version[rows6[good]] = 6
+        result.hi[rows6[good]] = hi[good]
+        result.lo[rows6[good]] = lo[good]
+        result.prefixlens[rows6[good]] = prefixlens[good]
+        slow[rows6[fallback]] = True
+
+    for row in np.flatnonzero(slow).tolist():
+        line = data[starts[row]:ends[row]].tobytes().decode('utf-8', errors='replace')
+        cols = line.split(maxsplit=1)
+        if cols:
+            result.set_one(row, cols[0])
+    return result
+
+
+def _chunk_end(np: Any, data: Any, end: int) -> int:
+    """
+    Offset just past the first newline at or after end.
+    """
+    size = len(data)
+    while end < size:
+        newlines = np.flatnonzero((data[end:end + _SCAN_BYTES] == 10)
+                                  | (data[end:end + _SCAN_BYTES] == 13))
+        if len(newlines):
+            return end + int(newlines[0]) + 1
+        end += _SCAN_BYTES
+    return size
+
+
+def parse_cidr_buffer(buf: Any) -> tuple[tuple[Any, Any], tuple[Any, Any, Any]]:
+    """
+    Parse column 1 of every line of text in a buffer.
+
+    Same lines and cidrs as the text file readers: comment lines and
+    invalid cidrs are skipped. Host bits are zeroed. Requires numpy.
+
+    Args:
+        buf (Any):
+            bytes like buffer of text lines - e.g. bytes or mmap.
+
+    Returns:
+        tuple[tuple[addrs, prefixlens], tuple[hi, lo, prefixlens]]:
+            ipv4 (uint32 addrs, uint8 prefixlens) and
+            ipv6 (uint64 hi, uint64 lo, uint8 prefixlens) numpy arrays,
+            each in file order.
+    """
+    np = require_numpy('parse_cidr_buffer')
+    data = np.frombuffer(buf, dtype=np.uint8)
+    size = len(data)
+
+    chunks: list[_Chunk] = []
+    pos = 0
+    while pos < size:
+        end = _chunk_end(np, data, pos + _CHUNK_BYTES)
+        chunks.append(_parse_chunk(np, data[pos:end]))
+        pos = end
+    del data
+
+    def _join(name: str, version: int, dtype: Any) -> Any:
+        arrays = [getattr(chunk, name)[chunk.version == version] for chunk in chunks]
+        return np.concatenate(arrays) if arrays else np.zeros(0, dtype=dtype)
+
+    return ((_join('addrs', 4, np.uint32), _join('prefixlens', 4, np.uint8)),
+            (_join('hi', 6, np.uint64), _join('lo', 6, np.uint64),
+             _join('prefixlens', 6, np.uint8)))
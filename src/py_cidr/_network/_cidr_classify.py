@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Classify list of cidrs by type, parsing each one only once.
+"""
+from typing import (Any, Iterable)
+import ipaddress
+from ipaddress import (IPv4Network, IPv6Network)
+
+from .cidr_types import (IPvxNetwork)
+
+
+def string_to_net(cidr: Any, strict: bool = False) -> IPvxNetwork:
+    """
+    Convert cidr to network with a single parse.
+
+    A valid IPv6 string always has a ':' and a valid IPv4 string never does,
+    so strings go straight to the right network type. This avoids
+    ipaddress.ip_network() first trying (and failing) IPv4 for every IPv6.
+    Anything else is handed to ip_network().
+
+    Args:
+        cidr (Any):
+            Cidr string (or anything ipaddress.ip_network() accepts).
+
+        strict (bool):
+            If true then cidr is considered invalid if host bits are set.
+
+    Returns:
+        IPvxNetwork:
+            The network. Raises ValueError if invalid.
+    """
+    if isinstance(cidr, str):
+        if ':' in cidr:
+            return IPv6Network(cidr, strict=strict)
+        return IPv4Network(cidr, strict=strict)
+    return ipaddress.ip_network(cidr, strict=strict)
+
+
+def classify_cidrs(cidrs: Iterable[Any], strict: bool = False
+                   ) -> tuple[list[IPv4Network], list[IPv6Network], list[Any]]:
+    """
+    Split list of cidrs into ipv4 and ipv6 networks plus invalid cidrs.
+
+    Each cidr is parsed exactly once and the parsed networks are kept,
+    so they can be passed on to compact_nets(), sort_nets(), nets_exclude()
+    etc. without parsing the strings again.
+
+    Args:
+        cidrs (Iterable[Any]):
+            cidr strings to classify (or anything ipaddress.ip_network() accepts).
+
+        strict (bool):
+            If true, cidr with host bits set is invalid. Defaults to false.
+
+    Returns:
+        tuple[list[IPv4Network], list[IPv6Network], list[Any]]:
+            tuple (ip4_nets, ip6_nets, invalid). Networks are in input order
+            and invalid holds those input cidrs that could not be parsed.
+    """
+    ip4: list[IPv4Network] = []
+    ip6: list[IPv6Network] = []
+    invalid: list[Any] = []
+
+    if not cidrs:
+        return (ip4, ip6, invalid)
+
+    for cidr in cidrs:
+        try:
+            net = string_to_net(cidr, strict=strict)
+        except (ValueError, TypeError):
+            invalid.append(cidr)
+            continue
+
+        if net.version == 4:
+            ip4.append(net)         # type: ignore[arg-type]
+        else:
+            ip6.append(net)         # type: ignore[arg-type]
+
+    return (ip4, ip6, invalid)
@@ -19,6 +19,20 @@ def clean_cidr(cidr: str) -> str | None:
         cidr = fix_cidr_host_bits(cidr)
         return cidr
 
+    cidr = complete_cidr(cidr)
+    if is_valid_cidr(cidr):
+        cidr = fix_cidr_host_bits(cidr)
+        return cidr
+
+    return None
+
+
+def complete_cidr(cidr: str) -> str:
+    """
+    Fill in missing octets of class A/B/C style cidr:
+     - a.b.c -> a.b.c.0/24, a.b -> a.b.0.0/16 and a -> a.0.0.0/8
+    Result is not checked.
+    """
     if cidr.endswith('.'):
         cidr = cidr[0:-1]
 
@@ -31,12 +45,7 @@ def clean_cidr(cidr: str) -> str | None:
 
     elif num_dots == 0:
         cidr += '.0.0.0/8'
-
-    if is_valid_cidr(cidr):
-        cidr = fix_cidr_host_bits(cidr)
-        return cidr
-
-    return None
+    return cidr
 
 
 def clean_cidrs(cidrs: list[str]) -> list[str]:
@@ -6,11 +6,26 @@ NB ipaddress.collapse_addresses is known to trigger type hint errors.
    Check no erorrs other than collapse_addresses() then add the ignore.
 """
 # mypy:  disable-error-code=type-var
+from typing import (Sequence)
 import ipaddress
 
-from .cidr_types import (IPvxNetwork)
+from .cidr_types import (IPvxNetwork, CidrLike)
 from ._cidr_nets import (cidrs_to_nets, nets_to_cidrs)
-from ._cidr_split_type import cidrs_split_type
+from ._cidr_classify import classify_cidrs
+from ._cidr_intervals import (merge_intervals, cidrs_to_merged_intervals)
+from ._cidr_intervals import (nets_to_intervals, intervals_to_nets)
+from ._cidr_intervals import (intervals_to_cidrs)
+from ._compact_parallel import compact_cidrs_parallel
+
+# 'ipaddress' uses ipaddress.collapse_addresses().
+# 'interval' merges sorted integer intervals then emits minimal cidr cover.
+COMPACT_ENGINES = ('ipaddress', 'interval')
+
+
+def _check_engine(engine: str):
+    """ raise ValueError if unknown compact engine """
+    if engine not in COMPACT_ENGINES:
+        raise ValueError(f'Unknown compact engine {engine!r} - use one of {COMPACT_ENGINES}')
 
 
 def cidr_list_compact(cidrs: list[str],
@@ -37,7 +52,8 @@ def cidr_list_compact(cidrs: list[str],
     return compact_cidrs_to_nets(cidrs)
 
 
-def compact_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
+def compact_nets(nets: list[IPvxNetwork], engine: str = 'ipaddress'
+                 ) -> list[IPvxNetwork]:
     """
     Compact list of networks and return netorks
 
@@ -45,13 +61,21 @@ def compact_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
         cidrs (list(IPvxNetwork):
             list of networks
 
+        engine (str):
+            'ipaddress' (default) or 'interval'. Both give the same result,
+            'interval' is much quicker on large lists.
+
     Returns:
         list[IPvxNetwork]:
             list of compacted IPvxNetworks
     """
+    _check_engine(engine)
     if not nets:
         return []
 
+    if engine == 'interval':
+        return _compact_nets_interval(nets)
+
     try:
         nets_compact = list(ipaddress.collapse_addresses(nets))
         return nets_compact
@@ -59,7 +83,26 @@ def compact_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
         raise TypeError('**Error: Bad IPv4/IPv6 net or mixed types') from exc
 
 
-def compact_cidrs_to_nets(cidrs: list[str]) -> list[IPvxNetwork]:
+def _compact_nets_interval(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
+    """
+    Interval engine for compact_nets().
+    Like collapse_addresses() all nets must be of same type.
+    """
+    try:
+        (ivs4, ivs6) = nets_to_intervals(nets)
+    except AttributeError as exc:
+        raise TypeError('**Error: Bad IPv4/IPv6 net or mixed types') from exc
+
+    if ivs4 and ivs6:
+        raise TypeError('**Error: Bad IPv4/IPv6 net or mixed types')
+
+    if ivs4:
+        return intervals_to_nets(merge_intervals(ivs4), 4)
+    return intervals_to_nets(merge_intervals(ivs6), 6)
+
+
+def compact_cidrs_to_nets(cidrs: list[str], engine: str = 'ipaddress'
+                          ) -> list[IPvxNetwork]:
     """
     Compact list of cidr strings and return as list of netorks
 
@@ -67,52 +110,84 @@ def compact_cidrs_to_nets(cidrs: list[str]) -> list[IPvxNetwork]:
         cidrs (list(str):
         list of cidr strings
 
+        engine (str):
+        'ipaddress' (default) or 'interval' - see compact_nets().
+
     Returns:
         list[IPvxNetwork]:
         list of IPvxNetworks
     """
+    _check_engine(engine)
     if cidrs is None or len(cidrs) < 1:
         # raise ValueError('Missing input: list of cidrs ')
         return []
 
+    if engine == 'interval':
+        (ivs4, ivs6, oth) = cidrs_to_merged_intervals(cidrs)
+        if oth:
+            raise ValueError(f'Bad cidr input invalid: {oth[0]}')
+        if ivs4 and ivs6:
+            raise TypeError('**Error: Bad IPv4/IPv6 net or mixed types')
+        if ivs4:
+            return intervals_to_nets(ivs4, 4)
+        return intervals_to_nets(ivs6, 6)
+
     nets = cidrs_to_nets(cidrs, strict=False)
     nets = compact_nets(nets)
     return nets
 
 
-def compact_cidrs(cidrs: list[str]) -> list[str]:
+def compact_cidrs(cidrs: Sequence[CidrLike], engine: str = 'ipaddress', workers: int = 1
+                  ) -> list[str]:
     """
     Compact list of cidrs to smallest list possible.
     Any bad cidr will raise ValueError
 
     Args:
-        cidrs (list[str]):
-            list of cidr strings to compact.
+        cidrs (Sequence[CidrLike]):
+            list of cidrs to compact - strings, IPvxNetwork or IPvxAddress.
+
+        engine (str):
+            'ipaddress' (default) or 'interval'. Both give the same result.
+            'interval' parses strings straight to integers and merges
+            sorted intervals, so no ipaddress objects are made.
+            With numpy available, ipv4 parse and merge are vectorized.
+
+        workers (int):
+            If more than 1, cidrs are sharded by address family and
+            high order bits and shards are compacted in a pool of
+            this many processes (each using the 'interval' engine).
+            Same result.
 
     Returns:
         list[str]:
             Compact list of cidr strings
     """
+    _check_engine(engine)
     cidrs_compact: list[str] = []
     if not cidrs:
         return cidrs_compact
 
-    (ip4, ip6, oth) = cidrs_split_type(cidrs)
+    if workers > 1:
+        return compact_cidrs_parallel(cidrs, workers)
 
-    # if oth:
-    #     raise ValueError('Bad cidr input invalid')
+    if engine == 'interval':
+        (ivs4, ivs6, oth) = cidrs_to_merged_intervals(cidrs)
+        if oth:
+            raise ValueError(f'Bad cidr input invalid: {oth[0]}')
+        cidrs_compact = intervals_to_cidrs(ivs4, 4)
+        cidrs_compact += intervals_to_cidrs(ivs6, 6)
+        return cidrs_compact
+
+    # parse once - keep the networks for compacting
+    (ip4, ip6, oth) = classify_cidrs(cidrs)
+    if oth:
+        raise ValueError(f'Bad cidr input invalid: {oth[0]}')
 
     if ip4:
-        nets = compact_cidrs_to_nets(ip4)
-        cidrs_compact += nets_to_cidrs(nets)
+        cidrs_compact += nets_to_cidrs(compact_nets(ip4))     # type: ignore[arg-type]
 
     if ip6:
-        nets = compact_cidrs_to_nets(ip6)
-        cidrs_compact += nets_to_cidrs(nets)
-
-    if oth:
-        # could have host bits set.
-        nets = compact_cidrs_to_nets(oth)
-        cidrs_compact += nets_to_cidrs(nets)
+        cidrs_compact += nets_to_cidrs(compact_nets(ip6))     # type: ignore[arg-type]
 
     return cidrs_compact
@@ -0,0 +1,520 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Integer interval tools.
+
+An interval is a tuple (start, end) of integer addresses, inclusive,
+and all intervals in a list are of the same IP version.
+A list is "merged" when it is sorted, non overlapping and non adjacent.
+
+These are the building blocks for doing network set operations
+on plain integers instead of ipaddress objects.
+"""
+from typing import (Any, Iterable, Iterator, Sequence)
+from ipaddress import (IPv4Network, IPv6Network, IPv6Address)
+import heapq
+
+from py_cidr._utils import (have_numpy, require_numpy, NUMPY_MIN_ITEMS)
+
+from .cidr_types import (IPvxNetwork)
+from ._cidr_parse import parse_cidr
+from ._cidr_classify import string_to_net
+from ._cidr_nets import parse_ip4_array
+
+type Interval = tuple[int, int]
+
+
+def merge_intervals(intervals: Iterable[Interval], is_sorted: bool = False
+                    ) -> list[Interval]:
+    """
+    Merge overlapping and adjacent intervals.
+
+    Args:
+        intervals (Iterable[Interval]):
+            (start, end) intervals in any order.
+
+        is_sorted (bool):
+            Set True if intervals are already sorted by start
+            to skip the sort.
+
+    Returns:
+        list[Interval]:
+            Merged list of intervals.
+    """
+    if not is_sorted:
+        intervals = sorted(intervals)
+    return list(iter_merge_sorted(intervals))
+
+
+def iter_merge_sorted(intervals: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Merge overlapping and adjacent intervals already sorted by start.
+
+    Streams: only the current interval is held, so intervals may
+    come from a generator of any length (e.g. a k-way merge of files).
+
+    Args:
+        intervals (Iterable[Interval]):
+            (start, end) intervals sorted by start.
+
+    Returns:
+        Iterator[Interval]:
+            Merged intervals.
+    """
+    cur_start = -1
+    cur_end = -2
+    for (start, end) in intervals:
+        if start <= cur_end + 1:
+            if end > cur_end:
+                cur_end = end
+            continue
+
+        if cur_start >= 0:
+            yield (cur_start, cur_end)
+        cur_start = start
+        cur_end = end
+
+    if cur_start >= 0:
+        yield (cur_start, cur_end)
+
+
+def subtract_intervals(ivs_a: list[Interval], ivs_b: list[Interval]
+                       ) -> list[Interval]:
+    """
+    Remove every address in ivs_b from ivs_a.
+
+    Single merge style sweep over both lists.
+
+    Args:
+        ivs_a (list[Interval]):
+            Merged intervals to remove from.
+
+        ivs_b (list[Interval]):
+            Merged intervals to be removed.
+
+    Returns:
+        list[Interval]:
+            Merged intervals "ivs_a - ivs_b".
+    """
+    if not ivs_b:
+        return list(ivs_a)
+
+    result: list[Interval] = []
+    num_b = len(ivs_b)
+    jdx = 0
+    for (start, end) in ivs_a:
+        # skip b's that end before this one - they end before later ones too
+        while jdx < num_b and ivs_b[jdx][1] < start:
+            jdx += 1
+
+        cur = start
+        kdx = jdx
+        while kdx < num_b and ivs_b[kdx][0] <= end:
+            (b_start, b_end) = ivs_b[kdx]
+            if b_start > cur:
+                result.append((cur, b_start - 1))
+            if b_end + 1 > cur:
+                cur = b_end + 1
+            if b_end >= end:
+                break
+            kdx += 1
+
+        if cur <= end:
+            result.append((cur, end))
+    return result
+
+
+def intersect_intervals(ivs_a: list[Interval], ivs_b: list[Interval]
+                        ) -> list[Interval]:
+    """
+    Addresses in both ivs_a and ivs_b.
+
+    Single merge style sweep over both lists.
+
+    Args:
+        ivs_a (list[Interval]):
+            Merged intervals.
+
+        ivs_b (list[Interval]):
+            Merged intervals.
+
+    Returns:
+        list[Interval]:
+            Merged intervals "ivs_a & ivs_b".
+    """
+    result: list[Interval] = []
+    (idx, jdx) = (0, 0)
+    (num_a, num_b) = (len(ivs_a), len(ivs_b))
+    while idx < num_a and jdx < num_b:
+        (a_start, a_end) = ivs_a[idx]
+        (b_start, b_end) = ivs_b[jdx]
+        start = max(a_start, b_start)
+        end = min(a_end, b_end)
+        if start <= end:
+            result.append((start, end))
+
+        # drop whichever ends first - it can't meet anything else
+        if a_end < b_end:
+            idx += 1
+        else:
+            jdx += 1
+    return result
+
+
+def union_intervals(ivs_a: list[Interval], ivs_b: list[Interval]
+                    ) -> list[Interval]:
+    """
+    Addresses in either ivs_a or ivs_b.
+
+    Args:
+        ivs_a (list[Interval]):
+            Merged intervals.
+
+        ivs_b (list[Interval]):
+            Merged intervals.
+
+    Returns:
+        list[Interval]:
+            Merged intervals "ivs_a | ivs_b".
+    """
+    return list(iter_merge_sorted(heapq.merge(ivs_a, ivs_b)))
+
+
+def symmetric_difference_intervals(ivs_a: list[Interval], ivs_b: list[Interval]
+                                   ) -> list[Interval]:
+    """
+    Addresses in exactly one of ivs_a and ivs_b.
+
+    Args:
+        ivs_a (list[Interval]):
+            Merged intervals.
+
+        ivs_b (list[Interval]):
+            Merged intervals.
+
+    Returns:
+        list[Interval]:
+            Merged intervals "ivs_a ^ ivs_b".
+    """
+    # pylint: disable=arguments-out-of-order
+    return union_intervals(subtract_intervals(ivs_a, ivs_b),
+                           subtract_intervals(ivs_b, ivs_a))
+
+
+def interval_to_blocks(start: int, end: int, max_prefixlen: int
+                       ) -> list[tuple[int, int]]:
+    """
+    Split one interval into the minimal list of cidr blocks.
+
+    Uses bit arithmetic: each block is as large as both the lowest
+    set bit of start (alignment) and the remaining length allow.
+
+    Args:
+        start (int):
+            First address.
+
+        end (int):
+            Last address (inclusive).
+
+        max_prefixlen (int):
+            32 for ipv4 and 128 for ipv6.
+
+    Returns:
+        list[tuple[int, int]]:
+            list of (network_int, prefixlen) in address order.
+    """
+    # common case: interval is exactly one aligned block
+    size = end - start + 1
+    if size > 0 and not size & (size - 1) and not start & (size - 1):
+        return [(start, max_prefixlen + 1 - size.bit_length())]
+
+    blocks: list[tuple[int, int]] = []
+    while start <= end:
+        if start:
+            host_bits = (start & -start).bit_length() - 1
+        else:
+            host_bits = max_prefixlen
+        span_bits = (end - start + 1).bit_length() - 1
+        if span_bits < host_bits:
+            host_bits = span_bits
+
+        blocks.append((start, max_prefixlen - host_bits))
+        start += 1 << host_bits
+    return blocks
+
+
+def intervals_to_blocks(intervals: Iterable[Interval], max_prefixlen: int
+                        ) -> list[tuple[int, int]]:
+    """
+    Convert list of intervals to list of cidr blocks.
+
+    Args:
+        intervals (Iterable[Interval]):
+            Intervals to convert. If merged, the result is the minimal
+            list of cidr blocks covering them.
+
+        max_prefixlen (int):
+            32 for ipv4 and 128 for ipv6.
+
+    Returns:
+        list[tuple[int, int]]:
+            list of (network_int, prefixlen).
+    """
+    blocks: list[tuple[int, int]] = []
+    for (start, end) in intervals:
+        blocks += interval_to_blocks(start, end, max_prefixlen)
+    return blocks
+
+
+def block_to_cidr(network_int: int, prefixlen: int, version: int) -> str:
+    """
+    Format cidr block as string.
+
+    Same string as str(IPvxNetwork) would give.
+    """
+    if version == 4:
+        num = network_int
+        return f'{num >> 24}.{num >> 16 & 255}.{num >> 8 & 255}.{num & 255}/{prefixlen}'
+    return f'{IPv6Address(network_int)}/{prefixlen}'
+
+
+def intervals_to_cidrs(intervals: Iterable[Interval], version: int) -> list[str]:
+    """
+    Convert merged intervals to the minimal list of cidr strings.
+
+    Args:
+        intervals (Iterable[Interval]):
+            Merged intervals all of the same IP version.
+
+        version (int):
+            4 or 6
+
+    Returns:
+        list[str]:
+            cidr strings in address order.
+    """
+    max_prefixlen = 32 if version == 4 else 128
+    return [block_to_cidr(num, prefixlen, version)
+            for (num, prefixlen) in intervals_to_blocks(intervals, max_prefixlen)]
+
+
+def intervals_to_nets(intervals: Iterable[Interval], version: int
+                      ) -> list[IPvxNetwork]:
+    """
+    Convert merged intervals to the minimal list of networks.
+
+    Args:
+        intervals (Iterable[Interval]):
+            Merged intervals all of the same IP version.
+
+        version (int):
+            4 or 6
+
+    Returns:
+        list[IPvxNetwork]:
+            IPv4Network or IPv6Network in address order.
+    """
+    if version == 4:
+        return [IPv4Network(block) for block in intervals_to_blocks(intervals, 32)]
+    return [IPv6Network(block) for block in intervals_to_blocks(intervals, 128)]
+
+
+def cidrs_to_intervals(cidrs: Iterable[Any], strict: bool = False
+                       ) -> tuple[list[Interval], list[Interval], list[Any]]:
+    """
+    Convert cidr strings to intervals with one parse per cidr.
+
+    Strings are parsed straight to integers (no ipaddress objects).
+
+    Args:
+        cidrs (Iterable[Any]):
+            cidr strings (or anything ipaddress.ip_network() accepts).
+
+        strict (bool):
+            If true, cidr with host bits set is invalid. Defaults to false.
+
+    Returns:
+        tuple[list[Interval], list[Interval], list[Any]]:
+            (ip4_intervals, ip6_intervals, invalid).
+            Intervals are in input order and not merged.
+            invalid holds those input cidrs that could not be parsed.
+    """
+    ivs4: list[Interval] = []
+    ivs6: list[Interval] = []
+    invalid: list[Any] = []
+
+    for cidr in cidrs:
+        result = cidr_to_interval(cidr, strict)
+        if result is None:
+            invalid.append(cidr)
+        elif result[0] == 4:
+            ivs4.append(result[1])
+        else:
+            ivs6.append(result[1])
+
+    return (ivs4, ivs6, invalid)
+
+
+def cidr_to_interval(cidr: Any, strict: bool = False) -> tuple[int, Interval] | None:
+    """
+    Convert one cidr to an interval.
+
+    Args:
+        cidr (Any):
+            cidr string (or anything ipaddress.ip_network() accepts).
+
+        strict (bool):
+            If true, cidr with host bits set is invalid. Defaults to false.
+
+    Returns:
+        tuple[int, Interval] | None:
+            (version, (start, end)) or None if cidr is invalid.
+    """
+    if isinstance(cidr, str):
+        parsed = parse_cidr(cidr)
+        if parsed is None:
+            return None
+        (version, num, prefixlen) = parsed
+    else:
+        try:
+            net = string_to_net(cidr, strict=strict)
+        except (ValueError, TypeError):
+            return None
+        (version, num, prefixlen) = (net.version, int(net.network_address), net.prefixlen)
+
+    host_bits = (32 if version == 4 else 128) - prefixlen
+    start = num >> host_bits << host_bits
+    if start != num and strict:
+        return None
+    return (version, (start, start + (1 << host_bits) - 1))
+
+
+def nets_to_intervals(nets: Iterable[IPvxNetwork]
+                      ) -> tuple[list[Interval], list[Interval]]:
+    """
+    Convert networks to intervals.
+
+    Args:
+        nets (Iterable[IPvxNetwork]):
+            IPv4Network and/or IPv6Network.
+
+    Returns:
+        tuple[list[Interval], list[Interval]]:
+            (ip4_intervals, ip6_intervals) in input order and not merged.
+    """
+    ivs4: list[Interval] = []
+    ivs6: list[Interval] = []
+    for net in nets:
+        start = int(net.network_address)
+        end = start + net.num_addresses - 1
+        if net.version == 4:
+            ivs4.append((start, end))
+        else:
+            ivs6.append((start, end))
+    return (ivs4, ivs6)
+
+
+def merge_ip4_arrays(addrs: Any, prefixlens: Any) -> list[Interval]:
+    """
+    Merge ipv4 networks held in numpy arrays into intervals.
+
+    Sort and merge are vectorized: after sorting by start, a new interval
+    begins wherever start is past the running maximum end + 1.
+    Requires numpy.
+
+    Args:
+        addrs (np.ndarray):
+            Network addresses (host bits zero) as from parse_ip4_array().
+
+        prefixlens (np.ndarray):
+            Prefix lengths.
+
+    Returns:
+        list[Interval]:
+            Merged intervals.
+    """
+    np = require_numpy('merge_ip4_arrays')
+    num = len(addrs)
+    if num < 1:
+        return []
+
+    starts = np.asarray(addrs, dtype=np.int64)
+    ends = starts + (np.int64(1) << (32 - np.asarray(prefixlens, dtype=np.int64))) - 1
+
+    order = np.argsort(starts, kind='stable')
+    starts = starts[order]
+    ends = np.maximum.accumulate(ends[order])
+
+    is_first = np.empty(num, dtype=bool)
+    is_first[0] = True
+    is_first[1:] = starts[1:] > ends[:-1] + 1
+    firsts = np.flatnonzero(is_first)
+    lasts = np.append(firsts[1:] - 1, num - 1)
+
+    return list(zip(starts[firsts].tolist(), ends[lasts].tolist()))
+
+
+def parse_ip4_array_exact(cidrs: Sequence[Any]) -> tuple[Any, Any, Any]:
+    """
+    parse_ip4_array() safe for any input.
+
+    numpy strings drop trailing NUL and convert non strings, so
+    such rows are not parsed and are simply marked as not ipv4:
+    they are left for the exact (one at a time) parser.
+    Requires numpy.
+
+    Args:
+        cidrs (Sequence[Any]):
+            cidr strings (or anything else).
+
+    Returns:
+        tuple[addrs, prefixlens, not_ip4]:
+            As parse_ip4_array().
+    """
+    odd = [idx for (idx, cidr) in enumerate(cidrs)
+           if cidr.__class__ is not str or '\x00' in cidr]
+    to_parse = cidrs
+    if odd:
+        to_parse = list(cidrs)
+        for idx in odd:
+            to_parse[idx] = ''
+
+    (addrs, prefixlens, not_ip4) = parse_ip4_array(to_parse)
+    not_ip4[odd] = True
+    return (addrs, prefixlens, not_ip4)
+
+
+def cidrs_to_merged_intervals(cidrs: Sequence[Any]
+                              ) -> tuple[list[Interval], list[Interval], list[Any]]:
+    """
+    Convert cidr strings to merged intervals (strict=False).
+
+    Same as merging the results of cidrs_to_intervals(), but when numpy
+    is available large lists have their ipv4 cidrs parsed and merged
+    with vectorized code. Only the rest (ipv6, invalid and anything
+    not a str, e.g. IPv4Network) are parsed one at a time.
+
+    Args:
+        cidrs (Sequence[Any]):
+            cidr strings.
+
+    Returns:
+        tuple[list[Interval], list[Interval], list[Any]]:
+            (ip4_intervals, ip6_intervals, invalid) with intervals merged
+            and invalid in input order.
+    """
+    if not have_numpy() or len(cidrs) < NUMPY_MIN_ITEMS:
+        (ivs4, ivs6, invalid) = cidrs_to_intervals(cidrs)
+        return (merge_intervals(ivs4), merge_intervals(ivs6), invalid)
+
+    np = require_numpy('cidrs_to_merged_intervals')
+
+    (addrs, prefixlens, not_ip4) = parse_ip4_array_exact(cidrs)
+    good = ~not_ip4
+    ivs4 = merge_ip4_arrays(addrs[good], prefixlens[good])
+
+    rest = [cidrs[idx] for idx in np.flatnonzero(not_ip4).tolist()]
+    (rest_ivs4, ivs6, invalid) = cidrs_to_intervals(rest)
+    if rest_ivs4:
+        ivs4 = merge_intervals(ivs4 + rest_ivs4)
+    return (ivs4, merge_intervals(ivs6), invalid)
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Streaming k-way merge of already sorted cidr streams.
+
+Each stream is parsed lazily to integer keys (version, network_int, prefixlen),
+checked to be in order and merged with heapq.merge. Only one key per
+stream is held at a time, so memory depends on the number of streams
+and not on their size. Output is deduplicated and optionally compacted
+as it streams past.
+"""
+from typing import (Iterable, Iterator, TextIO)
+from itertools import groupby
+import heapq
+
+from py_cidr._utils import write_lines
+
+from ._cidr_parse import (CidrKey, parse_cidr_key)
+from ._cidr_intervals import (iter_merge_sorted, interval_to_blocks, block_to_cidr)
+
+
+def _iter_keys(name: str, cidrs: Iterable[str]) -> Iterator[CidrKey]:
+    """
+    Sort keys of one stream - invalid cidrs are skipped.
+    Raises ValueError if stream is not in sort_cidrs() order.
+    """
+    prev: CidrKey | None = None
+    for cidr in cidrs:
+        key = parse_cidr_key(cidr)
+        if key is None:
+            continue
+
+        if prev is not None and key < prev:
+            raise ValueError(f'{name} is not sorted: {cidr} is out of order')
+        prev = key
+        yield key
+
+
+def _iter_dedupe(keys: Iterable[CidrKey]) -> Iterator[str]:
+    """
+    cidr strings of sorted keys, each just once.
+    """
+    prev: CidrKey | None = None
+    for key in keys:
+        if key != prev:
+            prev = key
+            (version, num, prefixlen) = key
+            yield block_to_cidr(num, prefixlen, version)
+
+
+def _iter_compact(keys: Iterable[CidrKey]) -> Iterator[str]:
+    """
+    Compacted cidr strings of sorted keys.
+    """
+    for (version, vkeys) in groupby(keys, key=lambda key: key[0]):
+        max_prefixlen = 32 if version == 4 else 128
+        intervals = ((num, num + (1 << (max_prefixlen - prefixlen)) - 1)
+                     for (_version, num, prefixlen) in vkeys)
+        for (start, end) in iter_merge_sorted(intervals):
+            for (network_int, prefixlen) in interval_to_blocks(start, end, max_prefixlen):
+                yield block_to_cidr(network_int, prefixlen, version)
+
+
+def merge_sorted_cidrs(sources: Iterable[tuple[str, Iterable[str]]], fob_out: TextIO,
+                       compact: bool = False) -> int:
+    """
+    Merge sorted streams of cidrs and write result to a file.
+
+    Args:
+        sources (Iterable[tuple[str, Iterable[str]]]):
+            (name, cidrs) for each stream. cidrs must be in sort_cidrs()
+            order (host bits are ignored). name is used in errors.
+
+        fob_out (TextIO):
+            Where cidrs are written, one per line.
+
+        compact (bool):
+            If true, result is compacted too.
+
+    Returns:
+        int:
+            Number of cidrs written.
+
+    Raises:
+        ValueError: if a stream is not sorted.
+    """
+    keys = heapq.merge(*[_iter_keys(name, cidrs) for (name, cidrs) in sources])
+    lines_out = _iter_compact(keys) if compact else _iter_dedupe(keys)
+    return write_lines(lines_out, fob_out)
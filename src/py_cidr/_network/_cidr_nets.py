@@ -3,10 +3,23 @@
 """
 Class support functions for networks
 """
+from typing import (Any, Iterable, Iterator, Sequence)
+from functools import partial
 import ipaddress
 from ipaddress import (IPv4Address, IPv6Address, IPv4Network, IPv6Network)
 
+from py_cidr._utils import require_numpy
+
 from .cidr_types import (IPAddress, IPvxNetwork)
+from .parse_cache import (ParseCache, choose_net_cache)
+from ._cidr_classify import string_to_net
+
+# longest usual ipv4 cidr string is 18 chars: 255.255.255.255/32
+_IP4_WIDTH = 19
+
+# longest usual ipv6 cidr string is 49 chars:
+#   ffff:ffff:ffff:ffff:ffff:ffff:255.255.255.255/128
+_IP6_WIDTH = 50
 
 
 def address_to_net(addr: IPAddress | IPvxNetwork, strict: bool = False
@@ -42,7 +55,8 @@ def address_to_net(addr: IPAddress | IPvxNetwork, strict: bool = False
     return None
 
 
-def cidr_to_net(cidr: str, strict: bool = False) -> IPvxNetwork | None:
+def cidr_to_net(cidr: str, strict: bool = False,
+                cache: ParseCache | bool | None = None) -> IPvxNetwork | None:
     """
     Convert cidr string to ipaddress network.
 
@@ -56,6 +70,11 @@ def cidr_to_net(cidr: str, strict: bool = False) -> IPvxNetwork | None:
             If true then cidr is considered invalid if host bits are set.
             Defaults to False. (see ipaddress docs).
 
+        cache (ParseCache | bool | None):
+            Parse cache to use. None (default) uses the global cache
+            if enabled, True always uses the global cache,
+            False never caches or pass a ParseCache instance to use.
+
     Returns:
         IPvxNetwork | None:
             The ipaddress network derived from cidr string
@@ -64,10 +83,16 @@ def cidr_to_net(cidr: str, strict: bool = False) -> IPvxNetwork | None:
     if not cidr:
         return None
 
-    return ipaddress.ip_network(cidr, strict=strict)
+    net_cache = choose_net_cache(cache)
+    if net_cache is None:
+        return ipaddress.ip_network(cidr, strict=strict)
 
+    return net_cache.lookup((cidr, strict),
+                            partial(ipaddress.ip_network, cidr, strict=strict))
 
-def cidrs_to_nets(cidrs: list[str], strict: bool = False) -> list[IPvxNetwork]:
+
+def cidrs_to_nets(cidrs: list[str], strict: bool = False,
+                  cache: ParseCache | bool | None = None) -> list[IPvxNetwork]:
     """
     Convert list of cidr strings to list of IPvxNetwork.
 
@@ -77,21 +102,107 @@ def cidrs_to_nets(cidrs: list[str], strict: bool = False) -> list[IPvxNetwork]:
     :param strict:
         If true, then any cidr with host bits is invalid. Defaults to false.
 
+    :param cache:
+        Parse cache to use - see cidr_to_net().
+
     :returns:
         list of IPvxNetworks.
     """
     if cidrs is None or len(cidrs) < 1:
         return []
 
+    net_cache = choose_net_cache(cache)
     try:
-        nets = [ipaddress.ip_network(cidr, strict=strict) for cidr in cidrs]
+        if net_cache is None:
+            nets = [ipaddress.ip_network(cidr, strict=strict) for cidr in cidrs]
+        else:
+            nets = [net_cache.lookup((cidr, strict),
+                                     partial(ipaddress.ip_network, cidr, strict=strict))
+                    for cidr in cidrs]
         return nets
 
     except ipaddress.AddressValueError as exc:
         raise ValueError from exc
 
 
-def nets_to_cidrs(nets: list[IPvxNetwork]) -> list[str]:
+def iter_cidrs_to_nets(cidrs: Iterable[Any], strict: bool = False,
+                       on_error: str = 'skip',
+                       errors: list[tuple[int, Any]] | None = None,
+                       cache: ParseCache | bool | None = None
+                       ) -> Iterator[IPvxNetwork]:
+    """
+    Lazily convert cidr strings to IPvxNetwork.
+
+    Unlike cidrs_to_nets() a bad cidr does not lose the rest of the batch.
+    Any iterable is fine including an open file, so large inputs are never
+    held in memory. Strings are stripped of surrounding whitespace
+    (e.g. newline) and empty ones are skipped - they are not errors.
+
+    Args:
+        cidrs (Iterable[Any]):
+            cidr strings (or anything ipaddress.ip_network() accepts).
+
+        strict (bool):
+            If true, cidr with host bits set is invalid. Defaults to false.
+
+        on_error (str):
+            What to do with an invalid cidr:
+             - 'skip': drop it (default).
+             - 'collect': drop it and append (index, cidr) to errors.
+             - 'raise': raise ValueError naming its index.
+
+        errors (list[tuple[int, Any]] | None):
+            List to append (index, cidr) for each invalid cidr when
+            on_error is 'collect'. Index counts every item in cidrs,
+            including the skipped empty ones.
+
+        cache (ParseCache | bool | None):
+            Parse cache to use - see cidr_to_net().
+
+    Returns:
+        Iterator[IPvxNetwork]:
+            Generator of networks in input order.
+    """
+    if on_error not in ('skip', 'collect', 'raise'):
+        raise ValueError(f'iter_cidrs_to_nets: unknown on_error {on_error!r}')
+
+    if on_error == 'collect' and errors is None:
+        raise ValueError('iter_cidrs_to_nets: on_error "collect" requires errors list')
+
+    return _iter_cidrs_to_nets(cidrs, strict, on_error, errors, choose_net_cache(cache))
+
+
+def _iter_cidrs_to_nets(cidrs: Iterable[Any], strict: bool, on_error: str,
+                        errors: list[tuple[int, Any]] | None,
+                        net_cache: ParseCache | None
+                        ) -> Iterator[IPvxNetwork]:
+    """
+    Generator for iter_cidrs_to_nets() - arguments are already checked.
+    """
+    for (idx, cidr) in enumerate(cidrs):
+        if isinstance(cidr, str):
+            cidr = cidr.strip()
+            if not cidr:
+                continue
+
+        try:
+            if net_cache is None:
+                net = string_to_net(cidr, strict=strict)
+            else:
+                net = net_cache.lookup((cidr, strict),
+                                       partial(string_to_net, cidr, strict=strict))
+
+        except (ValueError, TypeError) as exc:
+            if on_error == 'raise':
+                raise ValueError(f'Bad cidr at index {idx}: {cidr!r}') from exc
+            if errors is not None:
+                errors.append((idx, cidr))
+            continue
+
+        yield net
+
+
+def nets_to_cidrs(nets: Sequence[IPvxNetwork]) -> list[str]:
     """
     Nets to Strings
         Convert list of ipaddress networks to list of cidr strings.
@@ -127,3 +238,500 @@ def net_to_cidr(net: IPvxNetwork) -> str:
 
     cidr = str(net)
     return cidr
+
+
+def _str_codes(strs: Sequence[str], width: int) -> Any:
+    """
+    Strings as 2d array of character codes for the vectorized parsers.
+
+    Strings are truncated to width characters, so any string that
+    does not fit will have non zero last column. Columns past the
+    longest string are dropped.
+    """
+    np = require_numpy('_str_codes')
+
+    arr = np.asarray(strs, dtype=f'U{width}')
+    used = min(int(np.char.str_len(arr).max()) + 1, width)
+    codes = arr.view(np.uint32).reshape(len(arr), width)
+    return codes[:, :used]
+
+
+def _parse_ip4_codes(codes: Any) -> tuple[Any, Any, Any, Any]:
+    """
+    Vectorized parse of ipv4 cidrs given as a 2d array of character codes.
+
+    Each row is one cidr, one character code per column and zero padded
+    on the right. Follows ipaddress rules (e.g. no leading zeros in octets).
+    Rows using netmask notation (a.b.c.d/255.255.0.0) or too long to
+    fit are not parsed here but flagged for fallback.
+
+    Works one column at a time over all rows, keeping a running value
+    of the current octet which is added to the address at each '.'
+    and at the end of the address.
+
+    Args:
+        codes (np.ndarray):
+            Integer array shape (num_rows, width).
+
+    Returns:
+        tuple[addrs, prefixlens, invalid, fallback]:
+            addrs (uint32) with host bits zeroed, prefixlens (uint8),
+            invalid (bool) and fallback (bool) arrays.
+            Row values are zero when invalid or fallback.
+    """
+    # pylint: disable=too-many-locals
+    np = require_numpy('_parse_ip4_codes')
+
+    (num, width) = codes.shape
+    addrs = np.zeros(num, dtype=np.int64)
+    num_octets = np.zeros(num, dtype=np.int32)
+    octet = np.zeros(num, dtype=np.int32)
+    olen = np.zeros(num, dtype=np.int32)
+    in_pfx = np.zeros(num, dtype=bool)
+    pfx = np.zeros(num, dtype=np.int32)
+    pfx_len = np.zeros(num, dtype=np.int32)
+    ended = np.zeros(num, dtype=bool)
+    hard_bad = np.zeros(num, dtype=bool)
+    bad = np.zeros(num, dtype=bool)
+    fallback = codes[:, width - 1] != 0
+
+    for code in np.ascontiguousarray(codes.T, dtype=np.int32):
+        is_end = code == 0
+        is_digit = (code >= 48) & (code <= 57)
+        is_dot = code == 46
+        is_slash = code == 47
+        digit = code - 48
+
+        # invalid regardless of fallback: nothing may follow the end,
+        # no junk characters and at most one '/'
+        hard_bad |= ended & ~is_end
+        hard_bad |= ~(is_end | is_digit | is_dot | is_slash)
+        hard_bad |= is_slash & in_pfx
+        first_end = is_end & ~ended
+        ended |= is_end
+
+        # address octets - no leading zeros
+        addr = ~in_pfx
+        addr_digit = is_digit & addr
+        bad |= addr_digit & (olen == 1) & (octet == 0)
+        octet = np.where(addr_digit, np.minimum(octet * 10 + digit, 999), octet)
+        olen += addr_digit
+
+        octet_end = (is_dot | is_slash | first_end) & addr
+        bad |= octet_end & ((olen < 1) | (olen > 3) | (octet > 255))
+        addrs = np.where(octet_end, ((addrs << 8) | octet) & 0xffffffff, addrs)
+        num_octets += octet_end
+        octet[octet_end] = 0
+        olen[octet_end] = 0
+
+        # prefix - netmask style (has '.') left for fallback
+        fallback |= is_dot & in_pfx
+        in_pfx |= is_slash
+        pfx_digit = is_digit & in_pfx
+        pfx = np.where(pfx_digit, np.minimum(pfx * 10 + digit, 999), pfx)
+        pfx_len += pfx_digit
+
+    bad |= num_octets != 4
+    bad |= in_pfx & ((pfx_len < 1) | (pfx > 32))
+
+    fallback &= ~hard_bad
+    bad = hard_bad | (bad & ~fallback)
+    skip = bad | fallback
+
+    prefixlens = np.where(in_pfx, pfx, 32)
+    prefixlens[skip] = 0
+
+    masks = (0xffffffff << (32 - prefixlens.astype(np.int64))) & 0xffffffff
+    addrs = np.where(skip, 0, addrs & masks)
+
+    return (addrs.astype(np.uint32), prefixlens.astype(np.uint8), bad, fallback)
+
+
+def parse_ip4_array(cidrs: Sequence[str]) -> tuple[Any, Any, Any]:
+    """
+    Vectorized parse of list of ipv4 cidr strings into numpy arrays.
+
+    No IPv4Network objects are created (except for rare netmask
+    style cidrs). Host bits are zeroed the same as strict=False.
+    As with any numpy string, trailing NUL characters are ignored.
+    Requires numpy.
+
+    Args:
+        cidrs (Sequence[str]):
+            list (or numpy array) of ipv4 cidr strings.
+
+    Returns:
+        tuple[addrs, prefixlens, invalid]:
+            addrs (np.ndarray[uint32]):
+                network address for each cidr.
+
+            prefixlens (np.ndarray[uint8]):
+                prefix length of each cidr.
+
+            invalid (np.ndarray[bool]):
+                True where cidr is not a valid ipv4 address or cidr.
+                addrs and prefixlens are zero for these.
+    """
+    np = require_numpy('parse_ip4_array')
+
+    num = len(cidrs)
+    if num < 1:
+        return (np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.uint8),
+                np.zeros(0, dtype=bool))
+
+    codes = _str_codes(cidrs, _IP4_WIDTH)
+    (addrs, prefixlens, invalid, fallback) = _parse_ip4_codes(codes)
+
+    for idx in np.flatnonzero(fallback):
+        try:
+            net = IPv4Network(cidrs[idx], strict=False)
+            addrs[idx] = int(net.network_address)
+            prefixlens[idx] = net.prefixlen
+        except (ValueError, TypeError):
+            invalid[idx] = True
+
+    return (addrs, prefixlens, invalid)
+
+
+def ip4_array_to_cidrs(addrs: Any, prefixlens: Any) -> list[str]:
+    """
+    Convert arrays of ipv4 network addresses and prefixes to cidr strings.
+
+    Inverse of parse_ip4_array().
+
+    Args:
+        addrs (np.ndarray[uint32]):
+            network addresses.
+
+        prefixlens (np.ndarray[uint8]):
+            prefix lengths.
+
+    Returns:
+        list[str]:
+            list of cidr strings.
+    """
+    np = require_numpy('ip4_array_to_cidrs')
+
+    nums = np.asarray(addrs, dtype=np.int64)
+    octets = np.stack([nums >> 24, nums >> 16 & 255, nums >> 8 & 255, nums & 255], axis=1)
+    rows = zip(octets.tolist(), np.asarray(prefixlens).tolist())
+    return [f'{o[0]}.{o[1]}.{o[2]}.{o[3]}/{pfx}' for (o, pfx) in rows]
+
+
+def _parse_ip6_codes(codes: Any) -> tuple[Any, Any, Any, Any, Any]:
+    """
+    Vectorized parse of ipv6 cidrs given as a 2d array of character codes.
+
+    Same as _parse_ip4_codes() but for ipv6. Supports '::' compression and
+    embedded ipv4 (e.g. ::ffff:10.1.2.3) following the ipaddress rules.
+    Rows with a scope id (fe80::1%eth0) or too long to fit are not
+    parsed here but flagged for fallback.
+
+    Running values of the current hextet (and of the current octet in
+    case the part is embedded ipv4) are saved at each ':' and at the
+    end of the address. The '::' expansion is then done on the saved parts.
+
+    Args:
+        codes (np.ndarray):
+            Integer array shape (num_rows, width).
+
+    Returns:
+        tuple[hi, lo, prefixlens, invalid, fallback]:
+            hi, lo (uint64) are upper and lower 64 bits of network address
+            with host bits zeroed, prefixlens (uint8), invalid (bool) and
+            fallback (bool). Row values are zero when invalid or fallback.
+    """
+    # pylint: disable=too-many-locals,too-many-statements
+    np = require_numpy('_parse_ip6_codes')
+
+    (num, width) = codes.shape
+    rows_all = np.arange(num)
+
+    # colon separated parts (at most 9 are valid, 10th catches the rest)
+    parts = np.zeros((num, 10), dtype=np.int64)
+    part_lens = np.zeros((num, 10), dtype=np.int32)
+    field = np.zeros(num, dtype=np.int32)
+    hextet = np.zeros(num, dtype=np.int64)
+    hlen = np.zeros(num, dtype=np.int32)
+
+    # current part as embedded ipv4
+    ip4 = np.zeros(num, dtype=np.int64)
+    octet = np.zeros(num, dtype=np.int32)
+    olen = np.zeros(num, dtype=np.int32)
+    dots = np.zeros(num, dtype=np.int32)
+    ip4_bad = np.zeros(num, dtype=bool)
+
+    in_pfx = np.zeros(num, dtype=bool)
+    pfx = np.zeros(num, dtype=np.int32)
+    pfx_len = np.zeros(num, dtype=np.int32)
+
+    ended = np.zeros(num, dtype=bool)
+    hard_bad = np.zeros(num, dtype=bool)
+    has_scope = (codes == 37).any(axis=1)
+    fallback = (codes[:, width - 1] != 0) | has_scope
+
+    for code in np.ascontiguousarray(codes.T, dtype=np.int32):
+        is_end = code == 0
+        is_digit = (code >= 48) & (code <= 57)
+        is_lower = (code >= 97) & (code <= 102)
+        is_upper = (code >= 65) & (code <= 70)
+        is_alpha = is_lower | is_upper
+        is_hex = is_digit | is_alpha
+        is_colon = code == 58
+        is_dot = code == 46
+        is_slash = code == 47
+        value = code - np.where(is_digit, 48, np.where(is_lower, 87, 55))
+
+        hard_bad |= ended & ~is_end
+        hard_bad |= ~(is_end | is_hex | is_colon | is_dot | is_slash)
+        hard_bad |= is_slash & in_pfx
+        hard_bad |= in_pfx & ~(is_digit | is_end)
+        first_end = is_end & ~ended
+        ended |= is_end
+
+        addr = ~in_pfx
+
+        # hextet
+        addr_hex = is_hex & addr
+        hextet = np.where(addr_hex, ((hextet << 4) | value) & 0xfffff, hextet)
+        hlen += addr_hex
+
+        # octet of embedded ipv4
+        addr_digit = is_digit & addr
+        ip4_bad |= addr_digit & (olen == 1) & (octet == 0)
+        ip4_bad |= is_alpha & addr
+        octet = np.where(addr_digit, np.minimum(octet * 10 + value, 999), octet)
+        olen += addr_digit
+
+        addr_dot = is_dot & addr
+        part_end = (is_colon | is_slash | first_end) & addr
+        octet_end = addr_dot | (part_end & (dots > 0))
+        ip4_bad |= octet_end & ((olen < 1) | (olen > 3) | (octet > 255))
+        ip4 = np.where(octet_end, ((ip4 << 8) | octet) & 0xffffffff, ip4)
+        dots += addr_dot
+        octet[octet_end] = 0
+        olen[octet_end] = 0
+
+        # save part - only the last part may be ipv4
+        sel = np.flatnonzero(part_end)
+        fsel = np.minimum(field[sel], 9)
+        parts[sel, fsel] = hextet[sel]
+        part_lens[sel, fsel] = hlen[sel]
+
+        addr_colon = is_colon & addr
+        hard_bad |= addr_colon & (dots > 0)
+        field += addr_colon
+        hextet[addr_colon] = 0
+        hlen[addr_colon] = 0
+        ip4_bad[addr_colon] = False
+        octet[addr_colon] = 0
+        olen[addr_colon] = 0
+
+        in_pfx |= is_slash
+        pfx_digit = is_digit & in_pfx
+        pfx = np.where(pfx_digit, np.minimum(pfx * 10 + value, 999), pfx)
+        pfx_len += pfx_digit
+
+    hard_bad &= ~has_scope
+    fallback &= ~hard_bad
+
+    num_raw = field + 1
+    has_ip4 = dots > 0
+    num_parts = num_raw + has_ip4
+    bad = (num_raw < 3) | (num_parts > 9)
+    bad |= in_pfx & ((pfx_len < 1) | (pfx > 128))
+    bad |= has_ip4 & (ip4_bad | (dots != 3))
+
+    # expand embedded ipv4 (the last part) to 2 hextets
+    last = np.minimum(field, 9)
+    nxt = np.minimum(last + 1, 9)
+    parts[rows_all, last] = np.where(has_ip4, ip4 >> 16, parts[rows_all, last])
+    parts[rows_all, nxt] = np.where(has_ip4, ip4 & 0xffff, parts[rows_all, nxt])
+    part_lens[rows_all, last] = np.where(has_ip4, 1, part_lens[rows_all, last])
+    part_lens[rows_all, nxt] = np.where(has_ip4, 1, part_lens[rows_all, nxt])
+
+    bad |= (part_lens > 4).any(axis=1)
+
+    # '::' is the (one) empty interior part
+    idx = np.arange(10)
+    interior = (idx[None, :] >= 1) & (idx[None, :] <= (num_parts - 2)[:, None])
+    empty = part_lens == 0
+    empty_interior = empty & interior
+    num_skip = empty_interior.sum(axis=1)
+    bad |= num_skip > 1
+    has_skip = num_skip == 1
+    skip_idx = np.argmax(empty_interior, axis=1)
+
+    first_empty = empty[:, 0]
+    last_empty = empty[rows_all, np.minimum(num_parts - 1, 9)]
+
+    parts_hi = np.where(has_skip, skip_idx, num_parts)
+    parts_lo = np.where(has_skip, num_parts - skip_idx - 1, 0)
+
+    # leading/trailing ':' only allowed as part of '::'
+    bad |= has_skip & first_empty & (parts_hi != 1)
+    parts_hi = np.where(has_skip & first_empty, 0, parts_hi)
+    bad |= has_skip & last_empty & (parts_lo != 1)
+    parts_lo = np.where(has_skip & last_empty, 0, parts_lo)
+    bad |= has_skip & (parts_hi + parts_lo > 7)
+    bad |= ~has_skip & ((num_parts != 8) | first_empty | last_empty)
+
+    bad = hard_bad | (bad & ~fallback)
+    skip = bad | fallback
+
+    # assemble the 8 hextets
+    hextets = np.zeros((num, 8), dtype=np.uint64)
+    for grp in range(8):
+        src_lo = np.clip(num_parts - 8 + grp, 0, 9)
+        val = np.where(grp < parts_hi, parts[:, grp],
+                       np.where(grp >= 8 - parts_lo, parts[rows_all, src_lo], 0))
+        hextets[:, grp] = val.astype(np.uint64)
+
+    hi = (hextets[:, 0] << 48) | (hextets[:, 1] << 32) | (hextets[:, 2] << 16) | hextets[:, 3]
+    lo = (hextets[:, 4] << 48) | (hextets[:, 5] << 32) | (hextets[:, 6] << 16) | hextets[:, 7]
+
+    prefixlens = np.where(in_pfx, pfx, 128)
+    prefixlens[skip] = 0
+    (hi, lo) = _ip6_mask_host_bits(hi, lo, prefixlens)
+    hi[skip] = 0
+    lo[skip] = 0
+
+    return (hi, lo, prefixlens.astype(np.uint8), bad, fallback)
+
+
+def _ip6_mask_host_bits(hi: Any, lo: Any, prefixlens: Any) -> tuple[Any, Any]:
+    """
+    Zero the host bits of ipv6 hi/lo uint64 arrays.
+    """
+    np = require_numpy('_ip6_mask_host_bits')
+
+    ones = np.uint64(0xffffffffffffffff)
+    prefixlens = np.asarray(prefixlens, dtype=np.int64)
+    hi_bits = np.clip(64 - prefixlens, 0, 64)
+    lo_bits = np.clip(128 - prefixlens, 0, 64)
+
+    hi_mask = np.where(hi_bits >= 64, np.uint64(0),
+                       ones << np.minimum(hi_bits, 63).astype(np.uint64))
+    lo_mask = np.where(lo_bits >= 64, np.uint64(0),
+                       ones << np.minimum(lo_bits, 63).astype(np.uint64))
+    return (hi & hi_mask, lo & lo_mask)
+
+
+def parse_ip6_array(cidrs: Sequence[str]) -> tuple[Any, Any, Any, Any]:
+    """
+    Vectorized parse of list of ipv6 cidr strings into numpy arrays.
+
+    Each 128 bit address is returned as 2 uint64: hi and lo.
+    Supports '::' compression and embedded ipv4 (::ffff:a.b.c.d).
+    No IPv6Network objects are created (except for rare cidrs with
+    a scope id). Host bits are zeroed the same as strict=False.
+    As with any numpy string, trailing NUL characters are ignored.
+    Requires numpy.
+
+    Args:
+        cidrs (Sequence[str]):
+            list (or numpy array) of ipv6 cidr strings.
+
+    Returns:
+        tuple[hi, lo, prefixlens, invalid]:
+            hi (np.ndarray[uint64]):
+                upper 64 bits of network address for each cidr.
+
+            lo (np.ndarray[uint64]):
+                lower 64 bits of network address for each cidr.
+
+            prefixlens (np.ndarray[uint8]):
+                prefix length of each cidr.
+
+            invalid (np.ndarray[bool]):
+                True where cidr is not a valid ipv6 address or cidr.
+                hi, lo and prefixlens are zero for these.
+    """
+    np = require_numpy('parse_ip6_array')
+
+    num = len(cidrs)
+    if num < 1:
+        return (np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint64),
+                np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=bool))
+
+    codes = _str_codes(cidrs, _IP6_WIDTH)
+    (hi, lo, prefixlens, invalid, fallback) = _parse_ip6_codes(codes)
+
+    for idx in np.flatnonzero(fallback):
+        try:
+            net = IPv6Network(cidrs[idx], strict=False)
+            num_addr = int(net.network_address)
+            hi[idx] = num_addr >> 64
+            lo[idx] = num_addr & 0xffffffffffffffff
+            prefixlens[idx] = net.prefixlen
+        except (ValueError, TypeError):
+            invalid[idx] = True
+
+    return (hi, lo, prefixlens, invalid)
+
+
+def ip6_array_to_cidrs(hi: Any, lo: Any, prefixlens: Any) -> list[str]:
+    """
+    Convert arrays of ipv6 network addresses and prefixes to cidr strings.
+
+    Inverse of parse_ip6_array(). Strings are in the same canonical
+    (compressed) form as str(IPv6Network) gives, including the dotted
+    form for ipv4 mapped addresses (::ffff:a.b.c.d).
+    Requires numpy.
+
+    Args:
+        hi (np.ndarray[uint64]):
+            upper 64 bits of network addresses.
+
+        lo (np.ndarray[uint64]):
+            lower 64 bits of network addresses.
+
+        prefixlens (np.ndarray[uint8]):
+            prefix lengths.
+
+    Returns:
+        list[str]:
+            list of cidr strings.
+    """
+    # pylint: disable=too-many-locals
+    np = require_numpy('ip6_array_to_cidrs')
+
+    hi = np.asarray(hi, dtype=np.uint64)
+    lo = np.asarray(lo, dtype=np.uint64)
+    num = len(hi)
+
+    hextets = np.empty((num, 8), dtype=np.int64)
+    for grp in range(4):
+        shift = np.uint64(48 - 16 * grp)
+        hextets[:, grp] = ((hi >> shift) & np.uint64(0xffff)).astype(np.int64)
+        hextets[:, grp + 4] = ((lo >> shift) & np.uint64(0xffff)).astype(np.int64)
+
+    # longest run of zero hextets (first one if tied) - compressed to '::'
+    run = np.zeros(num, dtype=np.int64)
+    best_len = np.zeros(num, dtype=np.int64)
+    best_end = np.zeros(num, dtype=np.int64)
+    for grp in range(8):
+        run = np.where(hextets[:, grp] == 0, run + 1, 0)
+        longer = run > best_len
+        best_len = np.where(longer, run, best_len)
+        best_end = np.where(longer, grp + 1, best_end)
+    best_start = best_end - best_len
+
+    mapped = (hi == 0) & ((lo >> np.uint64(32)) == 0xffff)
+
+    cidrs: list[str] = []
+    rows = zip(hextets.tolist(), best_start.tolist(), best_len.tolist(),
+               mapped.tolist(), np.asarray(prefixlens).tolist())
+    for (hexs, start, length, is_mapped, pfx) in rows:
+        if is_mapped:
+            cidrs.append(f'::ffff:{hexs[6] >> 8}.{hexs[6] & 255}.'
+                         f'{hexs[7] >> 8}.{hexs[7] & 255}/{pfx}')
+            continue
+
+        if length > 1:
+            left = ':'.join([f'{h:x}' for h in hexs[:start]])
+            right = ':'.join([f'{h:x}' for h in hexs[start + length:]])
+            cidrs.append(f'{left}::{right}/{pfx}')
+        else:
+            cidrs.append(':'.join([f'{h:x}' for h in hexs]) + f'/{pfx}')
+    return cidrs
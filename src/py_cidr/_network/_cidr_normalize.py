@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Clean, fix host bits, dedupe, sort and compact in one pass.
+
+Each cidr is parsed once to an integer key (version, address_int, prefixlen).
+Every stage works on the keys and strings are only formatted at the end.
+"""
+from typing import (Any, Iterable, NamedTuple)
+import ipaddress
+
+from ._cidr_parse import (CidrKey, parse_cidr, network_key)
+from ._cidr_clean import complete_cidr
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (merge_intervals, intervals_to_cidrs, block_to_cidr)
+
+
+class NormalizeCounts(NamedTuple):
+    """
+    Per stage counts from normalize_cidrs().
+
+    input: number of cidrs given.
+    invalid: dropped as invalid, even after cleaning.
+    cleaned: repaired by cleaning (e.g. 'a.b.c' -> 'a.b.c.0/24').
+    host_bits_fixed: had host bits set which were cleared.
+    duplicates: dropped as duplicates.
+    compacted: prefixes saved by compaction.
+    output: number of cidrs returned.
+    """
+    input: int
+    invalid: int
+    cleaned: int
+    host_bits_fixed: int
+    duplicates: int
+    compacted: int
+    output: int
+
+
+def _parse(cidr: Any) -> tuple[int, int, int] | None:
+    """
+    (version, address_int, prefixlen) or None if invalid.
+    """
+    if isinstance(cidr, str):
+        return parse_cidr(cidr)
+
+    try:
+        net = ipaddress.ip_network(cidr, strict=False)
+    except (ValueError, TypeError):
+        return None
+    return (net.version, int(net.network_address), net.prefixlen)
+
+
+def normalize_cidrs(cidrs: Iterable[Any], fix_host_bits: bool = True,
+                    dedupe: bool = True, sort: bool = True, compact: bool = True
+                    ) -> tuple[list[str], NormalizeCounts]:
+    """
+    Clean, fix host bits, dedupe, sort and compact cidrs parsing each just once.
+
+    Args:
+        cidrs (Iterable[Any]):
+            cidr strings - may be mixed ipv4 and ipv6.
+            Invalid cidrs are cleaned if possible (as clean_cidr())
+            otherwise dropped.
+
+        fix_host_bits (bool):
+            Clear any host bits. Always done when compacting.
+
+        dedupe (bool):
+            Drop duplicates, keeping the first.
+
+        sort (bool):
+            Sort, ipv4 before ipv6.
+
+        compact (bool):
+            Compact to the minimal list - result is always sorted.
+
+    Returns:
+        tuple[list[str], NormalizeCounts]:
+            (cidrs, counts) with cidrs in standard form.
+    """
+    # pylint: disable=too-many-locals
+    keys: list[CidrKey] = []
+    num_input = 0
+    num_cleaned = 0
+    num_fixed = 0
+    clear_host_bits = fix_host_bits or compact
+    for cidr in cidrs:
+        num_input += 1
+        parsed = _parse(cidr)
+        if parsed is None and cidr and isinstance(cidr, str):
+            parsed = parse_cidr(complete_cidr(cidr))
+            if parsed is not None:
+                num_cleaned += 1
+        if parsed is None:
+            continue
+
+        if clear_host_bits:
+            key = network_key(parsed)
+            if key != parsed:
+                num_fixed += 1
+            parsed = key
+        keys.append(parsed)
+    num_valid = len(keys)
+
+    if dedupe:
+        keys = list(dict.fromkeys(keys))
+    num_unique = len(keys)
+
+    if compact:
+        ivs: dict[int, list[Interval]] = {4: [], 6: []}
+        for (version, num, prefixlen) in keys:
+            host_bits = (32 if version == 4 else 128) - prefixlen
+            ivs[version].append((num, num + (1 << host_bits) - 1))
+        result = (intervals_to_cidrs(merge_intervals(ivs[4]), 4)
+                  + intervals_to_cidrs(merge_intervals(ivs[6]), 6))
+    else:
+        if sort:
+            keys.sort()
+        result = [block_to_cidr(num, prefixlen, version) for (version, num, prefixlen) in keys]
+
+    counts = NormalizeCounts(input=num_input,
+                             invalid=num_input - num_valid,
+                             cleaned=num_cleaned,
+                             host_bits_fixed=num_fixed,
+                             duplicates=num_valid - num_unique,
+                             compacted=num_unique - len(result),
+                             output=len(result))
+    return (result, counts)
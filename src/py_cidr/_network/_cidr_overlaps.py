@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Overlap report for lists of cidrs.
+
+Two cidr blocks are either disjoint or one contains the other - they
+can never partially overlap. So sorting by (start, largest first) puts
+every block right after the blocks containing it, and a single sweep
+with a stack of the currently open blocks finds every duplicate and
+the nearest block containing each one.
+"""
+from typing import (Any, Iterable, NamedTuple)
+
+from ._cidr_intervals import (cidr_to_interval)
+
+
+class Overlaps(NamedTuple):
+    """
+    Result of find_overlaps() - all as indices into the input list.
+
+    duplicates: (idx, first_idx) where idx is the same network as the
+                earlier first_idx.
+    covered: (idx, parent_idx) where idx is inside the larger network
+             parent_idx - the smallest one if there are several.
+    invalid: idx of each invalid cidr.
+    """
+    duplicates: list[tuple[int, int]]
+    covered: list[tuple[int, int]]
+    invalid: list[int]
+
+
+def find_overlaps(cidrs: Iterable[Any]) -> Overlaps:
+    """
+    Find duplicate and covered cidrs.
+
+    Host bits are ignored, so '10.0.0.1/24' is a duplicate of '10.0.0.0/24'.
+    ipv4 and ipv6 never overlap. O(n log n).
+
+    Args:
+        cidrs (Iterable[Any]):
+            cidr strings (or IPvxNetwork).
+
+    Returns:
+        Overlaps:
+            (duplicates, covered, invalid) each sorted by idx.
+    """
+    # pylint: disable=too-many-locals
+    rows: list[tuple[int, int, int, int]] = []
+    invalid: list[int] = []
+    for (idx, cidr) in enumerate(cidrs):
+        result = cidr_to_interval(cidr)
+        if result is None:
+            invalid.append(idx)
+            continue
+        (version, (start, end)) = result
+        rows.append((version, start, -end, idx))
+
+    # containing (larger) blocks sort first, then equal blocks by idx
+    rows.sort()
+
+    duplicates: list[tuple[int, int]] = []
+    covered: list[tuple[int, int]] = []
+    stack: list[tuple[int, int, int]] = []     # open (start, end, idx)
+    cur_version = 0
+    for (version, start, neg_end, idx) in rows:
+        end = -neg_end
+        if version != cur_version:
+            cur_version = version
+            stack = []
+
+        while stack and stack[-1][1] < start:
+            stack.pop()
+
+        if stack:
+            (top_start, top_end, top_idx) = stack[-1]
+            if top_start == start and top_end == end:
+                duplicates.append((idx, top_idx))
+                continue
+            covered.append((idx, top_idx))
+        stack.append((start, end, idx))
+
+    duplicates.sort()
+    covered.sort()
+    return Overlaps(duplicates, covered, invalid)
@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Exception free parsing of cidr strings to integers.
+
+Follows the same string rules as IPv4Network / IPv6Network (strict=False):
+the same strings are accepted and rejected, including leading zero,
+netmask / hostmask and ipv6 scope id rules.
+Nothing is raised and no objects are created, so junk input is cheap.
+Strings with characters that cannot be in an address are
+rejected with a single set test before any splitting.
+"""
+import sys
+
+_DIGITS = frozenset('0123456789')
+_IP4_CHARS = frozenset('0123456789.')
+_IP6_CHARS = frozenset('0123456789abcdefABCDEF:.')
+
+# longest possible ipv6 address (without scope) is 45 chars
+_IP6_MAX_LEN = 45
+_IP4_ALL_ONES = 0xFFFFFFFF
+
+# (version, network_int, prefixlen) - host bits cleared. Sorts like sort_cidrs()
+type CidrKey = tuple[int, int, int]
+
+
+def _ip4_addr_to_int(text: str) -> int:
+    """
+    Dotted quad to integer or -1 if invalid.
+    """
+    if not _IP4_CHARS.issuperset(text):
+        return -1
+
+    octets = text.split('.')
+    if len(octets) != 4:
+        return -1
+
+    num = 0
+    for octet in octets:
+        if not octet or len(octet) > 3:
+            return -1
+        if octet[0] == '0' and octet != '0':
+            return -1
+        val = int(octet)
+        if val > 255:
+            return -1
+        num = num << 8 | val
+    return num
+
+
+def _prefix_to_int(text: str, max_prefixlen: int) -> int:
+    """
+    Prefix length string to integer or -1 if invalid.
+    """
+    if not text or not _DIGITS.issuperset(text):
+        return -1
+
+    if len(text) > 3:
+        # int() refuses too many digits - then ipaddress does too
+        limit = sys.get_int_max_str_digits()
+        if 0 < limit < len(text):
+            return -1
+        text = text.lstrip('0') or '0'
+        if len(text) > 3:
+            return -1
+
+    prefixlen = int(text)
+    if prefixlen > max_prefixlen:
+        return -1
+    return prefixlen
+
+
+def _ip4_mask_to_prefix(text: str) -> int:
+    """
+    Dotted quad netmask (or hostmask) to prefix length or -1 if invalid.
+
+    Netmask is tried first, so 0.0.0.0 is /0.
+    """
+    mask = _ip4_addr_to_int(text)
+    if mask < 0:
+        return -1
+
+    inverse = mask ^ _IP4_ALL_ONES
+    if inverse & (inverse + 1) == 0:
+        return mask.bit_count()
+
+    if mask & (mask + 1) == 0:
+        return 32 - mask.bit_count()
+    return -1
+
+
+def _ip6_addr_to_int(text: str) -> int:
+    """
+    IPv6 address (no scope id) to integer or -1 if invalid.
+    """
+    # pylint: disable=too-many-branches
+    if not text or len(text) > _IP6_MAX_LEN or not _IP6_CHARS.issuperset(text):
+        return -1
+
+    parts = text.split(':')
+    if not 3 <= len(parts) <= 9:
+        return -1
+
+    # embedded ipv4 takes the place of the last 2 hextets
+    ip4_int = -1
+    if '.' in parts[-1]:
+        ip4_int = _ip4_addr_to_int(parts.pop())
+        if ip4_int < 0:
+            return -1
+        parts += ['0', '0']
+
+    num_parts = len(parts)
+    if num_parts > 9:
+        return -1
+
+    # at most one '::' - ignoring the endpoints
+    skip_index = -1
+    for idx in range(1, num_parts - 1):
+        if not parts[idx]:
+            if skip_index >= 0:
+                return -1
+            skip_index = idx
+
+    if skip_index >= 0:
+        parts_hi = skip_index
+        parts_lo = num_parts - skip_index - 1
+        if not parts[0]:
+            parts_hi -= 1
+            if parts_hi:
+                return -1
+        if not parts[-1]:
+            parts_lo -= 1
+            if parts_lo:
+                return -1
+        parts_skipped = 8 - (parts_hi + parts_lo)
+        if parts_skipped < 1:
+            return -1
+    else:
+        if num_parts != 8 or not parts[0] or not parts[-1]:
+            return -1
+        parts_hi = 8
+        parts_lo = 0
+        parts_skipped = 0
+
+    hextets = parts[:parts_hi] + ['0'] * parts_skipped + parts[num_parts - parts_lo:]
+    num = 0
+    for hextet in hextets:
+        # only hex digits and '.' are left to rule out
+        if not hextet or len(hextet) > 4 or '.' in hextet:
+            return -1
+        num = num << 16 | int(hextet, 16)
+
+    if ip4_int >= 0:
+        num = (num >> 32 << 32) | ip4_int
+    return num
+
+
+def parse_ip4(cidr: str) -> tuple[int, int] | None:
+    """
+    Parse IPv4 address or cidr string.
+
+    Accepts the same strings as IPv4Network(cidr, strict=False).
+
+    Args:
+        cidr (str):
+            IPv4 address or cidr. Prefix may be a length, netmask or hostmask.
+
+    Returns:
+        tuple[int, int] | None:
+            (address_int, prefixlen) or None if not valid.
+            Host bits of address_int are not cleared.
+    """
+    (addr, sep, prefix) = cidr.partition('/')
+    if '/' in prefix:
+        return None
+
+    addr_int = _ip4_addr_to_int(addr)
+    if addr_int < 0:
+        return None
+
+    if not sep:
+        return (addr_int, 32)
+
+    prefixlen = _prefix_to_int(prefix, 32)
+    if prefixlen < 0:
+        prefixlen = _ip4_mask_to_prefix(prefix)
+        if prefixlen < 0:
+            return None
+    return (addr_int, prefixlen)
+
+
+def parse_ip6(cidr: str) -> tuple[int, int] | None:
+    """
+    Parse IPv6 address or cidr string.
+
+    Accepts the same strings as IPv6Network(cidr, strict=False),
+    including a scope id ('fe80::1%eth0/64'), which is ignored.
+
+    Args:
+        cidr (str):
+            IPv6 address or cidr.
+
+    Returns:
+        tuple[int, int] | None:
+            (address_int, prefixlen) or None if not valid.
+            Host bits of address_int are not cleared.
+    """
+    (addr, sep, prefix) = cidr.partition('/')
+    if '/' in prefix:
+        return None
+
+    prefixlen = 128
+    if sep:
+        prefixlen = _prefix_to_int(prefix, 128)
+        if prefixlen < 0:
+            return None
+
+    (addr, has_scope, scope_id) = addr.partition('%')
+    if has_scope and (not scope_id or '%' in scope_id):
+        return None
+
+    addr_int = _ip6_addr_to_int(addr)
+    if addr_int < 0:
+        return None
+    return (addr_int, prefixlen)
+
+
+def parse_cidr(cidr: str) -> tuple[int, int, int] | None:
+    """
+    Parse IPv4 or IPv6 address or cidr string.
+
+    Accepts the same strings as ipaddress.ip_network(cidr, strict=False).
+
+    Args:
+        cidr (str):
+            IP address or cidr string.
+
+    Returns:
+        tuple[int, int, int] | None:
+            (version, address_int, prefixlen) or None if not valid.
+            Host bits of address_int are not cleared.
+    """
+    if ':' in cidr:
+        result = parse_ip6(cidr)
+        version = 6
+    else:
+        result = parse_ip4(cidr)
+        version = 4
+
+    if result is None:
+        return None
+    return (version, result[0], result[1])
+
+
+def network_key(parsed: tuple[int, int, int]) -> CidrKey:
+    """
+    Clear host bits of a parse_cidr() result.
+
+    Args:
+        parsed (tuple[int, int, int]):
+            (version, address_int, prefixlen) from parse_cidr().
+
+    Returns:
+        CidrKey:
+            (version, network_int, prefixlen)
+    """
+    (version, num, prefixlen) = parsed
+    host_bits = (32 if version == 4 else 128) - prefixlen
+    return (version, num >> host_bits << host_bits, prefixlen)
+
+
+def parse_cidr_key(cidr: str) -> CidrKey | None:
+    """
+    Parse IPv4 or IPv6 address or cidr string to its network key.
+
+    Args:
+        cidr (str):
+            IP address or cidr string.
+
+    Returns:
+        CidrKey | None:
+            (version, network_int, prefixlen) or None if not valid.
+    """
+    parsed = parse_cidr(cidr)
+    if parsed is None:
+        return None
+    return network_key(parsed)
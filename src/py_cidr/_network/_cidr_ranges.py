@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Batch conversion between IP ranges (start, end) and cidrs.
+
+Each range is split into cidr blocks with integer bit arithmetic (see
+interval_to_blocks()). Results for all rows are returned as one flat
+list plus row offsets (row i is cidrs[offsets[i]:offsets[i+1]]).
+With numpy, large ipv4 batches are split with vectorized code: every
+pass takes the next block of every unfinished row at once.
+"""
+from typing import (Any, Sequence)
+from ipaddress import (IPv4Address, IPv6Address)
+
+from py_cidr._utils import (have_numpy, require_numpy, NUMPY_MIN_ITEMS)
+
+from ._cidr_parse import parse_cidr
+from ._cidr_nets import (parse_ip4_array, ip4_array_to_cidrs)
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (interval_to_blocks, block_to_cidr)
+from ._cidr_intervals import (cidrs_to_intervals, cidrs_to_merged_intervals)
+
+_MAX_IP4 = (1 << 32) - 1
+_MAX_IP6 = (1 << 128) - 1
+
+
+def _addr_to_int(addr: Any, version: int) -> tuple[int, int]:
+    """
+    (version, address_int) of IP address string, IPvxAddress or integer.
+    Integers are taken to be of the given version.
+    """
+    if isinstance(addr, str):
+        parsed = parse_cidr(addr) if '/' not in addr else None
+        if parsed is None:
+            raise ValueError(f'{addr!r} does not appear to be an IPv4 or IPv6 address')
+        return (parsed[0], parsed[1])
+
+    if isinstance(addr, (IPv4Address, IPv6Address)):
+        return (addr.version, int(addr))
+
+    num = addr.__index__()
+    if not 0 <= num <= (_MAX_IP4 if version == 4 else _MAX_IP6):
+        raise ValueError(f'{num} is not a valid ipv{version} address')
+    return (version, num)
+
+
+def _ranges_to_cidrs_python(starts: Sequence[Any], ends: Sequence[Any], version: int
+                            ) -> tuple[list[str], list[int]]:
+    """
+    ranges_to_cidrs() one row at a time.
+    """
+    cidrs: list[str] = []
+    offsets: list[int] = [0]
+    for (row, (start, end)) in enumerate(zip(starts, ends)):
+        (start_version, start_int) = _addr_to_int(start, version)
+        (end_version, end_int) = _addr_to_int(end, version)
+        if start_version != end_version:
+            raise TypeError(f'Range at row {row}: IP types must be same')
+        if start_int > end_int:
+            raise ValueError(f'Range at row {row}: start is after end')
+
+        max_prefixlen = 32 if start_version == 4 else 128
+        for (network_int, prefixlen) in interval_to_blocks(start_int, end_int, max_prefixlen):
+            cidrs.append(block_to_cidr(network_int, prefixlen, start_version))
+        offsets.append(len(cidrs))
+    return (cidrs, offsets)
+
+
+def _ip4_to_array(addrs: Sequence[Any], version: int) -> Any:
+    """
+    int64 numpy array of ipv4 addresses or None if not simple ipv4
+    (strings with prefix or not ipv4, ipv6 integers etc).
+    """
+    np = require_numpy('ranges_to_cidrs')
+    nums = None
+    if isinstance(addrs, np.ndarray) and addrs.dtype.kind in 'iu':
+        nums = addrs.astype(np.int64)
+    elif all(addr.__class__ is int for addr in addrs):
+        try:
+            nums = np.array(addrs, dtype=np.int64)
+        except OverflowError:
+            return None
+
+    if nums is not None:
+        if version != 4 or (len(nums) and (nums.min() < 0 or nums.max() > _MAX_IP4)):
+            return None
+        return nums
+
+    # lists of strings - parse_ip4_array would accept a prefix
+    if not all(addr.__class__ is str and '/' not in addr for addr in addrs):
+        return None
+
+    (nums, _prefixlens, invalid) = parse_ip4_array(addrs)
+    if invalid.any():
+        return None
+    return nums.astype(np.int64)
+
+
+def _ranges_to_cidrs_numpy(starts: Any, ends: Any) -> tuple[list[str], list[int]] | None:
+    """
+    ranges_to_cidrs() of ipv4 int64 arrays - None if any start > end.
+    """
+    # pylint: disable=too-many-locals
+    np = require_numpy('ranges_to_cidrs')
+    if (starts > ends).any():
+        return None
+
+    num_rows = len(starts)
+    rows = np.arange(num_rows)
+    cur = starts.copy()
+    last = ends
+    out_rows = []
+    out_nets = []
+    out_prefixlens = []
+    while len(rows):
+        # block is largest allowed by alignment (lowest set bit) and length
+        align = cur & -cur
+        align[cur == 0] = 1 << 32
+        span_bits = np.frexp((last - cur + 1).astype(np.float64))[1] - 1
+        size = np.minimum(align, np.left_shift(np.int64(1), span_bits))
+        host_bits = np.frexp(size.astype(np.float64))[1] - 1
+
+        out_rows.append(rows)
+        out_nets.append(cur)
+        out_prefixlens.append(32 - host_bits)
+
+        cur = cur + size
+        more = cur <= last
+        (rows, cur, last) = (rows[more], cur[more], last[more])
+
+    all_rows = np.concatenate(out_rows)
+    # each pass is in address order so a stable sort on row is enough
+    order = np.argsort(all_rows, kind='stable')
+    nets = np.concatenate(out_nets)[order]
+    prefixlens = np.concatenate(out_prefixlens)[order]
+
+    counts = np.bincount(all_rows, minlength=num_rows)
+    offsets = [0] + np.cumsum(counts).tolist()
+    return (ip4_array_to_cidrs(nets, prefixlens), offsets)
+
+
+def ranges_to_cidrs(starts: Sequence[Any], ends: Sequence[Any], version: int = 4
+                    ) -> tuple[list[str], list[int]]:
+    """
+    Convert many IP ranges to cidrs.
+
+    Args:
+        starts (Sequence[Any]):
+            First address of each range - IP strings, IPvxAddress or
+            integers (list or numpy array).
+
+        ends (Sequence[Any]):
+            Last address (inclusive) of each range - same types as starts.
+
+        version (int):
+            IP version (4 or 6) of integer addresses.
+
+    Returns:
+        tuple[list[str], list[int]]:
+            (cidrs, offsets) - cidrs of row i are cidrs[offsets[i]:offsets[i+1]]
+            and len(offsets) is number of rows + 1.
+
+    Raises:
+        ValueError: invalid address or start after end.
+        TypeError: start and end of a range are different IP versions.
+    """
+    if len(starts) != len(ends):
+        raise ValueError('starts and ends must be the same length')
+
+    if have_numpy() and len(starts) >= NUMPY_MIN_ITEMS:
+        start_nums = _ip4_to_array(starts, version)
+        end_nums = _ip4_to_array(ends, version) if start_nums is not None else None
+        if start_nums is not None and end_nums is not None:
+            result = _ranges_to_cidrs_numpy(start_nums, end_nums)
+            if result is not None:
+                return result
+
+    # anything else - including errors, which are found here
+    return _ranges_to_cidrs_python(starts, ends, version)
+
+
+def cidrs_to_ranges(cidrs: Sequence[Any], merge: bool = True, as_numpy: bool = False
+                    ) -> tuple[Any, Any]:
+    """
+    Convert list of cidrs to integer ranges.
+
+    Args:
+        cidrs (Sequence[Any]):
+            cidr strings (or IPvxNetwork) - may be mixed ipv4 and ipv6.
+            Any bad cidr will raise ValueError.
+
+        merge (bool):
+            If true, ranges are sorted with overlapping and adjacent
+            ones coalesced. Otherwise one range per cidr in input order.
+
+        as_numpy (bool):
+            If true, return numpy arrays of shape (n, 2) - uint32 for
+            ipv4 and object (python int) for ipv6. Requires numpy.
+
+    Returns:
+        tuple[Any, Any]:
+            (ip4_ranges, ip6_ranges) of (start, end) inclusive.
+    """
+    if merge:
+        (ivs4, ivs6, invalid) = cidrs_to_merged_intervals(cidrs)
+    else:
+        (ivs4, ivs6, invalid) = cidrs_to_intervals(cidrs)
+    if invalid:
+        raise ValueError(f'Bad cidr input invalid: {invalid[0]}')
+
+    if not as_numpy:
+        return (ivs4, ivs6)
+
+    np = require_numpy('cidrs_to_ranges')
+    return (_to_array(np, ivs4, np.uint32), _to_array(np, ivs6, object))
+
+
+def _to_array(np: Any, intervals: list[Interval], dtype: Any) -> Any:
+    """
+    (n, 2) numpy array of intervals.
+    """
+    if not intervals:
+        return np.zeros((0, 2), dtype=dtype)
+    return np.array(intervals, dtype=dtype)
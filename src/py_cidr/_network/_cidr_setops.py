@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Set operations on lists of cidrs.
+
+Each list is parsed to merged integer intervals (one list per IP version),
+combined with a single sweep per IP version and turned back into the
+minimal list of cidrs. Cost is O((n+m) log(n+m)), dominated by the sort.
+"""
+from typing import (Any, Callable, Sequence)
+
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (cidrs_to_merged_intervals, intervals_to_cidrs)
+from ._cidr_intervals import (union_intervals, intersect_intervals)
+from ._cidr_intervals import (subtract_intervals, symmetric_difference_intervals)
+
+type _IntervalOp = Callable[[list[Interval], list[Interval]], list[Interval]]
+
+
+def _cidrs_to_merged(cidrs: Sequence[Any]) -> tuple[list[Interval], list[Interval]]:
+    """
+    Merged (ip4, ip6) intervals - raise ValueError if any cidr invalid.
+    """
+    (ivs4, ivs6, invalid) = cidrs_to_merged_intervals(cidrs)
+    if invalid:
+        raise ValueError(f'{invalid[0]!r} does not appear to be an IPv4 or IPv6 network')
+    return (ivs4, ivs6)
+
+
+def _cidrs_op(cidrs_a: Sequence[Any], cidrs_b: Sequence[Any], op: _IntervalOp) -> list[str]:
+    """
+    Apply interval op to each IP version: result ipv4 before ipv6.
+    """
+    (ivs4_a, ivs6_a) = _cidrs_to_merged(cidrs_a)
+    (ivs4_b, ivs6_b) = _cidrs_to_merged(cidrs_b)
+    return (intervals_to_cidrs(op(ivs4_a, ivs4_b), 4)
+            + intervals_to_cidrs(op(ivs6_a, ivs6_b), 6))
+
+
+def cidrs_union(cidrs_a: Sequence[Any], cidrs_b: Sequence[Any]) -> list[str]:
+    """
+    Cidrs covering every address in either list.
+    """
+    return _cidrs_op(cidrs_a, cidrs_b, union_intervals)
+
+
+def cidrs_intersection(cidrs_a: Sequence[Any], cidrs_b: Sequence[Any]) -> list[str]:
+    """
+    Cidrs covering every address in both lists.
+    """
+    return _cidrs_op(cidrs_a, cidrs_b, intersect_intervals)
+
+
+def cidrs_difference(cidrs_a: Sequence[Any], cidrs_b: Sequence[Any]) -> list[str]:
+    """
+    Cidrs covering every address in cidrs_a but not in cidrs_b.
+    """
+    return _cidrs_op(cidrs_a, cidrs_b, subtract_intervals)
+
+
+def cidrs_symmetric_difference(cidrs_a: Sequence[Any], cidrs_b: Sequence[Any]) -> list[str]:
+    """
+    Cidrs covering every address in exactly one of the lists.
+    """
+    return _cidrs_op(cidrs_a, cidrs_b, symmetric_difference_intervals)
@@ -2,39 +2,139 @@
 # SPDX-FileCopyrightText: © 2023-present Gene C <arch@sapience.com>
 """
 Class support functions to sort lists of cidrs/nets
+
+Each entry is parsed once to an integer key (version, network_int, prefixlen)
+and the keys are sorted - same order as ipaddress.get_mixed_type_key.
+With numpy, large lists have their ipv4 cidrs parsed and sorted with
+vectorized code (lexsort).
 """
+from typing import (Any)
 import ipaddress
 
+from py_cidr._utils import (have_numpy, require_numpy, NUMPY_MIN_ITEMS)
 from py_cidr._network.cidr_types import IPvxNetwork
 
-from ._cidr_nets import (cidrs_to_nets, nets_to_cidrs)
-from ._cidr_address import (ips_to_addresses, addresses_to_ips)
+from ._cidr_parse import (CidrKey, parse_cidr, parse_cidr_key)
+from ._cidr_nets import ip4_array_to_cidrs
+from ._cidr_intervals import (block_to_cidr, parse_ip4_array_exact)
+
+
+def _cidr_key(cidr: Any) -> CidrKey:
+    """
+    Sort key (version, network_int, prefixlen) - ValueError if invalid.
+    """
+    if isinstance(cidr, str):
+        key = parse_cidr_key(cidr)
+        if key is None:
+            raise ValueError(f'{cidr!r} does not appear to be an IPv4 or IPv6 network')
+        return key
+
+    net = ipaddress.ip_network(cidr, strict=False)
+    return (net.version, int(net.network_address), net.prefixlen)
+
+
+def _key_to_cidr(cidr: Any, key: CidrKey) -> str:
+    """
+    Same string as str(ip_network(cidr, strict=False)).
+    """
+    if isinstance(cidr, str) and '%' not in cidr:
+        return block_to_cidr(key[1], key[2], key[0])
+    return str(ipaddress.ip_network(cidr, strict=False))
+
+
+def _sort_cidrs_python(cidrs: list[Any], reformat: bool) -> list[str]:
+    """
+    Sort cidrs using tuple keys.
+    """
+    keys = [_cidr_key(cidr) for cidr in cidrs]
+    order = sorted(range(len(cidrs)), key=keys.__getitem__)
+    if reformat:
+        return [_key_to_cidr(cidrs[idx], keys[idx]) for idx in order]
+    return [cidrs[idx] for idx in order]
+
+
+def _sort_cidrs_numpy(cidrs: list[Any], reformat: bool) -> list[str]:
+    """
+    Sort cidrs - ipv4 with numpy lexsort, the rest using tuple keys.
+    """
+    np = require_numpy('sort_cidrs')
+    (addrs, prefixlens, not_ip4) = parse_ip4_array_exact(cidrs)
+
+    rest = np.flatnonzero(not_ip4).tolist()
+    keys = {idx: _cidr_key(cidrs[idx]) for idx in rest}
+    if any(key[0] == 4 for key in keys.values()):
+        # ipv4 not given as strings - rare so keep it simple
+        return _sort_cidrs_python(cidrs, reformat)
+
+    # lexsort is stable: last key is the primary one
+    rows4 = np.flatnonzero(~not_ip4)
+    order4 = rows4[np.lexsort((prefixlens[rows4], addrs[rows4]))]
+    order6 = sorted(rest, key=keys.__getitem__)
 
+    if reformat:
+        return (ip4_array_to_cidrs(addrs[order4], prefixlens[order4])
+                + [_key_to_cidr(cidrs[idx], keys[idx]) for idx in order6])
+    return [cidrs[idx] for idx in order4.tolist()] + [cidrs[idx] for idx in order6]
 
-def sort_cidrs(cidrs: list[str]) -> list[str]:
+
+def sort_cidrs(cidrs: list[str], reformat: bool = True) -> list[str]:
     """
     Sort the list of cidr strings.
+
+    Any invalid cidr raises ValueError.
+    If reformat is true, cidrs are returned in standard form (host bits
+    cleared) as before, otherwise the original strings are returned.
     """
-    nets = cidrs_to_nets(cidrs)
-    if not nets:
+    if not cidrs:
         return cidrs
 
-    key_ip = ipaddress.get_mixed_type_key
-    nets.sort(key=key_ip)                           # type: ignore[arg-type]
-    cidrs_sorted = nets_to_cidrs(nets)
-    return cidrs_sorted
+    if have_numpy() and len(cidrs) >= NUMPY_MIN_ITEMS:
+        return _sort_cidrs_numpy(cidrs, reformat)
+    return _sort_cidrs_python(cidrs, reformat)
 
 
-def sort_ips(ips: list[str]) -> list[str]:
+def _ip_key(ip: str) -> tuple[int, int]:
     """
-    Sort the list of cidr strings.
+    Sort key (version, address_int) - any prefix is ignored.
+    ValueError if invalid.
     """
-    addresses = ips_to_addresses(ips)
+    addr = ip.partition('/')[0]
+    parsed = parse_cidr(addr)
+    if parsed is None:
+        raise ValueError(f'{addr!r} does not appear to be an IPv4 or IPv6 address')
+    return (parsed[0], parsed[1])
+
+
+def _key_to_ip(ip: str, key: tuple[int, int]) -> str:
+    """
+    Same string as str(ip_address(ip)) with any prefix removed.
+    """
+    (version, num) = key
+    if version == 4:
+        return f'{num >> 24}.{num >> 16 & 255}.{num >> 8 & 255}.{num & 255}'
+    if '%' in ip:
+        return str(ipaddress.ip_address(ip.partition('/')[0]))
+    return str(ipaddress.IPv6Address(num))
+
+
+def sort_ips(ips: list[str], reformat: bool = True) -> list[str]:
+    """
+    Sort the list of ip strings.
+
+    Empty strings are dropped and any invalid ip raises ValueError.
+    If reformat is true, ips are returned in standard form without any
+    prefix as before, otherwise the original strings are returned.
+    """
+    ips = [ip for ip in ips if ip]
+    keys = [_ip_key(ip) for ip in ips]
+    order = sorted(range(len(ips)), key=keys.__getitem__)
+    if reformat:
+        return [_key_to_ip(ips[idx], keys[idx]) for idx in order]
+    return [ips[idx] for idx in order]
+
 
-    key_ip = ipaddress.get_mixed_type_key
-    addresses.sort(key=key_ip)                      # type: ignore[arg-type]
-    ips_sorted = addresses_to_ips(addresses)
-    return ips_sorted
+def _net_key(net: IPvxNetwork) -> CidrKey:
+    return (net.version, int(net.network_address), net.prefixlen)
 
 
 def sort_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
@@ -45,6 +145,5 @@ def sort_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
     if not nets:
         return nets_sorted
 
-    key_ip = ipaddress.get_mixed_type_key
-    nets_sorted = sorted(nets, key=key_ip)          # type: ignore[arg-type]
+    nets_sorted = sorted(nets, key=_net_key)
     return nets_sorted
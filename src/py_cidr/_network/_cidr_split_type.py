@@ -6,8 +6,7 @@ Split list of networks by type
 from ipaddress import (IPv4Address, IPv4Network, IPv6Address, IPv6Network)
 
 from .cidr_types import (IPvxNetwork, IPv4, IPv6)
-from ._cidr_valid import is_valid_ip4
-from ._cidr_valid import is_valid_ip6
+from ._cidr_valid import cidr_iptype
 
 
 def cidrs_split_type(cidrs: list[str]
@@ -29,14 +28,15 @@ def cidrs_split_type(cidrs: list[str]
         return (ip4, ip6, oth)
 
     for cidr in cidrs:
-        if is_valid_ip4(cidr):
-            ip4.append(cidr)
+        match cidr_iptype(cidr):
+            case 'ip4':
+                ip4.append(cidr)
 
-        elif is_valid_ip6(cidr):
-            ip6.append(cidr)
+            case 'ip6':
+                ip6.append(cidr)
 
-        else:
-            oth.append(cidr)
+            case _:
+                oth.append(cidr)
 
     return (ip4, ip6, oth)
 
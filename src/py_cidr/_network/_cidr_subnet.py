@@ -3,13 +3,16 @@
 """
 Class support functions for subnets
 """
+from typing import (Sequence)
 import ipaddress
 
-from .cidr_types import (IPvxNetwork)
-from ._cidr_valid import (cidr_iptype)
-from ._cidr_nets import (cidr_to_net, nets_to_cidrs)
+from .cidr_types import (IPvxNetwork, CidrLike)
+from ._cidr_nets import (cidr_to_net)
 from ._cidr_address import (ipaddr_cidr_from_string)
-from ._cidr_compact import (compact_nets, compact_cidrs_to_nets)
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (merge_intervals, subtract_intervals)
+from ._cidr_intervals import (nets_to_intervals, intervals_to_nets)
+from ._cidr_setops import (cidrs_difference)
 
 
 def cidr_set_prefix(cidr: str, prefix: int) -> str:
@@ -84,13 +87,12 @@ def net_is_subnet(net1: IPvxNetwork, net2: IPvxNetwork | list[IPvxNetwork]
     else:
         nets2 = net2
 
-    ipt1 = cidr_iptype(net1)
+    version = net1.version
 
-    # check each net in list
+    # check each net in list - skipping other IP version
     for net in nets2:
-        ipt = cidr_iptype(net)
-        if ipt != ipt1:
-            return False
+        if net.version != version:
+            continue
 
         if net1.subnet_of(net):         # type: ignore[arg-type]
             return True
@@ -107,68 +109,68 @@ def net_exclude(net1: IPvxNetwork, nets2: list[IPvxNetwork]
     if not net1 or not nets2:
         return nets2
 
-    nets: list[IPvxNetwork] = []
-    for net in nets2:
-        if net1.subnet_of(net):                      # type: ignore[arg-type]
-            # remove the net1 subnet from net
-            nets += list(net.address_exclude(net1))  # type: ignore[arg-type]
-        elif net.subnet_of(net1):                    # type: ignore[arg-type]
-            # remove net entirely as part of net1
-            continue
-        else:
-            # keep net
-            nets.append(net)
-    nets = compact_nets(nets)
-    return nets
+    return nets_exclude([net1], nets2)
+
+
+def _subtract_families(ivs2: tuple[list[Interval], list[Interval]],
+                       ivs1: tuple[list[Interval], list[Interval]]
+                       ) -> tuple[list[Interval], list[Interval]]:
+    """
+    Merged (ip4, ip6) intervals "ivs2 - ivs1" - inputs must be merged.
+    """
+    return (subtract_intervals(ivs2[0], ivs1[0]),
+            subtract_intervals(ivs2[1], ivs1[1]))
 
 
 def nets_exclude(nets1: list[IPvxNetwork], nets2: list[IPvxNetwork]
                  ) -> list[IPvxNetwork]:
     """
     Exclude every nets1 network from from any networks in nets2
+
+    Done with one merge style sweep over sorted integer intervals
+    (for each IP version) - result is compacted, ipv4 before ipv6.
     """
-    final = []
-    nets1 = compact_nets(nets1)
-    final = compact_nets(nets2)
-    for net1 in nets1:
-        final = net_exclude(net1, final)
-    return final
+    if not nets2:
+        return []
+
+    (ivs4_2, ivs6_2) = nets_to_intervals(nets2)
+    (ivs4_1, ivs6_1) = nets_to_intervals(nets1) if nets1 else ([], [])
 
+    (ivs4, ivs6) = _subtract_families(
+            (merge_intervals(ivs4_2), merge_intervals(ivs6_2)),
+            (merge_intervals(ivs4_1), merge_intervals(ivs6_1)))
+    return intervals_to_nets(ivs4, 4) + intervals_to_nets(ivs6, 6)
 
-def cidrs_exclude(cidrs1: list[str], cidrs2: list[str]) -> list[str]:
+
+def cidrs_exclude(cidrs1: Sequence[CidrLike], cidrs2: Sequence[CidrLike]) -> list[str]:
     """ old name """
     return cidrs2_minus_cidrs1(cidrs1, cidrs2)
 
 
-def cidrs2_minus_cidrs1(cidrs1: list[str], cidrs2: list[str]
+def cidrs2_minus_cidrs1(cidrs1: Sequence[CidrLike], cidrs2: Sequence[CidrLike]
                         ) -> list[str]:
     """
     Exclude all of cidrs1 from cidrs2
     i.e. return cidrs2 - cidrs1
+
+    Strings are parsed straight to integer intervals and subtracted with
+    a single sweep, result is compacted, ipv4 before ipv6.
     """
-    nets1 = [ipaddress.ip_network(cidr, strict=False) for cidr in cidrs1]
-    nets2 = [ipaddress.ip_network(cidr, strict=False) for cidr in cidrs2]
-    nets = nets_exclude(nets1, nets2)
-    cidrs = [str(net) for net in nets]
-    return cidrs
+    return cidrs_difference(cidrs2, cidrs1)
 
 
-def cidr_exclude(cidr1: str, cidrs2: list[str]) -> list[str]:
+def cidr_exclude(cidr1: str, cidrs2: Sequence[CidrLike]) -> list[str]:
     """
     Exclude cidr1 from any of networks in cidrs2
     return resulting list of cidrs (without cidr1)
     """
     if not cidr1 or not cidrs2:
-        if not cidrs2:
-            return []
-        return cidrs2
+        return [str(cidr) for cidr in cidrs2]
 
     net1 = cidr_to_net(cidr1)
     if net1 is None:
-        return cidrs2
-    net2 = compact_cidrs_to_nets(cidrs2)
-    nets = net_exclude(net1, net2)
-    return nets_to_cidrs(nets)
+        return [str(cidr) for cidr in cidrs2]
+    return cidrs2_minus_cidrs1([cidr1], cidrs2)
 
 
 def get_host_bits(ip: str, pfx: int = 24) -> int:
@@ -3,16 +3,21 @@
 """
 Support for type checks
 """
-from typing import (Any)
+from typing import (Any, Iterable)
 import ipaddress
 from ipaddress import (IPv4Address, IPv6Address, IPv4Network, IPv6Network)
 from ipaddress import (AddressValueError, NetmaskValueError)
 
 from .cidr_types import (IPvxAddress, IPvxNetwork)
+from ._cidr_parse import (parse_ip4, parse_ip6, parse_cidr)
 
 
 def is_valid_ip4(address: Any) -> bool:
     """ check if valid address or cidr """
+    # strings use exception free parser
+    if isinstance(address, str):
+        return parse_ip4(address) is not None
+
     try:
         _check = IPv4Network(address, strict=False)
         return True
@@ -22,6 +27,9 @@ def is_valid_ip4(address: Any) -> bool:
 
 def is_valid_ip6(address: Any) -> bool:
     """ check if valid address or cidr """
+    if isinstance(address, str):
+        return parse_ip6(address) is not None
+
     try:
         _check = IPv6Network(address, strict=False)
         return True
@@ -43,6 +51,10 @@ def is_valid_cidr(address: Any) -> bool:
     """
     if not address:
         return False
+
+    if isinstance(address, str):
+        return parse_cidr(address) is not None
+
     try:
         _check = ipaddress.ip_network(address, strict=False)
         return True
@@ -50,6 +62,25 @@ def is_valid_cidr(address: Any) -> bool:
         return False
 
 
+def is_valid_cidrs(addresses: Iterable[Any]) -> list[bool]:
+    """
+    Valid Address or Network mask
+        check each of a list of ip addresses or cidr networks.
+
+    :param addresses:
+        IP or Cidr strings to check.
+
+    :returns:
+        list of True/False, one for each address, True if that address is valid.
+    """
+    if not addresses:
+        return []
+
+    return [parse_cidr(address) is not None if isinstance(address, str)
+            else is_valid_cidr(address)
+            for address in addresses]
+
+
 def cidr_iptype(address: Any) -> str:
     """
     Determines if an IP address or CIDR string is ipv4 or ipv6
@@ -66,6 +97,12 @@ def cidr_iptype(address: Any) -> str:
     if not address:
         return ''
 
+    # strings: only ipv6 has ':' - avoids trying both types
+    if isinstance(address, str):
+        if ':' in address:
+            return 'ip6' if is_valid_ip6(address) else ''
+        return 'ip4' if is_valid_ip4(address) else ''
+
     if is_valid_ip4(address):
         return 'ip4'
 
@@ -113,10 +150,11 @@ def cidr_type_network(cidr: str) -> tuple[str, type[IPvxNetwork]]:
         network type is IPv4Network or IPv6Network.
         If cidr is invalid then ip-type will be None.
     """
-    if is_valid_ip4(cidr):
-        return ('ip4', IPv4Network)
+    match cidr_iptype(cidr):
+        case 'ip4':
+            return ('ip4', IPv4Network)
 
-    if is_valid_ip6(cidr):
-        return ('ip6', IPv6Network)
+        case 'ip6':
+            return ('ip6', IPv6Network)
 
     return ('', IPv4Network)
@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+External memory (out of core) compaction.
+
+For inputs too large to hold in memory. Cidrs are converted to integer
+intervals and buffered. When a buffer reaches the memory budget it is
+merged and, if still too big, written as a sorted run of fixed size
+binary records to a temporary file. At the end all runs are k-way merged
+(heapq.merge), merged as they stream past and written straight out as
+cidr strings.
+"""
+from typing import (Iterable, Iterator, TextIO)
+import heapq
+import struct
+import tempfile
+
+from py_cidr._utils import write_lines
+
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (merge_intervals, iter_merge_sorted, cidr_to_interval)
+from ._cidr_intervals import (interval_to_blocks, block_to_cidr)
+
+# rough memory used by one buffered interval: tuple + 2 ints + list slot
+_INTERVAL_BYTES = 128
+
+# most runs merged at once - each has a read buffer
+_MAX_MERGE_RUNS = 64
+_READ_RECORDS = 4096
+
+_IP4_RECORD = struct.Struct('>II')
+_IP6_RECORD = struct.Struct('>QQQQ')
+_MASK_64 = (1 << 64) - 1
+
+
+def _pack_ip6(start: int, end: int) -> bytes:
+    return _IP6_RECORD.pack(start >> 64, start & _MASK_64, end >> 64, end & _MASK_64)
+
+
+def _write_run(fob, intervals: Iterable[Interval], version: int):
+    """
+    Write sorted intervals as fixed size binary records.
+    Intervals may be a generator - written a chunk at a time.
+    """
+    pack = _IP4_RECORD.pack if version == 4 else _pack_ip6
+    chunk: list[bytes] = []
+    for (start, end) in intervals:
+        chunk.append(pack(start, end))
+        if len(chunk) >= _READ_RECORDS:
+            fob.write(b''.join(chunk))
+            chunk = []
+    if chunk:
+        fob.write(b''.join(chunk))
+
+
+def _read_run(fob, version: int) -> Iterator[Interval]:
+    """
+    Stream intervals back from a run file.
+    """
+    record = _IP4_RECORD if version == 4 else _IP6_RECORD
+    fob.seek(0)
+    while chunk := fob.read(record.size * _READ_RECORDS):
+        if version == 4:
+            yield from record.iter_unpack(chunk)
+        else:
+            for (shi, slo, ehi, elo) in record.iter_unpack(chunk):
+                yield (shi << 64 | slo, ehi << 64 | elo)
+
+
+class _Runs:
+    """
+    Buffer of intervals for one IP version, spilled to sorted runs.
+    """
+    def __init__(self, version: int, max_buffer: int, tmp_dir: str | None):
+        self.version: int = version
+        self.max_buffer: int = max_buffer
+        self.tmp_dir: str | None = tmp_dir
+        self.buffer: list[Interval] = []
+        self.runs: list = []
+
+    def add(self, interval: Interval):
+        """
+        Buffer one interval - spill if buffer is full.
+        """
+        self.buffer.append(interval)
+        if len(self.buffer) >= self.max_buffer:
+            self._spill()
+
+    def _spill(self):
+        """
+        Merge buffer. Only write it out if merging did not free enough room.
+        """
+        self.buffer = merge_intervals(self.buffer)
+        if len(self.buffer) < self.max_buffer // 2:
+            return
+        self._new_run(self.buffer)
+        self.buffer = []
+
+    def _new_run(self, intervals: Iterable[Interval]):
+        # pylint: disable=consider-using-with
+        fob = tempfile.TemporaryFile(dir=self.tmp_dir)
+        _write_run(fob, intervals, self.version)
+        self.runs.append(fob)
+
+    def _merge_runs(self, runs: list) -> Iterator[Interval]:
+        """
+        k-way merge of runs then merge the intervals.
+        """
+        readers = [_read_run(fob, self.version) for fob in runs]
+        return iter_merge_sorted(heapq.merge(*readers))
+
+    def merged(self) -> Iterator[Interval]:
+        """
+        All intervals, merged and in order.
+        """
+        if not self.runs:
+            yield from merge_intervals(self.buffer)
+            return
+
+        if self.buffer:
+            self._new_run(merge_intervals(self.buffer))
+            self.buffer = []
+
+        # too many runs to merge at once - merge in passes
+        while len(self.runs) > _MAX_MERGE_RUNS:
+            runs = self.runs
+            self.runs = []
+            for idx in range(0, len(runs), _MAX_MERGE_RUNS):
+                group = runs[idx:idx + _MAX_MERGE_RUNS]
+                self._new_run(self._merge_runs(group))
+                for fob in group:
+                    fob.close()
+
+        try:
+            yield from self._merge_runs(self.runs)
+        finally:
+            for fob in self.runs:
+                fob.close()
+            self.runs = []
+
+
+def _iter_cidrs(all_runs: Iterable[_Runs]) -> Iterator[str]:
+    """
+    Compacted cidr strings of merged runs.
+    """
+    for runs in all_runs:
+        version = runs.version
+        max_prefixlen = 32 if version == 4 else 128
+        for (start, end) in runs.merged():
+            for (network_int, prefixlen) in interval_to_blocks(start, end, max_prefixlen):
+                yield block_to_cidr(network_int, prefixlen, version)
+
+
+def compact_cidrs_external(cidrs: Iterable[str], fob_out: TextIO,
+                           mem_budget: int = 64 * 1024 * 1024,
+                           tmp_dir: str | None = None) -> int:
+    """
+    Compact cidrs with bounded memory and write result to a file.
+
+    Same cidrs, in the same order, as compact_cidrs() but memory use
+    is bounded by mem_budget (approximately) instead of input size.
+    Invalid cidrs are skipped.
+
+    Args:
+        cidrs (Iterable[str]):
+            cidr strings - typically a generator reading files.
+
+        fob_out (TextIO):
+            Where compacted cidrs are written, one per line.
+
+        mem_budget (int):
+            Approximate memory (bytes) to use for buffered intervals.
+            Split between ipv4 and ipv6.
+
+        tmp_dir (str | None):
+            Directory for temporary run files. Default is the
+            system temporary directory.
+
+    Returns:
+        int:
+            Number of cidrs written.
+    """
+    max_buffer = max(mem_budget // (2 * _INTERVAL_BYTES), 1024)
+    ip4 = _Runs(4, max_buffer, tmp_dir)
+    ip6 = _Runs(6, max_buffer, tmp_dir)
+
+    for cidr in cidrs:
+        result = cidr_to_interval(cidr)
+        if result is None:
+            continue
+        if result[0] == 4:
+            ip4.add(result[1])
+        else:
+            ip6.add(result[1])
+
+    return write_lines(_iter_cidrs((ip4, ip6)), fob_out)
@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Multi-process compaction.
+
+Cidrs are sharded by IP version and high order bits (/8 for ipv4 and
+/16 for ipv6) using a cheap look at the text - nothing is parsed.
+Neighbouring buckets are grouped into shards of similar size and each
+shard is compacted to merged intervals in a process pool.
+A network shorter than the bucket size (e.g. a /7) can reach into
+the next bucket, so results are stitched together with a k-way merge
+followed by one linear interval merge: the result is still minimal.
+"""
+from typing import (Any, Sequence)
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (cidrs_to_merged_intervals, iter_merge_sorted)
+from ._cidr_intervals import (intervals_to_cidrs)
+from ._cidr_valid import is_valid_cidr
+
+# fewer cidrs than this are not worth starting processes for
+_MIN_PARALLEL = 10000
+
+# shards per worker - helps balance uneven buckets
+_SHARDS_PER_WORKER = 4
+
+_DIGITS = frozenset('0123456789')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+def _bucket(cidr: Any) -> int:
+    """
+    Bucket from the leading text of cidr:
+      - ipv4: first octet 0 - 255
+      - ipv6: 256 + first hextet
+      - -1 if can't tell (left for the parser to sort out)
+    """
+    bucket = -1
+    if not isinstance(cidr, str):
+        return bucket
+
+    if ':' in cidr:
+        hextet = cidr.partition(':')[0] or '0'
+        if len(hextet) <= 4 and _HEX_DIGITS.issuperset(hextet):
+            bucket = 256 + int(hextet, 16)
+    else:
+        octet = cidr.partition('.')[0]
+        if octet and len(octet) <= 3 and _DIGITS.issuperset(octet):
+            bucket = min(int(octet), 255)
+    return bucket
+
+
+def _compact_shard(cidrs: Sequence[Any]) -> tuple[list[Interval], list[Interval], list[Any]]:
+    """
+    Worker: merged (ip4, ip6) intervals and invalid cidrs of one shard.
+    """
+    return cidrs_to_merged_intervals(cidrs)
+
+
+def _make_shards(cidrs: Sequence[Any], num_shards: int) -> list[list[Any]]:
+    """
+    Group cidrs into about num_shards shards of neighbouring buckets.
+    """
+    buckets: dict[int, list[Any]] = {}
+    for cidr in cidrs:
+        bucket = _bucket(cidr)
+        if bucket in buckets:
+            buckets[bucket].append(cidr)
+        else:
+            buckets[bucket] = [cidr]
+
+    target = max(len(cidrs) // num_shards, 1)
+    shards: list[list[Any]] = []
+    shard: list[Any] = []
+    for key in sorted(buckets):
+        shard += buckets[key]
+        if len(shard) >= target:
+            shards.append(shard)
+            shard = []
+    if shard:
+        shards.append(shard)
+    return shards
+
+
+def compact_cidrs_parallel(cidrs: Sequence[Any], workers: int) -> list[str]:
+    """
+    Compact list of cidrs using a pool of processes.
+
+    Same result as compact_cidrs(). Any bad cidr will raise ValueError.
+
+    Args:
+        cidrs (Sequence[Any]):
+            cidrs to compact (strings, IPvxNetwork or IPvxAddress)
+            - may be mixed ipv4 and ipv6.
+
+        workers (int):
+            Number of worker processes.
+
+    Returns:
+        list[str]:
+            Compacted cidrs, ipv4 before ipv6.
+    """
+    if not cidrs:
+        return []
+
+    if workers <= 1 or len(cidrs) < _MIN_PARALLEL:
+        results = [_compact_shard(cidrs)]
+    else:
+        shards = _make_shards(cidrs, workers * _SHARDS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_compact_shard, shards))
+
+    if any(invalid for (_ivs4, _ivs6, invalid) in results):
+        # report the first in input order
+        first_bad = next((cidr for cidr in cidrs if not is_valid_cidr(cidr)),
+                         next(invalid for (_ivs4, _ivs6, invalid) in results if invalid)[0])
+        raise ValueError(f'Bad cidr input invalid: {first_bad}')
+
+    # stitch: each shard is sorted - k-way merge then merge intervals
+    ivs4 = iter_merge_sorted(heapq.merge(*[ivs4 for (ivs4, _ivs6, _inv) in results]))
+    ivs6 = iter_merge_sorted(heapq.merge(*[ivs6 for (_ivs4, ivs6, _inv) in results]))
+    return intervals_to_cidrs(ivs4, 4) + intervals_to_cidrs(ivs6, 6)
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Compact, sort, exclude, range and subnet tools for NetInt.
+
+Everything here works on integers - no ipaddress objects are made.
+Results with mixed types always have ipv4 before ipv6.
+"""
+import ipaddress
+
+from .cidr_types import (IPAddress)
+from .net_int import NetInt
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (merge_intervals, subtract_intervals)
+from ._cidr_intervals import (interval_to_blocks, intervals_to_blocks)
+
+
+def netints_to_intervals(netints: list[NetInt]
+                         ) -> tuple[list[Interval], list[Interval]]:
+    """
+    Convert list of NetInt to merged intervals.
+
+    Args:
+        netints (list[NetInt]):
+            Networks, can be mixed ipv4 and ipv6.
+
+    Returns:
+        tuple[list[Interval], list[Interval]]:
+            Merged (ip4_intervals, ip6_intervals).
+    """
+    ivs4: list[Interval] = []
+    ivs6: list[Interval] = []
+    for (version, num, prefixlen) in netints:
+        if version == 4:
+            ivs4.append((num, num + (1 << (32 - prefixlen)) - 1))
+        else:
+            ivs6.append((num, num + (1 << (128 - prefixlen)) - 1))
+
+    return (merge_intervals(ivs4), merge_intervals(ivs6))
+
+
+def intervals_to_netints(ivs4: list[Interval], ivs6: list[Interval]
+                         ) -> list[NetInt]:
+    """
+    Convert merged ipv4 and ipv6 intervals to minimal list of NetInt.
+    """
+    netints = [NetInt(4, num, pfx) for (num, pfx) in intervals_to_blocks(ivs4, 32)]
+    netints += [NetInt(6, num, pfx) for (num, pfx) in intervals_to_blocks(ivs6, 128)]
+    return netints
+
+
+def compact_netints(netints: list[NetInt]) -> list[NetInt]:
+    """
+    Compact list of NetInt to the smallest list possible.
+
+    Same networks as compact_nets() would give.
+
+    Args:
+        netints (list[NetInt]):
+            Networks to compact. May be mixed ipv4 and ipv6.
+
+    Returns:
+        list[NetInt]:
+            Compacted and sorted networks, ipv4 first.
+    """
+    if not netints:
+        return []
+
+    (ivs4, ivs6) = netints_to_intervals(netints)
+    return intervals_to_netints(ivs4, ivs6)
+
+
+def sort_netints(netints: list[NetInt]) -> list[NetInt]:
+    """
+    Sorted copy of list of NetInt.
+
+    Same order as sort_nets() - NetInt sorts as a plain tuple.
+    """
+    if not netints:
+        return []
+    return sorted(netints)
+
+
+def netints_exclude(netints1: list[NetInt], netints2: list[NetInt]
+                    ) -> list[NetInt]:
+    """
+    Exclude every netints1 network from netints2.
+
+    Args:
+        netints1 (list[NetInt]):
+            Networks to be excluded.
+
+        netints2 (list[NetInt]):
+            Networks from which netints1 are excluded.
+
+    Returns:
+        list[NetInt]:
+            Compacted list of networks "netints2 - netints1".
+    """
+    if not netints2:
+        return []
+
+    (ivs4_2, ivs6_2) = netints_to_intervals(netints2)
+    (ivs4_1, ivs6_1) = netints_to_intervals(netints1)
+
+    ivs4 = subtract_intervals(ivs4_2, ivs4_1)
+    ivs6 = subtract_intervals(ivs6_2, ivs6_1)
+    return intervals_to_netints(ivs4, ivs6)
+
+
+def netint_is_subnet(netint1: NetInt, netint2: NetInt | list[NetInt]) -> bool:
+    """
+    Determines if netint1 is a subnet of (or same as) any of netint2.
+
+    Args:
+        netint1 (NetInt):
+            Network to check if is a subnet.
+
+        netint2 (NetInt | list[NetInt]):
+            Network or list of networks to be checked.
+
+    Returns:
+        bool:
+            True if netint1 is subnet of any of netint2.
+    """
+    if not netint1 or not netint2:
+        return False
+
+    netints2: list[NetInt]
+    if isinstance(netint2, NetInt):
+        netints2 = [netint2]
+    else:
+        netints2 = netint2
+
+    (version, num, prefixlen) = netint1
+    max_prefixlen = 32 if version == 4 else 128
+    for (vers, num2, pfx2) in netints2:
+        if vers != version or pfx2 > prefixlen:
+            continue
+        shift = max_prefixlen - pfx2
+        if num >> shift == num2 >> shift:
+            return True
+    return False
+
+
+def netint_to_range(netint: NetInt) -> tuple[int, int]:
+    """
+    First and last address of netint as integers.
+    """
+    (version, num, prefixlen) = netint
+    max_prefixlen = 32 if version == 4 else 128
+    return (num, num + (1 << (max_prefixlen - prefixlen)) - 1)
+
+
+def range_to_netints(start: IPAddress | int, end: IPAddress | int,
+                     version: int = 4) -> list[NetInt]:
+    """
+    Generate minimal list of NetInt covering an IP range.
+
+    Args:
+        start (IPAddress | int):
+            Start of IP range as IPAddress (IPvxAddress or string) or integer.
+
+        end (IPAddress | int):
+            End of IP range (inclusive).
+
+        version (int):
+            IP version (4 or 6) used when start and end are integers.
+            Otherwise taken from the addresses.
+
+    Returns:
+        list[NetInt]:
+            list of network blocks representing the IP range.
+    """
+    if not isinstance(start, int):
+        addr = ipaddress.ip_address(start)
+        version = addr.version
+        start = int(addr)
+
+    if not isinstance(end, int):
+        addr = ipaddress.ip_address(end)
+        if addr.version != version:
+            raise TypeError('range_to_netints error: IP types must be same')
+        end = int(addr)
+
+    max_prefixlen = 32 if version == 4 else 128
+    if not 0 <= start <= end < 1 << max_prefixlen:
+        raise ValueError(f'range_to_netints error: bad range {start} - {end}')
+
+    blocks = interval_to_blocks(start, end, max_prefixlen)
+    return [NetInt(version, num, pfx) for (num, pfx) in blocks]
@@ -5,8 +5,19 @@ Tools interacting with RFC 1918
 """
 # pylint: disable=invalid-name
 from .cidr_types import IPvxNetwork
-from ._cidr_subnet import (cidr_is_subnet)
 from ._cidr_nets import (cidrs_to_nets)
+from ._cidr_intervals import (cidr_to_interval)
+from ._special import (SPECIAL_CIDRS, special_kind)
+
+
+def _is_rfc_1918(cidr: str) -> bool:
+    """
+    True if cidr is RFC 1918 - raises ValueError if cidr is invalid.
+    """
+    kind = special_kind(cidr)
+    if not kind and cidr_to_interval(cidr) is None:
+        raise ValueError(f'{cidr!r} does not appear to be an IPv4 or IPv6 network')
+    return kind == 'rfc_1918'
 
 
 def is_rfc_1918(cidr: str) -> bool:
@@ -25,10 +36,7 @@ def is_rfc_1918(cidr: str) -> bool:
     if not cidr:
         return False
 
-    rfc_1918 = rfc_1918_nets()
-    if cidr_is_subnet(cidr, rfc_1918):
-        return True
-    return False
+    return _is_rfc_1918(cidr)
 
 
 def rfc_1918_nets() -> list[IPvxNetwork]:
@@ -52,7 +60,7 @@ def rfc_1918_cidrs() -> list[str]:
         list[str]:
         list of RFC 1918 networks as cidr strings
     """
-    rfc_1918s = ['10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16']
+    rfc_1918s = list(SPECIAL_CIDRS['rfc_1918'])
     return rfc_1918s
 
 
@@ -81,8 +89,6 @@ def remove_rfc_1918(cidrs_in: str | list[str]
     if not cidrs_in:
         return (cidrs_in, [])
 
-    rfc_1918 = rfc_1918_nets()
-
     #
     # input is list of cidrs
     #
@@ -91,7 +97,7 @@ def remove_rfc_1918(cidrs_in: str | list[str]
 
         found_1918 = [
                 cidr for cidr in cidrs_in
-                if cidr_is_subnet(cidr, rfc_1918)
+                if _is_rfc_1918(cidr)
                 ]
         if found_1918:
             set_1918 = set(found_1918)
@@ -101,6 +107,6 @@ def remove_rfc_1918(cidrs_in: str | list[str]
         return (cidrs_in, [])
 
     # input is one cidr
-    if cidr_is_subnet(cidrs_in,  rfc_1918):
+    if _is_rfc_1918(cidrs_in):
         return ('', cidrs_in)
     return (cidrs_in, [])
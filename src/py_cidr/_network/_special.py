@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Special purpose address registry.
+
+RFC 1918 and the other IANA special purpose / reserved networks,
+compiled once at import into sorted integer intervals (one list per
+IP version) each tagged with its kind. Classifying a cidr is then
+a parse plus a binary search. With numpy, large batches have their
+ipv4 cidrs parsed and looked up with vectorized code.
+"""
+from typing import (Any, Iterable)
+from bisect import bisect_right
+
+from py_cidr._utils import (have_numpy, require_numpy, NUMPY_MIN_ITEMS)
+
+from ._cidr_intervals import (cidr_to_interval, parse_ip4_array_exact)
+
+# networks of each kind do not overlap any other kind
+SPECIAL_CIDRS: dict[str, tuple[str, ...]] = {
+    'rfc_1918': ('10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16'),
+    'loopback': ('127.0.0.0/8', '::1/128'),
+    'link_local': ('169.254.0.0/16', 'fe80::/10'),
+    'cgnat': ('100.64.0.0/10',),
+    'documentation': ('192.0.2.0/24', '198.51.100.0/24', '203.0.113.0/24',
+                      '2001:db8::/32', '3fff::/20'),
+    'ula': ('fc00::/7',),
+    'multicast': ('224.0.0.0/4', 'ff00::/8'),
+    'bogon': ('0.0.0.0/8', '192.0.0.0/24', '198.18.0.0/15', '240.0.0.0/4',
+              '::/128', '::ffff:0:0/96', '100::/64', '2001:2::/48'),
+}
+
+SPECIAL_KINDS: tuple[str, ...] = tuple(SPECIAL_CIDRS)
+
+
+def _compile() -> dict[int, tuple[list[int], list[int], list[str]]]:
+    """
+    Per IP version: sorted (starts, ends, kinds) of every special network.
+    """
+    rows: dict[int, list[tuple[int, int, str]]] = {4: [], 6: []}
+    for (kind, cidrs) in SPECIAL_CIDRS.items():
+        for cidr in cidrs:
+            result = cidr_to_interval(cidr)
+            if result is None:
+                raise ValueError(f'Bad special cidr: {cidr}')
+            (version, (start, end)) = result
+            rows[version].append((start, end, kind))
+
+    index = {}
+    for (version, vrows) in rows.items():
+        vrows.sort()
+        index[version] = ([row[0] for row in vrows],
+                          [row[1] for row in vrows],
+                          [row[2] for row in vrows])
+    return index
+
+
+_INDEX = _compile()
+
+
+def special_kind(cidr: Any) -> str:
+    """
+    Special purpose kind of cidr.
+
+    Args:
+        cidr (Any):
+            IP address or cidr.
+
+    Returns:
+        str:
+            Kind (one of SPECIAL_KINDS) if every address of cidr
+            is in that special network, else empty string.
+            Invalid cidr gives empty string.
+    """
+    result = cidr_to_interval(cidr)
+    if result is None:
+        return ''
+
+    (version, (start, end)) = result
+    (starts, ends, kinds) = _INDEX[version]
+    idx = bisect_right(starts, start) - 1
+    if idx >= 0 and end <= ends[idx]:
+        return kinds[idx]
+    return ''
+
+
+def _classify_special_numpy(cidrs: list[Any]) -> list[str]:
+    """
+    Vectorized classify_special().
+    """
+    # pylint: disable=too-many-locals
+    np = require_numpy('classify_special')
+    (starts, ends, kinds) = _INDEX[4]
+    np_starts = np.array(starts, dtype=np.int64)
+    np_ends = np.array(ends, dtype=np.int64)
+
+    (addrs, prefixlens, not_ip4) = parse_ip4_array_exact(cidrs)
+    addrs = addrs.astype(np.int64)
+    last = addrs + (np.int64(1) << (32 - prefixlens.astype(np.int64))) - 1
+
+    idx = np.searchsorted(np_starts, addrs, side='right') - 1
+    found = idx >= 0
+    idx[~found] = 0
+    found &= last <= np_ends[idx]
+
+    np_kinds = np.array([''] + kinds, dtype=object)
+    result = np_kinds[np.where(found, idx + 1, 0)].tolist()
+    for row in np.flatnonzero(not_ip4).tolist():
+        result[row] = special_kind(cidrs[row])
+    return result
+
+
+def classify_special(cidrs: Iterable[Any]) -> list[str]:
+    """
+    Special purpose kind of each cidr.
+
+    Args:
+        cidrs (Iterable[Any]):
+            IP addresses or cidrs - may be mixed ipv4 and ipv6.
+
+    Returns:
+        list[str]:
+            special_kind() of each cidr in input order.
+    """
+    cidrs = list(cidrs)
+    if not have_numpy() or len(cidrs) < NUMPY_MIN_ITEMS:
+        return [special_kind(cidr) for cidr in cidrs]
+    return _classify_special_numpy(cidrs)
+
+
+def remove_special(cidrs: Iterable[Any], kinds: Iterable[str] | None = None
+                   ) -> tuple[list[Any], list[Any]]:
+    """
+    Split out special purpose cidrs.
+
+    Args:
+        cidrs (Iterable[Any]):
+            IP addresses or cidrs - may be mixed ipv4 and ipv6.
+
+        kinds (Iterable[str] | None):
+            Kinds to remove, default is all of SPECIAL_KINDS.
+            Unknown kind raises ValueError.
+
+    Returns:
+        tuple[list[Any], list[Any]]:
+            (kept, removed) each in input order.
+            Invalid cidrs are kept.
+    """
+    remove = set(SPECIAL_KINDS if kinds is None else kinds)
+    unknown = remove - set(SPECIAL_KINDS)
+    if unknown:
+        raise ValueError(f'Unknown special kind(s) {sorted(unknown)} - use any of {SPECIAL_KINDS}')
+
+    cidrs = list(cidrs)
+    kept: list[Any] = []
+    removed: list[Any] = []
+    for (cidr, kind) in zip(cidrs, classify_special(cidrs)):
+        if kind in remove:
+            removed.append(cidr)
+        else:
+            kept.append(cidr)
+    return (kept, removed)
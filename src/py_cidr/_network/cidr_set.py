@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+CidrSet: immutable set of networks indexed for fast membership tests.
+
+Built once from a list of cidrs (or nets) as sorted, merged integer
+intervals (one list per IP version). A membership test is then one
+parse plus a binary search, instead of a scan of the whole list.
+With numpy, contains_many() tests a batch of ipv4 addresses with
+vectorized parsing and searchsorted.
+"""
+from typing import (Any, Iterable, Iterator)
+from bisect import bisect_right
+
+from py_cidr._utils import (have_numpy, require_numpy, NUMPY_MIN_ITEMS)
+
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (cidrs_to_merged_intervals, cidr_to_interval)
+from ._cidr_intervals import (intervals_to_blocks, intervals_to_cidrs)
+from ._cidr_intervals import (parse_ip4_array_exact)
+
+
+class CidrSet:
+    """
+    Immutable set of IPv4 and IPv6 networks for bulk membership tests.
+
+    contains() is O(log n) in the number of networks.
+    For a set that changes, use CompactSet.
+
+    Args:
+        cidrs (Iterable[Any]):
+            cidr strings or IPvxNetwork - may be mixed ipv4 and ipv6.
+            Host bits are ignored. Raises ValueError if any is invalid.
+    """
+    def __init__(self, cidrs: Iterable[Any] = ()):
+        (ivs4, ivs6, invalid) = cidrs_to_merged_intervals(list(cidrs))
+        if invalid:
+            raise ValueError(f'Bad cidr input invalid: {invalid[0]}')
+
+        self._starts4: list[int] = [start for (start, _end) in ivs4]
+        self._ends4: list[int] = [end for (_start, end) in ivs4]
+        self._starts6: list[int] = [start for (start, _end) in ivs6]
+        self._ends6: list[int] = [end for (_start, end) in ivs6]
+        self._num_prefixes: int = (len(intervals_to_blocks(ivs4, 32))
+                                   + len(intervals_to_blocks(ivs6, 128)))
+
+        # numpy (starts, ends) of ipv4 - made on first use
+        self._arrays4: tuple[Any, Any] | None = None
+
+    def contains(self, ip: Any) -> bool:
+        """
+        Check if ip (or every address of a cidr) is in the set.
+
+        Args:
+            ip (Any):
+                IP address or cidr string (or IPvxAddress / IPvxNetwork).
+
+        Returns:
+            bool:
+                True if in the set. Invalid ip is never in the set.
+        """
+        result = cidr_to_interval(ip)
+        if result is None:
+            return False
+
+        (version, (start, end)) = result
+        (starts, ends) = ((self._starts4, self._ends4) if version == 4
+                          else (self._starts6, self._ends6))
+        idx = bisect_right(starts, start) - 1
+        return idx >= 0 and end <= ends[idx]
+
+    def contains_many(self, ips: Iterable[Any], as_numpy: bool = False) -> Any:
+        """
+        Check each of a list of ips (or cidrs).
+
+        With numpy, large batches have their ipv4 addresses parsed
+        and looked up with vectorized code - only the rest (ipv6
+        and invalid) are checked one at a time.
+
+        Args:
+            ips (Iterable[Any]):
+                IP addresses or cidr strings.
+
+            as_numpy (bool):
+                If true return a numpy bool array (requires numpy).
+
+        Returns:
+            list[bool] | np.ndarray[bool]:
+                True for each ip in the set, in input order.
+        """
+        ips = list(ips)
+        if not have_numpy() or len(ips) < NUMPY_MIN_ITEMS:
+            found = [self.contains(ip) for ip in ips]
+            if as_numpy:
+                np = require_numpy('CidrSet.contains_many')
+                return np.array(found, dtype=bool)
+            return found
+
+        mask = self._contains_many_numpy(ips)
+        return mask if as_numpy else mask.tolist()
+
+    def _contains_many_numpy(self, ips: list[Any]) -> Any:
+        """
+        Vectorized contains_many().
+        """
+        np = require_numpy('CidrSet.contains_many')
+        if self._arrays4 is None:
+            self._arrays4 = (np.array(self._starts4, dtype=np.int64),
+                             np.array(self._ends4, dtype=np.int64))
+        (starts, ends) = self._arrays4
+
+        (addrs, prefixlens, not_ip4) = parse_ip4_array_exact(ips)
+        addrs = addrs.astype(np.int64)
+        last = addrs + (np.int64(1) << (32 - prefixlens.astype(np.int64))) - 1
+
+        mask = np.zeros(len(ips), dtype=bool)
+        if len(starts) > 0:
+            idx = np.searchsorted(starts, addrs, side='right') - 1
+            found = idx >= 0
+            idx[~found] = 0
+            mask = found & (last <= ends[idx])
+
+        rest = np.flatnonzero(not_ip4)
+        mask[rest] = [self.contains(ips[idx]) for idx in rest.tolist()]
+        return mask
+
+    def intervals(self) -> tuple[list[Interval], list[Interval]]:
+        """
+        Merged (start, end) integer intervals.
+
+        Returns:
+            tuple[list[Interval], list[Interval]]:
+                (ip4_intervals, ip6_intervals)
+        """
+        return (list(zip(self._starts4, self._ends4)),
+                list(zip(self._starts6, self._ends6)))
+
+    def to_cidrs(self) -> list[str]:
+        """
+        Minimal list of cidrs, ipv4 before ipv6.
+        """
+        (ivs4, ivs6) = self.intervals()
+        return intervals_to_cidrs(ivs4, 4) + intervals_to_cidrs(ivs6, 6)
+
+    def __contains__(self, ip: Any) -> bool:
+        return self.contains(ip)
+
+    def __len__(self) -> int:
+        """
+        Number of prefixes in to_cidrs().
+        """
+        return self._num_prefixes
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the compacted cidrs, ipv4 before ipv6.
+        """
+        return iter(self.to_cidrs())
+
+    def __repr__(self) -> str:
+        return f'CidrSet({len(self)} prefixes)'
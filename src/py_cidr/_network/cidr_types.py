@@ -8,6 +8,8 @@ are based on ipaddress types:
 
   IPv4Network, IPv6Network, IPv4Address and IPv6Address.
 
+CidrLike is any single cidr input: string, IPvxNetwork or IPvxAddress.
+
 """
 from typing import Any
 from ipaddress import (IPv4Network, IPv6Network, IPv4Address, IPv6Address)
@@ -15,6 +17,7 @@ from ipaddress import (IPv4Network, IPv6Network, IPv4Address, IPv6Address)
 type IPvxNetwork = IPv4Network | IPv6Network
 type IPvxAddress = IPv4Address | IPv6Address
 type IPAddress = IPvxAddress | str
+type CidrLike = IPAddress | IPvxNetwork
 
 type IPv4 = IPv4Address | IPv4Network
 type IPv6 = IPv6Address | IPv6Network
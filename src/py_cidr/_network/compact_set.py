@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+CompactSet: mutable set of networks that is always compacted.
+
+Instead of re-compacting the whole list after every batch, networks are
+kept as merged integer intervals (one sorted list per IP version).
+An add or discard is a bisect plus a merge with its neighbours.
+The number of prefixes and addresses are kept up to date as we go,
+so len() and num_addresses() are O(1).
+
+Finding the place to update is O(log N) but the update itself is a
+list slice assignment, which shifts the tail of the list: O(N) memmove
+of pointers. This is fast in practice (about 0.5 ms per update with
+half a million intervals) but is not a logarithmic update.
+"""
+from typing import (Any, Iterable, Iterator)
+from bisect import (bisect_left, bisect_right)
+
+from .cidr_types import (IPvxNetwork)
+from ._cidr_intervals import (Interval)
+from ._cidr_intervals import (merge_intervals, cidrs_to_intervals, cidr_to_interval)
+from ._cidr_intervals import (interval_to_blocks, intervals_to_cidrs, intervals_to_nets)
+from ._cidr_intervals import (block_to_cidr)
+
+
+class _IntervalList:
+    """
+    Merged intervals of one IP version with running totals.
+
+    Parallel lists: starts and ends of each interval and the number of
+    cidr blocks each needs.
+    """
+    def __init__(self, max_prefixlen: int):
+        self.max_prefixlen: int = max_prefixlen
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.blocks: list[int] = []
+        self.num_prefixes: int = 0
+        self.num_addresses: int = 0
+
+    def _num_blocks(self, start: int, end: int) -> int:
+        return len(interval_to_blocks(start, end, self.max_prefixlen))
+
+    def _replace(self, lo: int, hi: int, intervals: list[Interval]):
+        """
+        Replace intervals lo to hi-1 with new ones and update totals.
+        O(N): slice assignment moves everything after hi.
+        """
+        for idx in range(lo, hi):
+            self.num_prefixes -= self.blocks[idx]
+            self.num_addresses -= self.ends[idx] - self.starts[idx] + 1
+
+        blocks = [self._num_blocks(start, end) for (start, end) in intervals]
+        for (start, end) in intervals:
+            self.num_addresses += end - start + 1
+        self.num_prefixes += sum(blocks)
+
+        self.starts[lo:hi] = [start for (start, _end) in intervals]
+        self.ends[lo:hi] = [end for (_start, end) in intervals]
+        self.blocks[lo:hi] = blocks
+
+    def add(self, start: int, end: int):
+        """
+        Add interval, merging with any it overlaps or touches.
+        """
+        # merge with intervals ending at or after start - 1
+        # and starting at or before end + 1
+        lo = bisect_left(self.ends, start - 1)
+        hi = bisect_right(self.starts, end + 1)
+        if lo < hi:
+            if hi - lo == 1 and self.starts[lo] <= start and end <= self.ends[lo]:
+                return
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self._replace(lo, hi, [(start, end)])
+
+    def discard(self, start: int, end: int):
+        """
+        Remove every address in interval.
+        """
+        lo = bisect_left(self.ends, start)
+        hi = bisect_right(self.starts, end)
+        if lo >= hi:
+            return
+
+        remain: list[Interval] = []
+        if self.starts[lo] < start:
+            remain.append((self.starts[lo], start - 1))
+        if self.ends[hi - 1] > end:
+            remain.append((end + 1, self.ends[hi - 1]))
+        self._replace(lo, hi, remain)
+
+    def contains(self, start: int, end: int) -> bool:
+        """
+        True if whole interval is in the list.
+        """
+        idx = bisect_right(self.starts, start) - 1
+        return idx >= 0 and end <= self.ends[idx]
+
+    def intervals(self) -> list[Interval]:
+        """
+        Merged intervals.
+        """
+        return list(zip(self.starts, self.ends))
+
+    def rebuild(self, intervals: list[Interval]):
+        """
+        Replace everything with merged intervals.
+        """
+        self.starts = []
+        self.ends = []
+        self.blocks = []
+        self.num_prefixes = 0
+        self.num_addresses = 0
+        self._replace(0, 0, intervals)
+
+
+class CompactSet:
+    """
+    Mutable set of IPv4 and IPv6 networks kept compacted.
+
+    Membership tests are O(log N). Each add() or discard() is a binary
+    search plus merging with neighbouring networks, then an O(N) list
+    slice update (a memmove, so cheap even for large sets).
+    to_cidrs() gives the same list as Cidr.compact() of everything
+    added (less anything discarded).
+
+    Args:
+        cidrs (Iterable[Any] | None):
+            Optional initial cidrs (strings or IPvxNetwork).
+    """
+    def __init__(self, cidrs: Iterable[Any] | None = None):
+        self._ip4 = _IntervalList(32)
+        self._ip6 = _IntervalList(128)
+        if cidrs is not None:
+            self.add_many(cidrs)
+
+    def _family(self, version: int) -> _IntervalList:
+        return self._ip4 if version == 4 else self._ip6
+
+    def add(self, cidr: Any):
+        """
+        Add one cidr.
+
+        Args:
+            cidr (Any):
+                cidr string or IPvxNetwork. Host bits are ignored.
+                Raises ValueError if not valid.
+        """
+        result = cidr_to_interval(cidr)
+        if result is None:
+            raise ValueError(f'Bad cidr input invalid: {cidr}')
+        (version, (start, end)) = result
+        self._family(version).add(start, end)
+
+    def add_many(self, cidrs: Iterable[Any]):
+        """
+        Add list of cidrs.
+
+        Small batches are added one at a time while large ones
+        are merged in with one sort.
+
+        Args:
+            cidrs (Iterable[Any]):
+                cidr strings or IPvxNetwork.
+                Raises ValueError, and nothing is added, if any is invalid.
+        """
+        (ivs4, ivs6, invalid) = cidrs_to_intervals(cidrs)
+        if invalid:
+            raise ValueError(f'Bad cidr input invalid: {invalid[0]}')
+
+        for (family, ivs) in ((self._ip4, ivs4), (self._ip6, ivs6)):
+            if len(ivs) * 8 < len(family.starts):
+                for (start, end) in ivs:
+                    family.add(start, end)
+            elif ivs:
+                family.rebuild(merge_intervals(family.intervals() + ivs))
+
+    def discard(self, cidr: Any):
+        """
+        Remove every address of cidr from the set.
+
+        cidr need not have been added: any part of it in the set
+        is removed, splitting larger networks as needed.
+
+        Args:
+            cidr (Any):
+                cidr string or IPvxNetwork. Raises ValueError if not valid.
+        """
+        result = cidr_to_interval(cidr)
+        if result is None:
+            raise ValueError(f'Bad cidr input invalid: {cidr}')
+        (version, (start, end)) = result
+        self._family(version).discard(start, end)
+
+    def clear(self):
+        """
+        Remove everything.
+        """
+        self._ip4 = _IntervalList(32)
+        self._ip6 = _IntervalList(128)
+
+    def num_addresses(self, version: int | None = None) -> int:
+        """
+        Number of addresses in the set.
+
+        Args:
+            version (int | None):
+                4 or 6 to count just that IP version, else both.
+
+        Returns:
+            int:
+                Number of addresses.
+        """
+        match version:
+            case 4:
+                return self._ip4.num_addresses
+            case 6:
+                return self._ip6.num_addresses
+        return self._ip4.num_addresses + self._ip6.num_addresses
+
+    def intervals(self) -> tuple[list[Interval], list[Interval]]:
+        """
+        Merged (start, end) integer intervals.
+
+        Returns:
+            tuple[list[Interval], list[Interval]]:
+                (ip4_intervals, ip6_intervals)
+        """
+        return (self._ip4.intervals(), self._ip6.intervals())
+
+    def to_cidrs(self) -> list[str]:
+        """
+        Current minimal list of cidrs, ipv4 before ipv6.
+        """
+        return (intervals_to_cidrs(self._ip4.intervals(), 4)
+                + intervals_to_cidrs(self._ip6.intervals(), 6))
+
+    def to_nets(self) -> list[IPvxNetwork]:
+        """
+        Current minimal list of networks, ipv4 before ipv6.
+        """
+        return (intervals_to_nets(self._ip4.intervals(), 4)
+                + intervals_to_nets(self._ip6.intervals(), 6))
+
+    def __contains__(self, cidr: Any) -> bool:
+        """
+        True if every address of cidr (or ip) is in the set.
+        Invalid cidr is never in the set.
+        """
+        result = cidr_to_interval(cidr)
+        if result is None:
+            return False
+        (version, (start, end)) = result
+        return self._family(version).contains(start, end)
+
+    def __len__(self) -> int:
+        """
+        Number of prefixes in to_cidrs().
+        """
+        return self._ip4.num_prefixes + self._ip6.num_prefixes
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the compacted cidrs, ipv4 before ipv6.
+        """
+        for (version, family) in ((4, self._ip4), (6, self._ip6)):
+            for (start, end) in family.intervals():
+                for (num, prefixlen) in interval_to_blocks(start, end, family.max_prefixlen):
+                    yield block_to_cidr(num, prefixlen, version)
+
+    def __repr__(self) -> str:
+        return f'CompactSet({len(self)} prefixes)'
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+NetInt: compact integer backed network.
+
+A NetInt is a plain tuple (version, network_int, prefixlen).
+Compared with IPv4Network / IPv6Network it is much smaller,
+much quicker to create and compares/sorts as a tuple using plain integers.
+Tuple order is the same order as ipaddress.get_mixed_type_key().
+"""
+from typing import (Any, NamedTuple, Self)
+from ipaddress import (IPv4Network, IPv6Network)
+
+from .cidr_types import (IPvxNetwork)
+from ._cidr_classify import string_to_net
+from ._cidr_intervals import block_to_cidr
+
+
+class NetInt(NamedTuple):
+    """
+    Integer based network.
+
+    Attributes:
+        version (int):
+            4 or 6
+
+        network_int (int):
+            The network address as an integer. Host bits are always zero.
+
+        prefixlen (int):
+            The network prefix length.
+    """
+    version: int
+    network_int: int
+    prefixlen: int
+
+    @property
+    def max_prefixlen(self) -> int:
+        """ 32 for ipv4 and 128 for ipv6 """
+        return 32 if self.version == 4 else 128
+
+    @property
+    def num_addresses(self) -> int:
+        """ Number of addresses in the network """
+        return 1 << (self.max_prefixlen - self.prefixlen)
+
+    @property
+    def start(self) -> int:
+        """ First address as integer """
+        return self.network_int
+
+    @property
+    def end(self) -> int:
+        """ Last address as integer """
+        return self.network_int + self.num_addresses - 1
+
+    def to_net(self) -> IPvxNetwork:
+        """ Convert to IPv4Network or IPv6Network """
+        return netint_to_net(self)
+
+    def __str__(self) -> str:
+        return netint_to_cidr(self)
+
+    @classmethod
+    def from_cidr(cls, cidr: str, strict: bool = False) -> Self:
+        """ Create from cidr string. Raises ValueError if invalid """
+        return cls(*cidr_to_netint(cidr, strict))
+
+    @classmethod
+    def from_net(cls, net: IPvxNetwork) -> Self:
+        """ Create from IPv4Network or IPv6Network """
+        return cls(net.version, int(net.network_address), net.prefixlen)
+
+
+def cidr_to_netint(cidr: Any, strict: bool = False) -> NetInt:
+    """
+    Convert cidr string to NetInt.
+
+    Args:
+        cidr (str):
+            Cidr string.
+
+        strict (bool):
+            If true then cidr is considered invalid if host bits are set.
+            Defaults to False, and host bits are zeroed.
+
+    Returns:
+        NetInt:
+            The NetInt for cidr. Raises ValueError if cidr not valid.
+    """
+    net = string_to_net(cidr, strict=strict)
+    return NetInt(net.version, int(net.network_address), net.prefixlen)
+
+
+def cidrs_to_netints(cidrs: list[str], strict: bool = False) -> list[NetInt]:
+    """
+    Convert list of cidr strings to list of NetInt.
+
+    Args:
+        cidrs (list[str]):
+            list of cidr strings.
+
+        strict (bool):
+            If true, then any cidr with host bits is invalid.
+
+    Returns:
+        list[NetInt]:
+            NetInts in same order as cidrs. Raises ValueError if any invalid.
+    """
+    if not cidrs:
+        return []
+    return [cidr_to_netint(cidr, strict) for cidr in cidrs]
+
+
+def net_to_netint(net: IPvxNetwork) -> NetInt:
+    """
+    Convert IPv4Network or IPv6Network to NetInt.
+    """
+    return NetInt(net.version, int(net.network_address), net.prefixlen)
+
+
+def nets_to_netints(nets: list[IPvxNetwork]) -> list[NetInt]:
+    """
+    Convert list of IPvxNetwork to list of NetInt.
+    """
+    if not nets:
+        return []
+    return [NetInt(net.version, int(net.network_address), net.prefixlen)
+            for net in nets]
+
+
+def netint_to_net(netint: NetInt) -> IPvxNetwork:
+    """
+    Convert NetInt to IPv4Network or IPv6Network.
+    """
+    (version, network_int, prefixlen) = netint
+    if version == 4:
+        return IPv4Network((network_int, prefixlen))
+    return IPv6Network((network_int, prefixlen))
+
+
+def netints_to_nets(netints: list[NetInt]) -> list[IPvxNetwork]:
+    """
+    Convert list of NetInt to list of IPvxNetwork.
+    """
+    if not netints:
+        return []
+    return [netint_to_net(netint) for netint in netints]
+
+
+def netint_to_cidr(netint: NetInt) -> str:
+    """
+    Convert NetInt to cidr string.
+
+    Same string as str(IPvxNetwork) would give.
+    """
+    (version, num, prefixlen) = netint
+    return block_to_cidr(num, prefixlen, version)
+
+
+def netints_to_cidrs(netints: list[NetInt]) -> list[str]:
+    """
+    Convert list of NetInt to list of cidr strings.
+    """
+    if not netints:
+        return []
+    return [netint_to_cidr(netint) for netint in netints]
@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Bounded LRU cache for parsed strings (cidr -> network, ip -> address).
+
+Useful when the same cidrs/ips are converted over and over
+(e.g. log enrichment). Off by default: turn on globally with
+parse_cache_enable() or pass a cache to the conversion functions.
+
+ipaddress networks/addresses are immutable so cached objects
+can be safely shared.
+"""
+from typing import (Any, Callable, NamedTuple)
+from collections import OrderedDict
+from collections.abc import Hashable
+import threading
+
+
+class CacheInfo(NamedTuple):
+    """
+    Cache statistics - similar to functools.lru_cache cache_info()
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """
+    Thread safe, size bounded, least recently used cache.
+
+    Args:
+        maxsize (int):
+            Maximum number of items kept. Least recently used
+            items are evicted when full.
+    """
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize: int = max(maxsize, 1)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable, parse: Callable[[], Any]) -> Any:
+        """
+        Return cached value for key or call parse() and cache its result.
+
+        Exceptions from parse() are passed on and nothing is cached.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        # parse outside the lock
+        value = parse()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def resize(self, maxsize: int):
+        """
+        Change the maximum size, evicting if needed.
+        """
+        with self._lock:
+            self.maxsize = max(maxsize, 1)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Empty the cache and reset statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns:
+            CacheInfo:
+            (hits, misses, evictions, maxsize, currsize)
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+#
+# Global caches - used when enabled (or when caller passes cache=True)
+#
+_NET_CACHE = ParseCache()
+_ADDR_CACHE = ParseCache()
+_ENABLED: bool = False
+
+
+def parse_cache_enable(maxsize: int = 4096):
+    """
+    Turn on the global parse caches.
+
+    Args:
+        maxsize (int):
+            Maximum size of each of the network and address caches.
+    """
+    # pylint: disable=global-statement
+    global _ENABLED
+    _NET_CACHE.resize(maxsize)
+    _ADDR_CACHE.resize(maxsize)
+    _ENABLED = True
+
+
+def parse_cache_disable(clear: bool = True):
+    """
+    Turn off the global parse caches.
+
+    Args:
+        clear (bool):
+            If True (default) the caches are also emptied.
+    """
+    # pylint: disable=global-statement
+    global _ENABLED
+    _ENABLED = False
+    if clear:
+        parse_cache_clear()
+
+
+def parse_cache_clear():
+    """
+    Empty the global parse caches and reset their statistics.
+    """
+    _NET_CACHE.clear()
+    _ADDR_CACHE.clear()
+
+
+def parse_cache_info() -> dict[str, CacheInfo]:
+    """
+    Statistics of the global parse caches.
+
+    Returns:
+        dict[str, CacheInfo]:
+        {'nets': CacheInfo, 'addresses': CacheInfo}
+    """
+    return {'nets': _NET_CACHE.cache_info(),
+            'addresses': _ADDR_CACHE.cache_info()}
+
+
+def choose_net_cache(cache: ParseCache | bool | None) -> ParseCache | None:
+    """
+    Cache to use for cidr -> network.
+
+    cache is a ParseCache to use it, True to use the global cache, False
+    for no cache or None to use the global cache only if enabled.
+    """
+    return _choose_cache(cache, _NET_CACHE)
+
+
+def choose_addr_cache(cache: ParseCache | bool | None) -> ParseCache | None:
+    """
+    Cache to use for ip -> address. See choose_net_cache().
+    """
+    return _choose_cache(cache, _ADDR_CACHE)
+
+
+def _choose_cache(cache: ParseCache | bool | None, global_cache: ParseCache
+                  ) -> ParseCache | None:
+    if cache is None:
+        return global_cache if _ENABLED else None
+
+    if isinstance(cache, ParseCache):
+        return cache
+
+    return global_cache if cache else None
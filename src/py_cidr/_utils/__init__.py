@@ -4,3 +4,5 @@ py_cidr utils
 from ._misc import print_dictionary
 from ._files import open_file
 from ._files import write_file_atomic
+from ._files import write_lines
+from ._numpy import (have_numpy, require_numpy, NUMPY_MIN_ITEMS)
@@ -4,10 +4,13 @@
 Atomic write file
  - caller responsible for any required locking
 """
+from typing import (Iterable, TextIO)
 import os
 import random
 import string
 
+_WRITE_LINES = 4096
+
 
 def open_file(path, mode, encoding=None):
     """
@@ -77,3 +80,33 @@ def write_file_atomic(data: str | bytes, fpath: str
         return (False, errors)
 
     return (True, None)
+
+
+def write_lines(lines: Iterable[str], fob: TextIO) -> int:
+    """
+    Write lines to fob, one per line, in batches of _WRITE_LINES.
+
+    Args:
+        lines (Iterable[str]):
+            Lines to write (without newline) - typically a generator.
+
+        fob (TextIO):
+            Where lines are written.
+
+    Returns:
+        int:
+            Number of lines written.
+    """
+    num = 0
+    batch: list[str] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= _WRITE_LINES:
+            num += len(batch)
+            fob.write('\n'.join(batch) + '\n')
+            batch = []
+
+    if batch:
+        num += len(batch)
+        fob.write('\n'.join(batch) + '\n')
+    return num
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: © 2025-present Gene C <arch@sapience.com>
+"""
+Optional numpy support.
+
+numpy is only needed for the vectorized (array) tools.
+Everything else works without it.
+"""
+from types import ModuleType
+
+np: ModuleType | None
+try:
+    import numpy
+    np = numpy
+except ImportError:
+    np = None
+
+# below this many items numpy set up costs more than it saves
+NUMPY_MIN_ITEMS = 1000
+
+
+def have_numpy() -> bool:
+    """
+    Returns True if numpy is available
+    """
+    return np is not None
+
+
+def require_numpy(what: str) -> ModuleType:
+    """
+    Return the numpy module or raise ImportError if not available.
+
+    Args:
+        what (str):
+            Name of the caller to use in error message.
+
+    Returns:
+        ModuleType:
+            numpy
+    """
+    if np is None:
+        raise ImportError(f'{what} requires numpy - please install it')
+    return np
@@ -3,13 +3,15 @@
 """
 Class providing some common CIDR utilities
 """
-# pylint: disable=too-many-public-methods
-from typing import Any
+# pylint: disable=too-many-public-methods,too-many-lines
+from typing import (Any, Iterable, Iterator, Sequence)
+from ipaddress import (IPv4Network, IPv6Network)
 
-from ._network.cidr_types import (IPvxNetwork, IPvxAddress, IPAddress)
+from ._network.cidr_types import (IPvxNetwork, IPvxAddress, IPAddress, CidrLike)
 
 from ._network._cidr_clean import (clean_cidr, clean_cidrs)
 from ._network._cidr_clean import (fix_cidr_host_bits, fix_cidrs_host_bits)
+from ._network._cidr_normalize import (NormalizeCounts, normalize_cidrs)
 
 from ._network._cidr_address import (ip_to_address, ips_to_addresses)
 from ._network._cidr_address import (addresses_to_ips, ipaddr_cidr_from_string)
@@ -22,24 +24,48 @@ from ._network._cidr_subnet import (cidrs2_minus_cidrs1, cidr_exclude)
 from ._network._cidr_sort import (sort_cidrs, sort_ips, sort_nets)
 from ._network._cidr_compact import (compact_cidrs_to_nets, compact_cidrs)
 from ._network._cidr_compact import (compact_nets)
+from ._network._cidr_aggregate import (aggregate_cidrs)
+from ._network._cidr_setops import (cidrs_union, cidrs_intersection)
+from ._network._cidr_setops import (cidrs_difference, cidrs_symmetric_difference)
+from ._network._cidr_overlaps import (Overlaps, find_overlaps)
 
 from ._network._cidr_nets import (cidr_to_net, cidrs_to_nets, nets_to_cidrs)
 from ._network._cidr_nets import (address_to_net, net_to_cidr)
+from ._network._cidr_nets import (iter_cidrs_to_nets)
+from ._network._cidr_nets import (parse_ip4_array, ip4_array_to_cidrs)
+from ._network._cidr_nets import (parse_ip6_array, ip6_array_to_cidrs)
 
 from ._network._cidr_range import (range_to_cidrs, range_to_nets)
 from ._network._cidr_range import (net_to_range_cidrs, net_to_range_nets)
 from ._network._cidr_range import (cidr_to_range_cidrs, cidr_to_range_nets)
 
 from ._network._cidr_range_split import (cidr_range_split, net_range_split)
+from ._network._cidr_ranges import (ranges_to_cidrs, cidrs_to_ranges)
 
 from ._network._cidr_valid import (is_valid_ip4, is_valid_ip6, is_valid_cidr)
+from ._network._cidr_valid import (is_valid_cidrs)
 from ._network._cidr_valid import (cidr_iptype, cidr_type_network)
 from ._network._cidr_valid import (address_iptype)
 
 from ._network._rfc_1918 import (is_rfc_1918, rfc_1918_nets, rfc_1918_cidrs)
 from ._network._rfc_1918 import (remove_rfc_1918)
+from ._network._special import (classify_special, remove_special)
 
 from ._network._cidr_split_type import cidrs_split_type
+from ._network._cidr_classify import classify_cidrs
+
+from ._network.parse_cache import (ParseCache, CacheInfo)
+from ._network.parse_cache import (parse_cache_enable, parse_cache_disable)
+from ._network.parse_cache import (parse_cache_clear, parse_cache_info)
+
+from ._network.net_int import NetInt
+from ._network.net_int import (cidr_to_netint, cidrs_to_netints)
+from ._network.net_int import (netint_to_cidr, netints_to_cidrs)
+from ._network.net_int import (net_to_netint, nets_to_netints)
+from ._network.net_int import (netint_to_net, netints_to_nets)
+from ._network._net_int_ops import (compact_netints, sort_netints)
+from ._network._net_int_ops import (netints_exclude, netint_is_subnet)
+from ._network._net_int_ops import (range_to_netints, netint_to_range)
 
 from ._network.ip_version import ip_version
 
@@ -95,7 +121,8 @@ class Cidr:
         return address_to_net(addr, strict)
 
     @staticmethod
-    def cidr_to_net(cidr: str, strict: bool = False) -> IPvxNetwork | None:
+    def cidr_to_net(cidr: str, strict: bool = False,
+                    cache: ParseCache | bool | None = None) -> IPvxNetwork | None:
         """
         Convert cidr string to ipaddress network.
 
@@ -107,15 +134,21 @@ class Cidr:
             If true then cidr is considered invalid if host bits are set.
             Defaults to False. (see ipaddress docs).
 
+            cache (ParseCache | bool | None):
+            Parse cache to use. None (default) uses the global cache if
+            enabled (see parse_cache_enable()), True always uses the global
+            cache, False never caches or pass your own ParseCache.
+
         Returns:
             IPvxNetwork | None:
             The ipaddress network derived from cidr string as
             IPvxNetwork = IPv4Network or IPv6Network or None if invalid.
         """
-        return cidr_to_net(cidr, strict)
+        return cidr_to_net(cidr, strict, cache)
 
     @staticmethod
-    def cidrs_to_nets(cidrs: list[str], strict: bool = False
+    def cidrs_to_nets(cidrs: list[str], strict: bool = False,
+                      cache: ParseCache | bool | None = None
                       ) -> list[IPvxNetwork]:
         """
         Convert list of cidr strings to list of IPvxNetwork.
@@ -127,19 +160,144 @@ class Cidr:
             strict (bool):
             If true, cidr with host bits set is invalid. Defaults to false.
 
+            cache (ParseCache | bool | None):
+            Parse cache to use - see cidr_to_net().
+
         Returns:
             list[IPvxNetwork]:
             list of IPvxNetworks generated from cidrs.
         """
-        return cidrs_to_nets(cidrs, strict)
+        return cidrs_to_nets(cidrs, strict, cache)
+
+    @staticmethod
+    def iter_cidrs_to_nets(cidrs: Iterable[Any], strict: bool = False,
+                           on_error: str = 'skip',
+                           errors: list[tuple[int, Any]] | None = None,
+                           cache: ParseCache | bool | None = None
+                           ) -> Iterator[IPvxNetwork]:
+        """
+        Lazily convert cidr strings to IPvxNetwork.
+
+        A bad cidr does not lose the rest of the batch (see cidrs_to_nets()).
+        cidrs may be any iterable including an open file.
+        Strings are stripped and empty ones are skipped.
+
+        Args:
+            cidrs (Iterable[Any]):
+            cidr strings
+
+            strict (bool):
+            If true, cidr with host bits set is invalid. Defaults to false.
+
+            on_error (str):
+            'skip' (default) drops invalid cidrs, 'collect' drops them and
+            appends (index, cidr) to errors, 'raise' raises ValueError
+            with the index of the invalid cidr.
+
+            errors (list[tuple[int, Any]] | None):
+            Where invalid cidrs are appended when on_error is 'collect'.
+
+            cache (ParseCache | bool | None):
+            Parse cache to use - see cidr_to_net().
+
+        Returns:
+            Iterator[IPvxNetwork]:
+            Generator of networks in input order.
+        """
+        return iter_cidrs_to_nets(cidrs, strict, on_error, errors, cache)
+
+    @staticmethod
+    def parse_ip4_array(cidrs: Sequence[str]) -> tuple[Any, Any, Any]:
+        """
+        Vectorized parse of ipv4 cidr strings into numpy arrays.
+
+        Much faster than cidrs_to_nets() for large lists as no
+        IPv4Network objects are created. Host bits are zeroed (strict=False).
+        Requires numpy.
+
+        Args:
+            cidrs (Sequence[str]):
+            list (or numpy array) of ipv4 cidr strings.
+
+        Returns:
+            tuple[addrs, prefixlens, invalid]:
+            numpy arrays of network addresses (uint32), prefix lengths (uint8)
+            and invalid mask (bool). Invalid rows have address and prefix of 0.
+        """
+        return parse_ip4_array(cidrs)
+
+    @staticmethod
+    def ip4_array_to_cidrs(addrs: Any, prefixlens: Any) -> list[str]:
+        """
+        Convert numpy arrays of ipv4 addresses and prefixes to cidr strings.
+
+        Inverse of parse_ip4_array(). Requires numpy.
+
+        Args:
+            addrs (np.ndarray[uint32]):
+            network addresses.
+
+            prefixlens (np.ndarray[uint8]):
+            prefix lengths.
+
+        Returns:
+            list[str]:
+            list of cidr strings.
+        """
+        return ip4_array_to_cidrs(addrs, prefixlens)
 
     @staticmethod
-    def nets_to_cidrs(nets: list[IPvxNetwork]) -> list[str]:
+    def parse_ip6_array(cidrs: Sequence[str]) -> tuple[Any, Any, Any, Any]:
+        """
+        Vectorized parse of ipv6 cidr strings into numpy arrays.
+
+        Each 128 bit network address is split into 2 uint64 (hi, lo).
+        Supports '::' compression and embedded ipv4 (::ffff:a.b.c.d).
+        Host bits are zeroed (strict=False). Requires numpy.
+
+        Args:
+            cidrs (Sequence[str]):
+            list (or numpy array) of ipv6 cidr strings.
+
+        Returns:
+            tuple[hi, lo, prefixlens, invalid]:
+            numpy arrays of upper and lower 64 bits of network addresses
+            (uint64), prefix lengths (uint8) and invalid mask (bool).
+            Invalid rows have all values 0.
+        """
+        return parse_ip6_array(cidrs)
+
+    @staticmethod
+    def ip6_array_to_cidrs(hi: Any, lo: Any, prefixlens: Any) -> list[str]:
+        """
+        Convert numpy arrays of ipv6 addresses and prefixes to cidr strings.
+
+        Inverse of parse_ip6_array(). Strings are canonical, same as
+        str(IPv6Network). Requires numpy.
+
+        Args:
+            hi (np.ndarray[uint64]):
+            upper 64 bits of network addresses.
+
+            lo (np.ndarray[uint64]):
+            lower 64 bits of network addresses.
+
+            prefixlens (np.ndarray[uint8]):
+            prefix lengths.
+
+        Returns:
+            list[str]:
+            list of cidr strings.
+        """
+        return ip6_array_to_cidrs(hi, lo, prefixlens)
+
+    @staticmethod
+    def nets_to_cidrs(nets: Sequence[IPvxNetwork]) -> list[str]:
         """
         Convert list of ipaddress networks to list of cidr strings.
 
         Args:
-            nets (list[IPvxNetwork]):
+            nets (Sequence[IPvxNetwork]):
             list of nets to convert.
 
         Returns:
@@ -166,7 +324,8 @@ class Cidr:
         return net_to_cidr(net)
 
     @staticmethod
-    def ip_to_address(ip: str) -> IPvxAddress | None:
+    def ip_to_address(ip: str, cache: ParseCache | bool | None = None
+                      ) -> IPvxAddress | None:
         """
         Return ipaddress of given ip.
 
@@ -176,13 +335,17 @@ class Cidr:
             ip (str):
             The IP string to convert
 
+            cache (ParseCache | bool | None):
+            Parse cache to use - see cidr_to_net().
+
             Rreturns (IPvxAddress | None):
             IPvxAddress derived from IP or None if not an IP address.
         """
-        return ip_to_address(ip)
+        return ip_to_address(ip, cache)
 
     @staticmethod
-    def ips_to_addresses(ips: list[str]) -> list[IPvxAddress]:
+    def ips_to_addresses(ips: list[str], cache: ParseCache | bool | None = None
+                         ) -> list[IPvxAddress]:
         """
         Convert list of IP strings to a list of ip addresses
 
@@ -190,11 +353,60 @@ class Cidr:
             ips (list[str]):
             list of IP strings to convert
 
+            cache (ParseCache | bool | None):
+            Parse cache to use - see cidr_to_net().
+
         Returns:
             list[IPvxAddress]:
             list of IPvxAddress derived from input IPs.
         """
-        return ips_to_addresses(ips)
+        return ips_to_addresses(ips, cache)
+
+    @staticmethod
+    def parse_cache_enable(maxsize: int = 4096):
+        """
+        Turn on global LRU caching of parsed cidr and ip strings.
+
+        Once on, cidr_to_net(), cidrs_to_nets(), ip_to_address(),
+        ip_version() and so CidrMap lookups all use the cache.
+        Off by default. Thread safe.
+
+        Args:
+            maxsize (int):
+            Maximum number of items in each of the network
+            and address caches.
+        """
+        parse_cache_enable(maxsize)
+
+    @staticmethod
+    def parse_cache_disable(clear: bool = True):
+        """
+        Turn off global parse caching.
+
+        Args:
+            clear (bool):
+            If True (default) the caches are emptied as well.
+        """
+        parse_cache_disable(clear)
+
+    @staticmethod
+    def parse_cache_clear():
+        """
+        Empty the global parse caches and reset their statistics.
+        """
+        parse_cache_clear()
+
+    @staticmethod
+    def parse_cache_info() -> dict[str, CacheInfo]:
+        """
+        Statistics for global parse caches.
+
+        Returns:
+            dict[str, CacheInfo]:
+            {'nets': CacheInfo, 'addresses': CacheInfo}
+            where CacheInfo is (hits, misses, evictions, maxsize, currsize).
+        """
+        return parse_cache_info()
 
     @staticmethod
     def addresses_to_ips(addresses: list[IPvxAddress]) -> list[str]:
@@ -326,7 +538,8 @@ class Cidr:
         return compact_cidrs_to_nets(cidrs)
 
     @staticmethod
-    def compact_cidrs_to_cidrs(cidrs: list[str]) -> list[str]:
+    def compact_cidrs_to_cidrs(cidrs: list[str], engine: str = 'ipaddress'
+                               ) -> list[str]:
         """
         Compact list of cidr networks and return list of cidr strings
 
@@ -334,10 +547,11 @@ class Cidr:
         With single return type this is helpful when using
         type annotation checkers.
         """
-        return compact_cidrs(cidrs)
+        return compact_cidrs(cidrs, engine)
 
     @staticmethod
-    def compact_cidrs(cidrs: list[str], nets: bool = False
+    def compact_cidrs(cidrs: list[str], nets: bool = False,
+                      engine: str = 'ipaddress'
                       ) -> list[str] | list[IPvxNetwork]:
         """
         Compact a list of cidr networks as strings.
@@ -350,17 +564,21 @@ class Cidr:
             If False, the default, the result will be list of strings
             else a list of IPvxNetwork's.
 
+            engine (str):
+            Compaction engine - see compact().
+
         Returns:
             list[str | IPvxNetwork]:
             A list of compacted networks whose elements are strings
             if return_nets is False or IPvxNetworks if True.
         """
         if nets:
-            return compact_cidrs_to_nets(cidrs)
-        return compact_cidrs(cidrs)
+            return compact_cidrs_to_nets(cidrs, engine)
+        return compact_cidrs(cidrs, engine)
 
     @staticmethod
-    def compact_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
+    def compact_nets(nets: list[IPvxNetwork], engine: str = 'ipaddress'
+                     ) -> list[IPvxNetwork]:
         """
         Compact list of IPvxNetwork.
 
@@ -368,11 +586,14 @@ class Cidr:
             nets (list[IPvxNetwork]):
             Input list if networks to compact.
 
+            engine (str):
+            Compaction engine - see compact().
+
         Returns:
             list[IPvxNetwork]:
             Compacted list of IPvxNetworks.
         """
-        return compact_nets(nets)
+        return compact_nets(nets, engine)
 
     @staticmethod
     def net_exclude(net1: IPvxNetwork, nets2: list[IPvxNetwork]
@@ -419,23 +640,28 @@ class Cidr:
         return nets_exclude(nets1, nets2)
 
     @staticmethod
-    def cidrs_exclude(cidrs1: list[str], cidrs2: list[str]) -> list[str]:
+    def cidrs_exclude(cidrs1: Sequence[CidrLike], cidrs2: Sequence[CidrLike]) -> list[str]:
         """ Deprecated: replaced by cidrs2_minus_cidrs1()"""
         return cidrs_exclude(cidrs1, cidrs2)
 
     @staticmethod
-    def cidrs2_minus_cidrs1(cidrs1: list[str], cidrs2: list[str]) -> list[str]:
+    def cidrs2_minus_cidrs1(cidrs1: Sequence[CidrLike], cidrs2: Sequence[CidrLike]
+                            ) -> list[str]:
         """
         Exclude all of cidrs1 from cidrs2.
 
         i.e. return "cidrs2" - "cidrs1".
 
+        Done as a single sweep over sorted integer intervals,
+        so cost is O(n log n) in the total number of cidrs.
+        Result is compacted, ipv4 before ipv6.
+
         Args:
-            cidrs1 (list[str]):
-            list of cidr strings to be excluded.
+            cidrs1 (Sequence[CidrLike]):
+            list of cidrs (strings, IPvxNetwork or IPvxAddress) to be excluded.
 
-            cidrs2 (list[str]):
-            list of cidr strings from which cidrs1 are excluded.
+            cidrs2 (Sequence[CidrLike]):
+            list of cidrs from which cidrs1 are excluded.
 
         Returns:
             list[str]:
@@ -445,7 +671,7 @@ class Cidr:
         return cidrs2_minus_cidrs1(cidrs1, cidrs2)
 
     @staticmethod
-    def cidr_exclude(cidr1: str, cidrs2: list[str]) -> list[str]:
+    def cidr_exclude(cidr1: str, cidrs2: Sequence[CidrLike]) -> list[str]:
         """
         Exclude cidr1 from any of networks in cidrs2.
 
@@ -453,8 +679,9 @@ class Cidr:
             cidr1 (str):
             cidr to be excluded.
 
-            cidrs2 (list[str]):
-            list fo cidrs from which cidr1 will be excluded.
+            cidrs2 (Sequence[CidrLike]):
+            list of cidrs (strings, IPvxNetwork or IPvxAddress)
+            from which cidr1 will be excluded.
 
         Returns:
             list[str]:
@@ -463,22 +690,30 @@ class Cidr:
         return cidr_exclude(cidr1, cidrs2)
 
     @staticmethod
-    def sort_cidrs(cidrs: list[str]) -> list[str]:
+    def sort_cidrs(cidrs: list[str], reformat: bool = True) -> list[str]:
         """
         Sort the list of cidr strings.
 
+        Each cidr is parsed once to an integer key (no IPvxNetwork objects),
+        ipv4 before ipv6. Large ipv4 lists are sorted with numpy if available.
+
         Args:
             cidrs (list[str]):
-            list of cidrs.
+            list of cidrs. Any invalid cidr raises ValueError.
+
+            reformat (bool):
+            If True (default) cidrs are returned in standard form
+            with host bits cleared (e.g. '10.0.0.0/8').
+            If False the original strings are returned, just sorted.
 
         Returns:
             list[str]:
             Sorted copy of cidr list
         """
-        return sort_cidrs(cidrs)
+        return sort_cidrs(cidrs, reformat)
 
     @staticmethod
-    def sort_ips(ips: list[str]) -> list[str]:
+    def sort_ips(ips: list[str], reformat: bool = True) -> list[str]:
         """
         Sort a list of IP addresses.
 
@@ -486,11 +721,15 @@ class Cidr:
             ips (list[str]):
             list of ips to be sorted.
 
+            reformat (bool):
+            If True (default) ips are returned in standard form
+            without any prefix. If False the original strings are returned.
+
         Returns:
             list[str]:
             Sorted copy of ips.
         """
-        return sort_ips(ips)
+        return sort_ips(ips, reformat)
 
     @staticmethod
     def sort_nets(nets: list[IPvxNetwork]) -> list[IPvxNetwork]:
@@ -611,6 +850,44 @@ class Cidr:
         """
         return fix_cidrs_host_bits(cidrs, verb)
 
+    @staticmethod
+    def normalize(cidrs: list[str], *, fix_host_bits: bool = True,
+                  dedupe: bool = True, sort: bool = True, compact: bool = True
+                  ) -> tuple[list[str], NormalizeCounts]:
+        """
+        Clean, fix host bits, dedupe, sort and compact in one pass.
+
+        Same result as clean_cidrs() followed by fix_cidrs_host_bits(),
+        sort_cidrs() and compact_cidrs() but each cidr is parsed just once
+        and strings are only formatted at the end.
+
+        Args:
+            cidrs (list[str]):
+            list of cidr strings - can be mixed ipv4/ipv6.
+            Invalid cidrs are cleaned up if possible (see clean_cidr())
+            otherwise dropped.
+
+            fix_host_bits (bool):
+            Zero any host bits. Always done if compact is True.
+
+            dedupe (bool):
+            Remove duplicates (keeping the first).
+
+            sort (bool):
+            Sort result, ipv4 before ipv6.
+
+            compact (bool):
+            Compact result to the minimal list of cidrs.
+            The compacted list is always sorted.
+
+        Returns:
+            tuple[list[str], NormalizeCounts]:
+            (cidrs, counts) where counts is a NamedTuple of per stage counts:
+            input, invalid, cleaned, host_bits_fixed, duplicates, compacted
+            and output.
+        """
+        return normalize_cidrs(cidrs, fix_host_bits, dedupe, sort, compact)
+
     @staticmethod
     def is_valid_ip4(address: Any) -> bool:
         """
@@ -656,6 +933,25 @@ class Cidr:
         """
         return is_valid_cidr(address)
 
+    @staticmethod
+    def is_valid_cidrs(addresses: Iterable[Any]) -> list[bool]:
+        """
+        Check each of a list of addresses is a valid ip or cidr network.
+
+        Strings are checked without creating any ipaddress objects
+        or raising exceptions internally, so lists with lots of
+        junk (hostnames, comments etc) are cheap to check.
+
+        Args:
+            addresses (Iterable[Any]):
+            Addresses to check. Host bits set is permitted for a cidr network.
+
+        Returns:
+            list[bool]:
+            Mask with True for each valid IPv4 or IPv6 address or network.
+        """
+        return is_valid_cidrs(addresses)
+
     @staticmethod
     def cidr_iptype(address: Any) -> str:
         """
@@ -731,6 +1027,66 @@ class Cidr:
             return range_to_cidrs(addr_start, addr_end)
         return range_to_nets(addr_start, addr_end)
 
+    @staticmethod
+    def ranges_to_cidrs(starts: Sequence[Any], ends: Sequence[Any], ip_ver: int = 4
+                        ) -> tuple[list[str], list[int]]:
+        """
+        Convert many IP ranges to cidrs in one call.
+
+        Batch version of range_to_cidrs(). Ranges are split with integer
+        bit arithmetic - no ipaddress objects. With numpy, large batches
+        of ipv4 ranges are split with vectorized code.
+
+        Args:
+            starts (Sequence[Any]):
+            First IP of each range. IP strings, IPvxAddress or ints
+            (list or numpy array).
+
+            ends (Sequence[Any]):
+            Last IP (inclusive) of each range. Same length as starts.
+
+            ip_ver (int):
+            IP version (4 or 6) used for integer addresses. Default 4.
+
+        Returns:
+            tuple[list[str], list[int]]:
+            (cidrs, offsets). All cidrs in one flat list - those for
+            row i are cidrs[offsets[i]:offsets[i+1]].
+            Raises ValueError for an invalid IP or if a start is after its end,
+            and TypeError if start and end are different IP versions.
+        """
+        return ranges_to_cidrs(starts, ends, ip_ver)
+
+    @staticmethod
+    def cidrs_to_ranges(cidrs: Sequence[Any], merge: bool = True, as_numpy: bool = False
+                        ) -> tuple[Any, Any]:
+        """
+        Convert list of cidrs to integer (start, end) ranges.
+
+        Whole list version of cidr_to_range() giving plain integers.
+        Cidrs are parsed straight to integers - no ipaddress objects.
+
+        Args:
+            cidrs (Sequence[Any]):
+            list of cidrs (strings or IPvxNetwork) - can be mixed ipv4/ipv6.
+            Any bad cidr will raise ValueError.
+
+            merge (bool):
+            If True (default) ranges are sorted and overlapping or
+            adjacent ranges are coalesced.
+            If False there is one range per cidr, in input order.
+
+            as_numpy (bool):
+            If True return numpy arrays with shape (n, 2):
+            uint32 for ipv4 and object (python int) for ipv6.
+
+        Returns:
+            tuple[Any, Any]:
+            (ip4_ranges, ip6_ranges) each a list of (start_int, end_int)
+            tuples (inclusive) or numpy array if as_numpy.
+        """
+        return cidrs_to_ranges(cidrs, merge, as_numpy)
+
     @staticmethod
     def net_to_range(net: IPvxNetwork, string: bool = False
                      ) -> tuple[IPvxAddress | str | None,
@@ -875,6 +1231,52 @@ class Cidr:
         """
         return remove_rfc_1918(cidrs_in)
 
+    @staticmethod
+    def classify_special(cidrs: list[str]) -> list[str]:
+        """
+        Special purpose kind of each cidr.
+
+        Uses a registry compiled once at import, so each lookup is a
+        parse plus a binary search (vectorized for large ipv4 batches
+        when numpy is available).
+
+        Kinds are: 'rfc_1918', 'loopback', 'link_local', 'cgnat',
+        'documentation', 'ula', 'multicast' and 'bogon' (the rest of
+        the reserved space, e.g. 0.0.0.0/8, 240.0.0.0/4, benchmarking).
+
+        Args:
+            cidrs (list[str]):
+            IP addresses or cidr strings - can be mixed ipv4/ipv6.
+
+        Returns:
+            list[str]:
+            Kind of each cidr, in input order. Empty string if
+            cidr is not (entirely) inside one special network
+            or is invalid.
+        """
+        return classify_special(cidrs)
+
+    @staticmethod
+    def remove_special(cidrs: list[str], kinds: Iterable[str] | None = None
+                       ) -> tuple[list[str], list[str]]:
+        """
+        Remove special purpose cidrs (e.g. bogons) from list.
+
+        Args:
+            cidrs (list[str]):
+            IP addresses or cidr strings - can be mixed ipv4/ipv6.
+
+            kinds (Iterable[str] | None):
+            Kinds to remove (see classify_special()).
+            Default is every kind. Unknown kind raises ValueError.
+
+        Returns:
+            tuple[list[str], list[str]]:
+            (kept, removed) each in input order.
+            Invalid cidrs are kept.
+        """
+        return remove_special(cidrs, kinds)
+
     @staticmethod
     def cidrs_split_type(cidrs: list[str]
                          ) -> tuple[list[str], list[str], list[str]]:
@@ -891,14 +1293,53 @@ class Cidr:
         return cidrs_split_type(cidrs)
 
     @staticmethod
-    def compact(cidrs: list[str]) -> list[str]:
+    def classify_cidrs(cidrs: Iterable[str], strict: bool = False
+                       ) -> tuple[list[IPv4Network], list[IPv6Network], list[str]]:
+        """
+        Split cidrs into ipv4 and ipv6 networks, parsing each only once.
+
+        Similar to cidrs_split_type() but keeps the parsed networks
+        so they can be handed to compact_nets(), sort_nets(), nets_exclude()
+        etc. without parsing the same strings again.
+
+        Args:
+            cidrs (Iterable[str]):
+                cidr strings to classify.
+
+            strict (bool):
+                If true, cidr with host bits set is invalid. Defaults to false.
+
+        Returns:
+            tuple[list[IPv4Network], list[IPv6Network], list[str]]:
+                tuple (ip4_nets, ip6_nets, invalid) where invalid
+                is the list of input cidrs that are not valid.
+        """
+        return classify_cidrs(cidrs, strict)
+
+    @staticmethod
+    def compact(cidrs: Sequence[CidrLike], engine: str = 'ipaddress', workers: int = 1
+                ) -> list[str]:
         """
         Compact list of cidrs - can be mixed ipv4/ipv6.
         Returns 1 type, making type annotation simpler for caller.
 
         Args:
-            cidrs (list[str]):
-                Input list of cidr strings.
+            cidrs (Sequence[CidrLike]):
+                Input list of cidrs - strings, IPvxNetwork or IPvxAddress.
+
+            engine (str):
+                Compaction engine, both give identical results:
+                 - 'ipaddress' (default): ipaddress.collapse_addresses().
+                 - 'interval': parses strings straight to integers,
+                   merges sorted (start, end) intervals in one pass and
+                   then emits the minimal cidr cover. Much quicker for
+                   large lists.
+
+            workers (int):
+                Number of processes to use. Default 1. If more, input is
+                sharded by address family and high order bits (/8 ipv4,
+                /16 ipv6), each shard is compacted in a process pool
+                and results are stitched back together - still minimal.
 
         Returns:
             list[str]:
@@ -907,4 +1348,402 @@ class Cidr:
         Recommended methods are compact() or compact_nets().
         Others are kept for backward compatibility.
         """
-        return compact_cidrs(cidrs)
+        return compact_cidrs(cidrs, engine, workers)
+
+    @staticmethod
+    def aggregate(cidrs: Sequence[CidrLike], max_prefixes: int,
+                  max_overcover: int | None = None) -> tuple[list[str], int]:
+        """
+        Lossy compaction to at most max_prefixes prefixes.
+
+        Starts from the compact() list and greedily replaces neighbouring
+        prefixes by the smallest prefix covering both, always picking
+        the merge adding the fewest extra addresses (heap based, so
+        fine for millions of cidrs). Useful where rule count matters
+        more than being exact, e.g. router or firewall sets.
+
+        Args:
+            cidrs (Sequence[CidrLike]):
+                Input list of cidrs (strings, IPvxNetwork or IPvxAddress)
+                - can be mixed ipv4/ipv6. ipv4 and ipv6 are never merged together.
+
+            max_prefixes (int):
+                Target maximum number of prefixes in result.
+
+            max_overcover (int | None):
+                Optional limit on number of extra addresses covered.
+                Merging stops before this is exceeded, even if
+                max_prefixes is not yet reached.
+
+        Returns:
+            tuple[list[str], int]:
+                (cidrs, overcovered) with cidrs ipv4 before ipv6 and
+                overcovered the number of addresses covered that were
+                not in the input.
+        """
+        return aggregate_cidrs(cidrs, max_prefixes, max_overcover)
+
+    @staticmethod
+    def cidrs_union(cidrs_a: Sequence[CidrLike], cidrs_b: Sequence[CidrLike]
+                    ) -> list[str]:
+        """
+        Set union of 2 lists of cidrs.
+
+        Every address in either cidrs_a or cidrs_b.
+        Uses a single sweep over sorted integer intervals, O((n+m) log(n+m)).
+
+        Args:
+            cidrs_a (Sequence[CidrLike]):
+                First list of cidrs (strings or IPvxNetwork) - can be mixed ipv4/ipv6.
+                Any bad cidr will raise ValueError.
+
+            cidrs_b (Sequence[CidrLike]):
+                Second list of cidrs.
+
+        Returns:
+            list[str]:
+                Minimal list of cidrs "cidrs_a | cidrs_b", ipv4 before ipv6.
+        """
+        return cidrs_union(cidrs_a, cidrs_b)
+
+    @staticmethod
+    def cidrs_intersection(cidrs_a: Sequence[CidrLike], cidrs_b: Sequence[CidrLike]
+                           ) -> list[str]:
+        """
+        Set intersection of 2 lists of cidrs.
+
+        Every address in both cidrs_a and cidrs_b.
+        Uses a single sweep over sorted integer intervals, O((n+m) log(n+m)).
+
+        Args:
+            cidrs_a (Sequence[CidrLike]):
+                First list of cidrs (strings or IPvxNetwork) - can be mixed ipv4/ipv6.
+                Any bad cidr will raise ValueError.
+
+            cidrs_b (Sequence[CidrLike]):
+                Second list of cidrs.
+
+        Returns:
+            list[str]:
+                Minimal list of cidrs "cidrs_a & cidrs_b", ipv4 before ipv6.
+        """
+        return cidrs_intersection(cidrs_a, cidrs_b)
+
+    @staticmethod
+    def cidrs_difference(cidrs_a: Sequence[CidrLike], cidrs_b: Sequence[CidrLike]
+                         ) -> list[str]:
+        """
+        Set difference of 2 lists of cidrs.
+
+        Every address in cidrs_a that is not in cidrs_b.
+        Same as cidrs2_minus_cidrs1(cidrs_b, cidrs_a).
+        Uses a single sweep over sorted integer intervals, O((n+m) log(n+m)).
+
+        Args:
+            cidrs_a (Sequence[CidrLike]):
+                First list of cidrs (strings or IPvxNetwork) - can be mixed ipv4/ipv6.
+                Any bad cidr will raise ValueError.
+
+            cidrs_b (Sequence[CidrLike]):
+                Second list of cidrs.
+
+        Returns:
+            list[str]:
+                Minimal list of cidrs "cidrs_a - cidrs_b", ipv4 before ipv6.
+        """
+        return cidrs_difference(cidrs_a, cidrs_b)
+
+    @staticmethod
+    def cidrs_symmetric_difference(cidrs_a: Sequence[CidrLike], cidrs_b: Sequence[CidrLike]
+                                   ) -> list[str]:
+        """
+        Set symmetric difference of 2 lists of cidrs.
+
+        Every address in exactly one of cidrs_a and cidrs_b.
+        Uses a single sweep over sorted integer intervals, O((n+m) log(n+m)).
+
+        Args:
+            cidrs_a (Sequence[CidrLike]):
+                First list of cidrs (strings or IPvxNetwork) - can be mixed ipv4/ipv6.
+                Any bad cidr will raise ValueError.
+
+            cidrs_b (Sequence[CidrLike]):
+                Second list of cidrs.
+
+        Returns:
+            list[str]:
+                Minimal list of cidrs "cidrs_a ^ cidrs_b", ipv4 before ipv6.
+        """
+        return cidrs_symmetric_difference(cidrs_a, cidrs_b)
+
+    @staticmethod
+    def find_overlaps(cidrs: list[str]) -> Overlaps:
+        """
+        Find duplicate and covered (shadowed) cidrs in a list.
+
+        Cidr blocks are either disjoint or nested, they never partially
+        overlap, so this reports every overlap. Uses a single sorted
+        sweep, O(n log n), and returns indices rather than strings.
+
+        Args:
+            cidrs (list[str]):
+                List of cidr strings - can be mixed ipv4/ipv6.
+                Host bits are ignored.
+
+        Returns:
+            Overlaps:
+                NamedTuple (duplicates, covered, invalid):
+
+                - duplicates: list of (idx, first_idx) where cidrs[idx] is the
+                  same network as the earlier cidrs[first_idx].
+                - covered: list of (idx, parent_idx) where cidrs[idx] is inside
+                  cidrs[parent_idx] - the smallest such network.
+                - invalid: list of idx of invalid cidrs.
+        """
+        return find_overlaps(cidrs)
+
+    #
+    # NetInt - integer backed networks.
+    #
+    @staticmethod
+    def cidr_to_netint(cidr: str, strict: bool = False) -> NetInt:
+        """
+        Convert cidr string to NetInt.
+
+        Args:
+            cidr (str):
+            Input cidr string.
+
+            strict (bool):
+            If true then cidr is considered invalid if host bits are set.
+            Defaults to False.
+
+        Returns:
+            NetInt:
+            NetInt(version, network_int, prefixlen).
+            Raises ValueError if cidr is invalid.
+        """
+        return cidr_to_netint(cidr, strict)
+
+    @staticmethod
+    def cidrs_to_netints(cidrs: list[str], strict: bool = False) -> list[NetInt]:
+        """
+        Convert list of cidr strings to list of NetInt.
+
+        Args:
+            cidrs (list[str]):
+            list of cidr strings.
+
+            strict (bool):
+            If true, cidr with host bits set is invalid. Defaults to false.
+
+        Returns:
+            list[NetInt]:
+            list of NetInt. Raises ValueError if any cidr is invalid.
+        """
+        return cidrs_to_netints(cidrs, strict)
+
+    @staticmethod
+    def netint_to_cidr(netint: NetInt) -> str:
+        """
+        Convert NetInt to cidr string.
+
+        Args:
+            netint (NetInt):
+            Network to convert.
+
+        Returns:
+            str:
+            Cidr string - same as str() of the equivalent IPvxNetwork.
+        """
+        return netint_to_cidr(netint)
+
+    @staticmethod
+    def netints_to_cidrs(netints: list[NetInt]) -> list[str]:
+        """
+        Convert list of NetInt to list of cidr strings.
+
+        Args:
+            netints (list[NetInt]):
+            list of networks to convert.
+
+        Returns:
+            list[str]:
+            list of cidr strings.
+        """
+        return netints_to_cidrs(netints)
+
+    @staticmethod
+    def net_to_netint(net: IPvxNetwork) -> NetInt:
+        """
+        Convert IPvxNetwork to NetInt.
+
+        Args:
+            net (IPvxNetwork):
+            Network to convert.
+
+        Returns:
+            NetInt:
+            The equivalent NetInt.
+        """
+        return net_to_netint(net)
+
+    @staticmethod
+    def nets_to_netints(nets: list[IPvxNetwork]) -> list[NetInt]:
+        """
+        Convert list of IPvxNetwork to list of NetInt.
+
+        Args:
+            nets (list[IPvxNetwork]):
+            list of networks to convert.
+
+        Returns:
+            list[NetInt]:
+            list of the equivalent NetInt.
+        """
+        return nets_to_netints(nets)
+
+    @staticmethod
+    def netint_to_net(netint: NetInt) -> IPvxNetwork:
+        """
+        Convert NetInt to IPvxNetwork.
+
+        Args:
+            netint (NetInt):
+            Network to convert.
+
+        Returns:
+            IPvxNetwork:
+            The equivalent IPv4Network or IPv6Network.
+        """
+        return netint_to_net(netint)
+
+    @staticmethod
+    def netints_to_nets(netints: list[NetInt]) -> list[IPvxNetwork]:
+        """
+        Convert list of NetInt to list of IPvxNetwork.
+
+        Args:
+            netints (list[NetInt]):
+            list of networks to convert.
+
+        Returns:
+            list[IPvxNetwork]:
+            list of the equivalent IPvxNetwork.
+        """
+        return netints_to_nets(netints)
+
+    @staticmethod
+    def compact_netints(netints: list[NetInt]) -> list[NetInt]:
+        """
+        Compact list of NetInt.
+
+        Integer version of compact_nets().
+
+        Args:
+            netints (list[NetInt]):
+            Networks to compact, may be mixed ipv4 and ipv6.
+
+        Returns:
+            list[NetInt]:
+            Compacted list of networks. If mixed ipv4 is before ipv6.
+        """
+        return compact_netints(netints)
+
+    @staticmethod
+    def sort_netints(netints: list[NetInt]) -> list[NetInt]:
+        """
+        Sort list of NetInt.
+
+        Integer version of sort_nets().
+
+        Args:
+            netints (list[NetInt]):
+            Networks to sort.
+
+        Returns:
+            list[NetInt]:
+            Sorted copy of networks.
+        """
+        return sort_netints(netints)
+
+    @staticmethod
+    def netints_exclude(netints1: list[NetInt], netints2: list[NetInt]
+                        ) -> list[NetInt]:
+        """
+        Exclude every netints1 network from netints2.
+
+        Integer version of nets_exclude().
+
+        Args:
+            netints1 (list[NetInt]):
+            list of networks to be excluded.
+
+            netints2 (list[NetInt]):
+            list of networks from which netints1 are excluded.
+
+        Returns:
+            list[NetInt]:
+            Compacted list of networks ("netints2" - "netints1").
+        """
+        return netints_exclude(netints1, netints2)
+
+    @staticmethod
+    def netint_is_subnet(netint1: NetInt, netint2: NetInt | list[NetInt]
+                         ) -> bool:
+        """
+        Determines if netint1 is a subnet of any of netint2.
+
+        Integer version of net_is_subnet().
+
+        Args:
+            netint1 (NetInt):
+            Network to check if is a subnet.
+
+            netint2 (NetInt | list[NetInt]):
+            Network or list of networks to be checked.
+
+        Returns:
+            bool:
+            True if netint1 is a subnet of any of netint2.
+        """
+        return netint_is_subnet(netint1, netint2)
+
+    @staticmethod
+    def range_to_netints(addr_start: IPAddress | int, addr_end: IPAddress | int,
+                         ip_ver: int = 4) -> list[NetInt]:
+        """
+        Generate a list of NetInt from an IP range.
+
+        Integer version of range_to_cidrs().
+
+        Args:
+            addr_start (IPAddress | int):
+            Start of IP range.
+
+            addr_end (IPAddress | int):
+            End of IP range (inclusive).
+
+            ip_ver (int):
+            IP version (4 or 6) used when start and end are integers.
+
+        Returns:
+            list[NetInt]:
+            list of network blocks representing the IP range.
+        """
+        return range_to_netints(addr_start, addr_end, ip_ver)
+
+    @staticmethod
+    def netint_to_range(netint: NetInt) -> tuple[int, int]:
+        """
+        Convert NetInt to IP Range.
+
+        Args:
+            netint (NetInt):
+            The network to examine.
+
+        Returns:
+            tuple[int, int]:
+            tuple (ip0, ip1) of first and last IP address as integers.
+        """
+        return netint_to_range(netint)
@@ -10,13 +10,30 @@
  - cidr are all in column 1
 
 """
+from typing import (Any, Iterable, Iterator)
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import io
+import mmap
 import os
+import random
+import string
 import sys
+from ipaddress import (IPv4Network, IPv6Network)
 
 from ._utils import open_file
 from ._network._cidr_compact import (compact_cidrs)
+from ._network._compact_external import (compact_cidrs_external)
+from ._network._cidr_merge_sorted import (merge_sorted_cidrs)
+from ._network._cidr_bytes import (parse_cidr_buffer)
+from ._network._cidr_intervals import (Interval)
+from ._network._cidr_intervals import (cidrs_to_merged_intervals, iter_merge_sorted)
+from ._network._cidr_intervals import (intervals_to_cidrs)
 from .cidr_class import Cidr
 
+# files larger than this are split into byte ranges for parallel reads
+_RANGE_BYTES = 8 * 1024 * 1024
+
 
 def _has_cidr_data(row):
     """
@@ -30,6 +47,121 @@ def _has_cidr_data(row):
     return True
 
 
+def _iter_column_1(fname: str | None) -> Iterator[str]:
+    """
+    Read file one line at a time yielding column 1 of rows with cidr data.
+
+    If fname is None then data is read from stdin.
+    Missing file yields nothing.
+    Never holds the whole file: compact_cidr_files() depends on this
+    for files larger than memory.
+    """
+    if fname is not None and isinstance(fname, str):
+        if not os.path.exists(fname):
+            return
+        fob = open_file(fname, 'r')
+        if not fob:
+            return
+    else:
+        fob = sys.stdin
+
+    try:
+        yield from _column_1(fob)
+    finally:
+        if fob is not sys.stdin:
+            fob.close()
+
+
+def _column_1(rows: Iterable[str]) -> Iterator[str]:
+    """
+    Yield column 1 of rows with cidr data.
+    """
+    for row in rows:
+        if not _has_cidr_data(row):
+            continue
+
+        # Keep first column (also drops trailing comment or anything else)
+        cols = row.split(maxsplit=1)
+        if cols and cols[0]:
+            yield cols[0]
+
+
+def _split_file(path: str, range_bytes: int) -> list[tuple[str, int, int]]:
+    """
+    Split file into (path, start, end) byte ranges of about range_bytes.
+    Each range ends just after a newline (or at end of file).
+    """
+    ranges: list[tuple[str, int, int]] = []
+    size = os.path.getsize(path)
+    start = 0
+    with open(path, 'rb') as fob:
+        while start < size:
+            fob.seek(min(start + range_bytes, size))
+            fob.readline()
+            end = fob.tell()
+            ranges.append((path, start, end))
+            start = end
+    return ranges
+
+
+def _read_range(task: tuple[str, int, int]) -> tuple[list[Interval], list[Interval]]:
+    """
+    Worker: merged (ip4, ip6) intervals of the valid cidrs in
+    bytes [start, end) of file. Read same as text mode file.
+    """
+    (path, start, end) = task
+    with open(path, 'rb') as fob:
+        fob.seek(start)
+        data = fob.read(end - start)
+
+    rows = io.TextIOWrapper(io.BytesIO(data))
+    (ivs4, ivs6, _invalid) = cidrs_to_merged_intervals(list(_column_1(rows)))
+    return (ivs4, ivs6)
+
+
+def _read_files_parallel(paths: list[str], workers: int) -> list[str]:
+    """
+    Read files using pool of processes and return compacted cidrs.
+    """
+    tasks: list[tuple[str, int, int]] = []
+    for path in paths:
+        if os.path.isfile(path):
+            tasks += _split_file(path, _RANGE_BYTES)
+
+    if len(tasks) <= 1:
+        results = [_read_range(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_read_range, tasks))
+
+    # stitch: each result is sorted - k-way merge then merge intervals
+    ivs4 = iter_merge_sorted(heapq.merge(*[ivs4 for (ivs4, _ivs6) in results]))
+    ivs6 = iter_merge_sorted(heapq.merge(*[ivs6 for (_ivs4, ivs6) in results]))
+    return intervals_to_cidrs(ivs4, 4) + intervals_to_cidrs(ivs6, 6)
+
+
+def _iter_typed_cidrs(fname: str | None) -> Iterator[tuple[str, str]]:
+    """
+    Yield (iptype, cidr) for each valid cidr in column 1 of file.
+
+    iptype is 'ip4' or 'ip6' - invalid cidrs are skipped.
+    """
+    for row in _iter_column_1(fname):
+        iptype = Cidr.cidr_iptype(row)
+        if iptype:
+            yield (iptype, row)
+
+
+def _read_column_1(fname: str | None) -> list[str]:
+    """
+    Read file and return column 1 of every row with cidr data.
+
+    If fname is None then data is read from stdin.
+    Missing file returns empty list.
+    """
+    return list(_iter_column_1(fname))
+
+
 class CidrFile:
     """
     Provides common CIDR string file reader/writer tools.
@@ -62,42 +194,109 @@ class CidrFile:
         ip4 = []
         ip6 = []
 
-        if fname is not None and isinstance(fname, str):
-            if os.path.exists(fname):
-                fob = open_file(fname, 'r')
-                rows = fob.readlines()
-                fob.close()
+        for (iptype, row) in _iter_typed_cidrs(fname):
+            if iptype == 'ip4':
+                ip4.append(row)
             else:
-                rows = []
-        else:
-            rows = sys.stdin.readlines()
+                ip6.append(row)
+
+        return (ip4, ip6)
+
+    @staticmethod
+    def iter_cidrs(fname: str | None, family: str | None = None) -> Iterator[str]:
+        """
+        Read file of cidrs one line at a time, yielding each valid cidr.
 
-        for row in rows:
-            row.lstrip()
-            if not _has_cidr_data(row):
-                continue
+        Same rules as read_cidrs() but memory use does not grow with
+        file size - nothing is kept once it has been yielded.
 
-            # Keep first column (also drops trailing comment or anything else)
-            cols = row.split()
-            if cols and cols[0]:
-                row = cols[0].rstrip()
+        Args:
+            fname (str | None):
+            File name to read. If None, then read stdin.
 
-                iptype = Cidr.cidr_iptype(row)
-                if not iptype:
-                    continue
+            family (str | None):
+            'ip4' or 'ip6' to yield only that IP version.
+            Default (None) yields both, in file order.
 
-                if iptype == 'ip4':
-                    ip4.append(row)
+        Returns:
+            Iterator[str]:
+            cidr strings as found in the file.
+        """
+        if family not in (None, 'ip4', 'ip6'):
+            raise ValueError(f"Unknown family {family!r} - use 'ip4', 'ip6' or None")
 
-                elif iptype == 'ip6':
-                    ip6.append(row)
+        typed_cidrs = _iter_typed_cidrs(fname)
+        if family is None:
+            return (row for (_iptype, row) in typed_cidrs)
+        return (row for (iptype, row) in typed_cidrs if iptype == family)
+
+    @staticmethod
+    def read_nets(fname: str | None, verb: bool = False
+                  ) -> tuple[list[IPv4Network], list[IPv6Network]]:
+        """
+        Read file of cidrs and return tuple of separate lists of networks.
 
-        # shouldnt be needed since we ignore empty lines
-        ip4 = list(filter(None, ip4))
-        ip6 = list(filter(None, ip6))
+        Same as read_cidrs() but each cidr is parsed just once
+        and the networks are returned instead of strings.
+
+        Args:
+            fname (str | None):
+            File name to read. If None, then read stdin.
+
+            verb (bool):
+            More verbose output when True.
 
+        Returns:
+            tuple[list[IPv4Network], list[IPv6Network]]:
+            tuple of lists of networks (ip4, ip6)
+        """
+        if verb:
+            print(f' \tread_nets: {fname}')
+
+        (ip4, ip6, _invalid) = Cidr.classify_cidrs(_read_column_1(fname))
         return (ip4, ip6)
 
+    @staticmethod
+    def read_mmap(fname: str, as_nets: bool = False) -> tuple[Any, Any]:
+        """
+        Read large file of cidrs using mmap and a bulk parser.
+
+        Same rules as read_cidrs() but the file bytes are scanned directly
+        with numpy - no string is made per line. Host bits are cleared.
+        Requires numpy.
+
+        Args:
+            fname (str):
+            File name to read. Missing file gives empty results.
+
+            as_nets (bool):
+            If True, return lists of IPv4Network / IPv6Network instead of arrays.
+
+        Returns:
+            tuple[Any, Any]:
+            ((addrs, prefixlens), (hi, lo, prefixlens)) numpy arrays in file order:
+            uint32 ipv4 addresses, uint64 high and low halves of ipv6 addresses
+            and uint8 prefix lengths. If as_nets then (ip4, ip6) lists of networks.
+        """
+        buf: Any = b''
+        if os.path.exists(fname) and os.path.getsize(fname) > 0:
+            with open(fname, 'rb') as fob:
+                buf = mmap.mmap(fob.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (ip4, ip6) = parse_cidr_buffer(buf)
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+        if not as_nets:
+            return (ip4, ip6)
+
+        nets4 = [IPv4Network((addr, prefixlen))
+                 for (addr, prefixlen) in zip(ip4[0].tolist(), ip4[1].tolist())]
+        nets6 = [IPv6Network(((hi << 64) | lo, prefixlen))
+                 for (hi, lo, prefixlen) in zip(*(arr.tolist() for arr in ip6))]
+        return (nets4, nets6)
+
     @staticmethod
     def read_cidr_file(fname: str, verb: bool = False) -> list[str]:
         """
@@ -120,7 +319,7 @@ class CidrFile:
         return ip4 + ip6
 
     @staticmethod
-    def read_cidr_files(targ_dir: str, file_list: list[str]) -> list[str]:
+    def read_cidr_files(targ_dir: str, file_list: list[str], workers: int = 1) -> list[str]:
         """
         Read files in a directory and return merged list of cidr strings.
 
@@ -131,6 +330,12 @@ class CidrFile:
             file_list (list[str]):
             list of files in *targ_dir* to read.
 
+            workers (int):
+            If more than 1, files are read in a pool of this many processes.
+            Large files are split into byte ranges aligned on newlines.
+            Each worker returns its cidrs as merged integer intervals
+            which are then combined and compacted. Same result either way.
+
         Returns:
             list[str]:
             list of all cidrs found in the files.
@@ -140,16 +345,140 @@ class CidrFile:
         if not targ_dir or not file_list:
             return cidrs
 
+        if workers > 1:
+            return _read_files_parallel([os.path.join(targ_dir, file) for file in file_list],
+                                        workers)
+
+        # keep the parsed nets - avoids parsing again to compact
+        ip4: list[IPv4Network] = []
+        ip6: list[IPv6Network] = []
         for file in file_list:
             path = os.path.join(targ_dir, file)
-            this_cidrs = CidrFile.read_cidr_file(path)
-            cidrs += this_cidrs
+            (this_ip4, this_ip6) = CidrFile.read_nets(path)
+            ip4 += this_ip4
+            ip6 += this_ip6
 
         # compress if possible
-        if cidrs:
-            cidrs = compact_cidrs(cidrs)
+        if ip4:
+            cidrs += Cidr.nets_to_cidrs(Cidr.compact_nets(ip4))     # type: ignore[arg-type]
+        if ip6:
+            cidrs += Cidr.nets_to_cidrs(Cidr.compact_nets(ip6))     # type: ignore[arg-type]
         return cidrs
 
+    @staticmethod
+    def compact_cidr_files(paths: list[str], out: str | None,
+                           mem_budget: int = 64 * 1024 * 1024,
+                           tmp_dir: str | None = None) -> bool:
+        """
+        Compact cidr files larger than memory into an output file.
+
+        Files are streamed (nothing is read in whole). Cidrs are kept as
+        integer intervals and, when the memory budget is reached, spilled
+        as sorted runs to temporary files which are then k-way merged
+        and written out already compacted. Result is the same as
+        compacting read_cidr_files() of the same files.
+
+        Args:
+            paths (list[str]):
+            Files of cidrs to read. Same rules as read_cidrs()
+            - comments skipped, column 1 used and invalid cidrs dropped.
+
+            out (str | None):
+            Path to file where compacted cidrs are written.
+            If empty or None, written to stdout.
+
+            mem_budget (int):
+            Approximate memory budget in bytes. Default 64 MiB.
+
+            tmp_dir (str | None):
+            Directory for the temporary files. Default is system temp dir.
+
+        Returns:
+            bool:
+            True if successful otherwise False.
+        """
+        def _all_cidrs() -> Iterator[str]:
+            for path in paths:
+                yield from _iter_column_1(path)
+
+        if not out:
+            fob = sys.stdout
+        else:
+            fob = open_file(out, 'w')
+        if not fob:
+            return False
+
+        try:
+            compact_cidrs_external(_all_cidrs(), fob, mem_budget, tmp_dir)
+        except OSError as err:
+            print(f'Error compacting to {out} : {err}')
+            return False
+        finally:
+            if out:
+                fob.close()
+        return True
+
+    @staticmethod
+    def merge_sorted_files(paths: list[str], out: str | None,
+                           compact: bool = False) -> bool:
+        """
+        Merge already sorted cidr files into an output file.
+
+        Streaming k-way merge: each file is read one line at a time,
+        so memory use depends on the number of files, not their size.
+        Duplicates are dropped.
+
+        Args:
+            paths (list[str]):
+            Files of cidrs to merge, each in sort_cidrs() order
+            (host bits are ignored). Same rules as read_cidrs()
+            - comments skipped, column 1 used and invalid cidrs dropped.
+
+            out (str | None):
+            Path to file where merged cidrs are written.
+            If empty or None, written to stdout.
+
+            compact (bool):
+            If True the merged cidrs are also compacted.
+
+        Returns:
+            bool:
+            True if successful otherwise False.
+
+        Raises:
+            ValueError: if any file is not sorted or out is one of paths.
+            Any existing out is left unchanged.
+        """
+        sources = [(path, _iter_column_1(path)) for path in paths]
+        if not out:
+            try:
+                merge_sorted_cidrs(sources, sys.stdout, compact)
+            except OSError as err:
+                print(f'Error merging to stdout : {err}')
+                return False
+            return True
+
+        if os.path.exists(out):
+            for path in paths:
+                if os.path.exists(path) and os.path.samefile(path, out):
+                    raise ValueError(f'Output {out} is also an input file')
+
+        # write temp file in same dir - out is only replaced on success
+        ext_chars = string.ascii_letters + string.digits
+        extension = ''.join(random.choices(ext_chars, k=6))
+        out_tmp = f'{out}.{extension}'
+        try:
+            with open(out_tmp, 'x', encoding='utf-8') as fob:
+                merge_sorted_cidrs(sources, fob, compact)
+            os.replace(out_tmp, out)
+        except OSError as err:
+            print(f'Error merging to {out} : {err}')
+            return False
+        finally:
+            if os.path.exists(out_tmp):
+                os.remove(out_tmp)
+        return True
+
     @staticmethod
     def write_cidr_file(cidrs: list[str], pname: str) -> bool:
         """
@@ -0,0 +1,34 @@
+"""
+Shared test helpers
+"""
+import random
+
+
+def random_cidrs(rng: random.Random, num: int, num_24s: int = 2048
+                 ) -> list[str]:
+    """
+    Mix of ipv4 (70%) and ipv6 cidrs.
+
+    ipv4 are in the first num_24s /24s of 10.0.0.0/8 and ipv6 in as many
+    /48s of 2001:db8::/32 - a small num_24s makes them overlap and touch.
+    """
+    cidrs: list[str] = []
+    for _ in range(num):
+        block = rng.randrange(num_24s)
+        if rng.random() < 0.3:
+            prefixlen = rng.choice([44, 48, 64])
+            subnet = rng.randint(0, 255)
+            cidrs.append(f'2001:db8:{block:x}:{subnet:x}::/{prefixlen}')
+        else:
+            prefixlen = rng.choice([22, 24, 26, 30, 32])
+            host = rng.randint(0, 255)
+            cidrs.append(f'10.{block >> 8}.{block & 255}.{host}/{prefixlen}')
+    return cidrs
+
+
+def spaced_cidrs(num: int) -> list[str]:
+    """
+    num ipv4 /24s in 10.0.0.0/8 with a gap after each - none merge.
+    """
+    return [f'10.{block // 256}.{block % 256}.0/24'
+            for block in range(0, 2 * num, 2)]
@@ -2,13 +2,22 @@
 Test:
     Read / Write cache file
 """
+from ipaddress import (IPv4Address, IPv4Network, IPv6Network)
+
+import pytest
+
 from py_cidr.cidr_class import Cidr
+from py_cidr import (NetInt, ParseCache, CidrLike)
+from py_cidr._utils import NUMPY_MIN_ITEMS
+
+from helpers import spaced_cidrs
 
 
 class TestCidr:
     """
     Cidr Class Tests
     """
+    # pylint: disable=too-many-public-methods
 
     def test_valid(self):
         """ test valid cidrs """
@@ -28,6 +37,19 @@ class TestCidr:
         all_ok = num_good == 2 and num_bad == 2
         assert all_ok
 
+    def test_valid_mask(self):
+        """ batch validity mask matches ipaddress rules """
+        addrs = ['10.1.2.0/24', '10.0.0.0/255.0.0.0', '10.0.0.0/0.0.255.255',
+                 '010.1.2.3', 'fe80::1%eth0/64', '::ffff:1.2.3.4',
+                 '1:2:3:4:5:6:7::', 'example.com', '# comment', '10.1.2.3/33',
+                 '1::2::3', '', '10.0.0.0/255.0.255.0']
+        expect = [True, True, True, False, True, True, True]
+        expect += [False] * 6
+
+        assert Cidr.is_valid_cidrs(addrs) == expect
+        iptypes = [Cidr.cidr_iptype(addr) for addr in addrs[:7]]
+        assert iptypes == ['ip4'] * 3 + [''] + ['ip6'] * 3
+
     def test_compact(self):
         """ test compacting cidrs """
         cidrs = ['10.0.0.0/24', '10.0.1.0/24', '10.10.0.0/16']
@@ -76,3 +98,358 @@ class TestCidr:
 
         is_subnet = Cidr.cidr_is_subnet(cidr, super_nets)
         assert is_subnet
+
+    def test_classify(self):
+        """ classify cidrs parsing once """
+        cidrs = ['10.0.0.0/24', 'fc00::/64', 'junk', '10.0.1.1/24',
+                 '::ffff:1.2.3.4']
+
+        (ip4, ip6, invalid) = Cidr.classify_cidrs(cidrs)
+
+        assert Cidr.nets_to_cidrs(ip4) == ['10.0.0.0/24', '10.0.1.0/24']
+        assert len(ip6) == 2
+        assert invalid == ['junk']
+        assert Cidr.cidrs_split_type(cidrs) == (
+                ['10.0.0.0/24', '10.0.1.1/24'],
+                ['fc00::/64', '::ffff:1.2.3.4'],
+                ['junk'])
+
+    def test_netint(self):
+        """ integer backed networks """
+        cidrs = ['10.0.1.0/24', '10.0.0.0/24', 'fc00:22:22::1',
+                 'fc00:22:22::/64']
+        netints = Cidr.cidrs_to_netints(cidrs)
+
+        assert netints[0] == NetInt(4, 0x0a000100, 24)
+        compacted = Cidr.compact_netints(netints)
+        assert Cidr.netints_to_cidrs(compacted) == Cidr.compact(cidrs)
+        in_order = Cidr.sort_netints(netints)
+        assert Cidr.netints_to_cidrs(in_order) == Cidr.sort_cidrs(cidrs)
+
+        excl = Cidr.netints_exclude([NetInt.from_cidr('10.0.1.0/25')],
+                                    netints)
+        assert Cidr.netints_to_cidrs(excl) == ['10.0.0.0/24', '10.0.1.128/25',
+                                               'fc00:22:22::/64']
+
+        assert Cidr.netint_is_subnet(NetInt.from_cidr('10.0.1.7'), netints)
+        assert not Cidr.netint_is_subnet(NetInt.from_cidr('10.0.2.7'), netints)
+
+        blocks = Cidr.range_to_netints('10.0.0.1', '10.0.0.6')
+        expect = Cidr.range_to_cidrs('10.0.0.1', '10.0.0.6', string=True)
+        assert Cidr.netints_to_cidrs(blocks) == expect
+
+    def test_parse_ip4_array(self):
+        """ vectorized ipv4 parsing """
+        pytest.importorskip('numpy')
+        cidrs = ['10.1.2.3/24', '10.0.0.1', 'junk', '10.01.0.0/16',
+                 '10.0.0.0/255.255.0.0']
+
+        (addrs, prefixlens, invalid) = Cidr.parse_ip4_array(cidrs)
+
+        assert invalid.tolist() == [False, False, True, True, False]
+        assert prefixlens.tolist() == [24, 32, 0, 0, 16]
+        good = ~invalid
+        assert Cidr.ip4_array_to_cidrs(addrs[good], prefixlens[good]) == \
+            ['10.1.2.0/24', '10.0.0.1/32', '10.0.0.0/16']
+
+    def test_parse_ip6_array(self):
+        """ vectorized ipv6 parsing """
+        pytest.importorskip('numpy')
+        cidrs = ['2001:DB8:0:0:1::/64', '::ffff:10.1.2.3', 'junk', '1::2::3',
+                 '::1']
+
+        (hi, lo, prefixlens, invalid) = Cidr.parse_ip6_array(cidrs)
+
+        assert invalid.tolist() == [False, False, True, True, False]
+        assert prefixlens.tolist() == [64, 128, 0, 0, 128]
+        assert int(hi[0]) == 0x20010db800000000 and int(lo[0]) == 0
+        good = ~invalid
+        cidrs_good = Cidr.ip6_array_to_cidrs(hi[good], lo[good],
+                                             prefixlens[good])
+        assert cidrs_good == ['2001:db8::/64', '::ffff:10.1.2.3/128',
+                              '::1/128']
+
+    def test_parse_cache(self):
+        """ LRU parse cache """
+        cache = ParseCache(maxsize=2)
+        cidrs = ['10.0.0.0/24', '10.0.0.0/24', '10.1.0.0/16', '10.2.0.0/16',
+                 '10.2.0.0/16']
+        for cidr in cidrs:
+            Cidr.cidr_to_net(cidr, cache=cache)
+
+        info = cache.cache_info()
+        assert (info.hits, info.misses) == (2, 3)
+        assert (info.evictions, info.currsize) == (1, 2)
+        with pytest.raises(ValueError):
+            Cidr.cidr_to_net('junk', cache=cache)
+        assert len(cache) == 2
+
+        Cidr.parse_cache_enable(maxsize=16)
+        try:
+            nets = Cidr.cidrs_to_nets(['10.0.0.0/24', '10.0.0.0/24'])
+            assert len(nets) == 2 and nets[0] is nets[1]
+            Cidr.ip_to_address('10.0.0.1')
+            Cidr.ip_to_address('10.0.0.1')
+            info_all = Cidr.parse_cache_info()
+            assert info_all['nets'].hits == 1
+            assert info_all['addresses'].hits == 1
+        finally:
+            Cidr.parse_cache_disable()
+        assert Cidr.parse_cache_info()['nets'].currsize == 0
+
+    def test_iter_cidrs_to_nets(self):
+        """ streaming cidr conversion keeps going past bad input """
+        lines = ['10.0.0.0/24\n', 'junk\n', '\n', '2001:db8::/32\n',
+                 '10.0.0.1/24\n']
+
+        nets = list(Cidr.iter_cidrs_to_nets(lines))
+        assert Cidr.nets_to_cidrs(nets) == ['10.0.0.0/24', '2001:db8::/32',
+                                            '10.0.0.0/24']
+
+        errors: list = []
+        nets = list(Cidr.iter_cidrs_to_nets(lines, strict=True,
+                                            on_error='collect', errors=errors))
+        assert len(nets) == 2
+        assert errors == [(1, 'junk'), (4, '10.0.0.1/24')]
+
+        with pytest.raises(ValueError, match='index 1'):
+            list(Cidr.iter_cidrs_to_nets(lines, on_error='raise'))
+
+    def test_compact_engine(self):
+        """ interval compaction engine matches ipaddress engine """
+        cidrs = ['10.0.0.0/24', '10.0.1.0/24', '10.0.2.0/23', '10.0.0.7/32',
+                 '10.10.0.1/16', '2001:db8::/33', '2001:db8:8000::/33', '::1']
+        expect = ['10.0.0.0/22', '10.10.0.0/16', '::1/128', '2001:db8::/32']
+
+        assert Cidr.compact(cidrs) == expect
+        assert Cidr.compact(cidrs, engine='interval') == expect
+
+        nets = Cidr.cidrs_to_nets(cidrs[:5])
+        expect_nets = Cidr.compact_nets(nets)
+        assert Cidr.compact_nets(nets, engine='interval') == expect_nets
+
+        with pytest.raises(ValueError):
+            Cidr.compact(cidrs, engine='magic')
+
+        # large enough for the numpy path - non strings must not be dropped
+        many: list[CidrLike] = [IPv4Network('192.168.0.0/16'),
+                                IPv4Address('8.8.8.8'),
+                                IPv6Network('fc00::/7')]
+        many += spaced_cidrs(1200)
+        assert len(many) >= NUMPY_MIN_ITEMS
+        assert Cidr.compact(many, engine='interval') == Cidr.compact(many)
+        assert '192.168.0.0/16' in Cidr.compact(many, engine='interval')
+
+    def test_compact_workers(self):
+        """ parallel compaction matches single process """
+        cidrs = [f'{num % 223 + 1}.{num % 251}.{num % 13}.0/{22 + num % 3}'
+                 for num in range(12000)]
+        cidrs += ['11.0.0.0/7', '2001:db8::/32', '2001:db8:1::/48', '::1',
+                  '::/127']
+
+        assert Cidr.compact(cidrs, workers=2) == Cidr.compact(cidrs)
+
+        with pytest.raises(ValueError, match='junk'):
+            Cidr.compact(cidrs + ['junk'], workers=2)
+
+        # more non strings than numpy threshold in a shard
+        nets = Cidr.cidrs_to_nets(cidrs[:1500])
+        assert Cidr.compact(nets * 10, workers=2) == Cidr.compact(cidrs[:1500])
+
+    def test_aggregate(self):
+        """ budgeted lossy aggregation """
+        cidrs = ['10.0.0.0/24', '10.0.2.0/24', '10.0.4.0/24', '10.8.0.0/24',
+                 '2001:db8::/48']
+
+        (agg, over) = Cidr.aggregate(cidrs, max_prefixes=3)
+        assert agg == ['10.0.0.0/21', '10.8.0.0/24', '2001:db8::/48']
+        assert over == 8 * 256 - 3 * 256
+
+        # every input address still covered
+        for cidr in cidrs[:4]:
+            assert Cidr.cidr_is_subnet(cidr, Cidr.cidrs_to_nets(agg[:2]))
+
+        (agg, over) = Cidr.aggregate(cidrs, max_prefixes=1, max_overcover=1024)
+        assert len(agg) == 4 and over == 512
+
+        # large list of nets
+        many = spaced_cidrs(1500)
+        (agg, over) = Cidr.aggregate(Cidr.cidrs_to_nets(many), 5)
+        assert (agg, over) == Cidr.aggregate(many, 5)
+        assert 0 < len(agg) <= 5 and over > 0
+
+    def test_exclude(self):
+        """ interval sweep exclude """
+        cidrs2 = ['10.0.0.0/16', '10.1.0.0/24', '2001:db8::/32']
+        cidrs1 = ['10.0.128.0/17', '10.0.1.0/24', '10.1.0.0/16',
+                  '2001:db8::/33']
+
+        assert Cidr.cidrs_exclude(cidrs1, cidrs2) == [
+                '10.0.0.0/24', '10.0.2.0/23', '10.0.4.0/22', '10.0.8.0/21',
+                '10.0.16.0/20', '10.0.32.0/19', '10.0.64.0/18',
+                '2001:db8:8000::/33']
+        assert Cidr.cidr_exclude('10.0.0.0/17', cidrs2[:1]) == [
+                '10.0.128.0/17']
+
+        nets = Cidr.nets_exclude(Cidr.cidrs_to_nets(cidrs1),
+                                 Cidr.cidrs_to_nets(cidrs2))
+        assert Cidr.nets_to_cidrs(nets) == Cidr.cidrs_exclude(cidrs1, cidrs2)
+
+        with pytest.raises(ValueError):
+            Cidr.cidrs_exclude(['junk'], cidrs2)
+
+    def test_set_ops(self):
+        """ union, intersection, difference and symmetric difference """
+        cidrs_a = ['10.0.0.0/24', '10.0.2.0/24', '2001:db8::/32']
+        cidrs_b = ['10.0.0.128/25', '10.0.1.0/24', '2001:db8:1::/48']
+
+        assert Cidr.cidrs_union(cidrs_a, cidrs_b) == [
+                '10.0.0.0/23', '10.0.2.0/24', '2001:db8::/32']
+        assert Cidr.cidrs_intersection(cidrs_a, cidrs_b) == [
+                '10.0.0.128/25', '2001:db8:1::/48']
+        # pylint: disable-next=arguments-out-of-order
+        assert Cidr.cidrs_difference(cidrs_b, cidrs_a) == ['10.0.1.0/24']
+        assert Cidr.cidrs_symmetric_difference(cidrs_a, ['10.0.0.0/23']) == [
+                '10.0.1.0/24', '10.0.2.0/24', '2001:db8::/32']
+
+        with pytest.raises(ValueError):
+            Cidr.cidrs_union(cidrs_a, ['junk'])
+
+        # large lists of nets
+        many = spaced_cidrs(1500)
+        nets = Cidr.cidrs_to_nets(many)
+        other = ['10.0.0.0/23', '10.1.0.0/16']
+        assert Cidr.cidrs_union(nets, []) == Cidr.compact(many)
+        expect = Cidr.cidrs_intersection(many, other)
+        assert Cidr.cidrs_intersection(nets, other) == expect
+        expect = Cidr.cidrs_symmetric_difference(many, other)
+        assert Cidr.cidrs_symmetric_difference(nets, other) == expect
+        expect = Cidr.cidrs_difference(many, other)
+        assert Cidr.cidrs_difference(nets, other) == expect
+        assert Cidr.cidrs2_minus_cidrs1(other, nets) == expect
+        assert len(expect) == len(many) - 129
+        expect = Cidr.cidrs_difference(many, other[1:])
+        assert Cidr.cidr_exclude('10.1.0.0/16', nets) == expect
+
+    def test_special(self):
+        """ special purpose registry """
+        cidrs = ['10.1.0.0/16', '8.8.8.8', '100.64.0.1', 'fe80::1',
+                 '2001:db8::/48', '240.0.0.1', '224.0.0.0/3', 'junk']
+        assert Cidr.classify_special(cidrs) == [
+                'rfc_1918', '', 'cgnat', 'link_local', 'documentation',
+                'bogon', '', '']
+
+        (kept, removed) = Cidr.remove_special(cidrs,
+                                              kinds=['rfc_1918', 'cgnat'])
+        assert removed == ['10.1.0.0/16', '100.64.0.1']
+        assert Cidr.remove_special(cidrs)[0] == ['8.8.8.8', '224.0.0.0/3',
+                                                 'junk']
+        assert kept[0] == '8.8.8.8'
+
+        assert Cidr.is_rfc_1918('172.16.1.1')
+        assert not Cidr.is_rfc_1918('172.32.1.1')
+        assert not Cidr.is_rfc_1918('fe80::1%eth0')
+
+        # invalid input raises as before
+        with pytest.raises(ValueError):
+            Cidr.is_rfc_1918('junk')
+        with pytest.raises(ValueError):
+            Cidr.remove_rfc_1918(['10.0.0.0/8', '10.0.0.1/33'])
+
+        with pytest.raises(ValueError):
+            Cidr.remove_special(cidrs, kinds=['martian'])
+
+    def test_find_overlaps(self):
+        """ duplicates and covered cidrs """
+        cidrs = ['10.0.0.0/16', '10.0.1.0/24', 'junk', '10.0.1.7/24',
+                 '10.0.1.128/25', '2001:db8::/32', '2001:db8::/48',
+                 '11.0.0.0/8']
+        overlaps = Cidr.find_overlaps(cidrs)
+
+        assert overlaps.duplicates == [(3, 1)]
+        assert overlaps.covered == [(1, 0), (4, 1), (6, 5)]
+        assert overlaps.invalid == [2]
+
+    def test_sort(self):
+        """ integer key sorting """
+        cidrs = ['2001:db8::/32', '10.0.1.7/24', '10.0.0.0/8', '9.0.0.0/8',
+                 '::1', '10.0.0.0/16']
+        assert Cidr.sort_cidrs(cidrs) == [
+                '9.0.0.0/8', '10.0.0.0/8', '10.0.0.0/16', '10.0.1.0/24',
+                '::1/128', '2001:db8::/32']
+        assert Cidr.sort_cidrs(cidrs, reformat=False) == [
+                '9.0.0.0/8', '10.0.0.0/8', '10.0.0.0/16', '10.0.1.7/24',
+                '::1', '2001:db8::/32']
+        ips = ['10.0.0.10/24', '10.0.0.9', '::1']
+        assert Cidr.sort_ips(ips) == ['10.0.0.9', '10.0.0.10', '::1']
+
+        many = [f'{num % 200}.{num % 7}.0.0/{16 + num % 9}'
+                for num in range(1200)]
+        many += ['::/0']
+        nets = Cidr.sort_nets(Cidr.cidrs_to_nets(many))
+        assert Cidr.sort_cidrs(many) == Cidr.nets_to_cidrs(nets)
+
+    def test_normalize(self):
+        """ clean, fix, dedupe, sort and compact in one pass """
+        cidrs = ['10.0.1.7/24', '10.0.0.0/24', '10.0.1', 'junk', '10.0.0.0/24',
+                 'fc00::/8']
+
+        (result, counts) = Cidr.normalize(cidrs)
+        fixed = Cidr.fix_cidrs_host_bits(Cidr.clean_cidrs(cidrs))
+        assert result == Cidr.compact_cidrs(Cidr.sort_cidrs(fixed))
+        assert result == ['10.0.0.0/23', 'fc00::/8']
+        assert counts == (6, 1, 1, 1, 2, 1, 2)
+
+        (result, counts) = Cidr.normalize(cidrs, compact=False, sort=False)
+        assert result == ['10.0.1.0/24', '10.0.0.0/24', 'fc00::/8']
+        assert counts.duplicates == 2 and counts.compacted == 0
+
+    def test_ranges_to_cidrs(self):
+        """ batch range to cidrs """
+        starts = ['10.0.0.1', '10.0.1.0', '2001:db8::', 0x0a000200]
+        ends = ['10.0.0.6', '10.0.1.255', '2001:db8::ffff', 0x0a000203]
+        (cidrs, offsets) = Cidr.ranges_to_cidrs(starts, ends)
+
+        assert offsets == [0, 4, 5, 6, 7]
+        expect = Cidr.range_to_cidrs('10.0.0.1', '10.0.0.6', string=True)
+        assert cidrs[:4] == expect
+        assert cidrs[4:] == ['10.0.1.0/24', '2001:db8::/112', '10.0.2.0/30']
+
+        many = [(num << 8, (num << 8) + num % 256) for num in range(2000)]
+        (cidrs, offsets) = Cidr.ranges_to_cidrs([row[0] for row in many],
+                                                [row[1] for row in many])
+        for (idx, (start, end)) in enumerate(many[:50]):
+            expect = Cidr.range_to_cidrs(IPv4Address(start), IPv4Address(end),
+                                         string=True)
+            assert cidrs[offsets[idx]:offsets[idx + 1]] == expect
+
+        with pytest.raises(ValueError):
+            Cidr.ranges_to_cidrs(['10.0.0.2'], ['10.0.0.1'])
+
+    def test_cidrs_to_ranges(self):
+        """ cidrs to integer ranges """
+        cidrs = ['10.0.1.0/24', '10.0.0.0/24', '10.0.0.128/25',
+                 '2001:db8::/127']
+
+        (ip4, ip6) = Cidr.cidrs_to_ranges(cidrs)
+        assert ip4 == [(0x0a000000, 0x0a0001ff)]
+        assert ip6 == [(0x20010db8 << 96, (0x20010db8 << 96) + 1)]
+
+        (ip4, ip6) = Cidr.cidrs_to_ranges(cidrs, merge=False)
+        assert ip4 == [(0x0a000100, 0x0a0001ff), (0x0a000000, 0x0a0000ff),
+                       (0x0a000080, 0x0a0000ff)]
+
+        (starts, ends) = zip(*ip4)
+        expect = Cidr.nets_to_cidrs(Cidr.cidrs_to_nets(cidrs[:3]))
+        assert Cidr.ranges_to_cidrs(starts, ends)[0] == expect
+
+        with pytest.raises(ValueError):
+            Cidr.cidrs_to_ranges(cidrs + ['junk'])
+
+        # large list of nets - merged and not
+        many = spaced_cidrs(1200)
+        nets = Cidr.cidrs_to_nets(many)
+        assert Cidr.cidrs_to_ranges(nets) == Cidr.cidrs_to_ranges(many)
+        expect_ranges = Cidr.cidrs_to_ranges(many, merge=False)
+        assert Cidr.cidrs_to_ranges(nets, merge=False) == expect_ranges
+        assert len(Cidr.cidrs_to_ranges(nets)[0]) == len(many)
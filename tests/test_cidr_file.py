@@ -0,0 +1,152 @@
+"""
+Test:
+    CidrFile readers and file compaction
+"""
+import os
+import random
+import tempfile
+
+import pytest
+
+from py_cidr import (Cidr, CidrFile)
+from py_cidr import cidr_file_class
+
+from helpers import random_cidrs
+
+
+def _write(path: str, rows: list[str]):
+    with open(path, 'w', encoding='utf-8') as fob:
+        fob.write('\n'.join(rows) + '\n')
+
+
+class TestCidrFile:
+    """
+    CidrFile Tests
+    """
+
+    def test_compact_cidr_files(self):
+        """ out of core compaction matches in memory compaction """
+        rng = random.Random(7)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths: list[str] = []
+            for num in range(3):
+                path = os.path.join(tmp_dir, f'feed-{num}.txt')
+                rows = ['# feed header', ''] + random_cidrs(rng, 8000)
+                rows += ['junk', '10.1.2.3/24 # comment']
+                _write(path, rows)
+                paths.append(path)
+
+            out = os.path.join(tmp_dir, 'out.txt')
+            # tiny budget to force spilling runs to disk
+            assert CidrFile.compact_cidr_files(paths, out, mem_budget=1,
+                                               tmp_dir=tmp_dir)
+
+            names = [os.path.basename(path) for path in paths]
+            expect = CidrFile.read_cidr_files(tmp_dir, names)
+            assert CidrFile.read_cidr_file(out) == expect
+            assert Cidr.compact(expect) == expect
+
+    def test_merge_sorted_files(self):
+        """ k-way merge of sorted files """
+        rng = random.Random(20)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths: list[str] = []
+            all_cidrs: list[str] = []
+            for num in range(4):
+                path = os.path.join(tmp_dir, f'sorted-{num}.txt')
+                cidrs = Cidr.sort_cidrs(random_cidrs(rng, 2000))
+                _write(path, ['# sorted feed'] + cidrs)
+                paths.append(path)
+                all_cidrs += cidrs
+
+            out = os.path.join(tmp_dir, 'out.txt')
+            assert CidrFile.merge_sorted_files(paths, out)
+            expect = Cidr.sort_cidrs(list(set(all_cidrs)))
+            assert CidrFile.read_cidr_file(out) == expect
+
+            assert CidrFile.merge_sorted_files(paths, out, compact=True)
+            assert CidrFile.read_cidr_file(out) == Cidr.compact(all_cidrs)
+
+            # failed merge leaves out as it was and no temp file behind
+            compacted = CidrFile.read_cidr_file(out)
+            _write(paths[0], ['10.0.0.0/24', '9.0.0.0/8'])
+            with pytest.raises(ValueError):
+                CidrFile.merge_sorted_files(paths, out)
+            assert CidrFile.read_cidr_file(out) == compacted
+            assert len(os.listdir(tmp_dir)) == len(paths) + 1
+
+            with pytest.raises(ValueError):
+                CidrFile.merge_sorted_files(paths[1:] + [out], out)
+            assert CidrFile.read_cidr_file(out) == compacted
+
+    def test_iter_cidrs(self):
+        """ streaming reader """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'feed.txt')
+            _write(path, ['# header', '10.0.0.0/8 # comment', 'junk',
+                          'fc00::/7', '', '192.168.1.1'])
+
+            assert list(CidrFile.iter_cidrs(path)) == [
+                    '10.0.0.0/8', 'fc00::/7', '192.168.1.1']
+            ip6 = list(CidrFile.iter_cidrs(path, family='ip6'))
+            assert ip6 == ['fc00::/7']
+            assert CidrFile.read_cidrs(path) == (['10.0.0.0/8', '192.168.1.1'],
+                                                 ['fc00::/7'])
+            missing = os.path.join(tmp_dir, 'missing.txt')
+            assert not list(CidrFile.iter_cidrs(missing))
+
+            with pytest.raises(ValueError):
+                CidrFile.iter_cidrs(path, family='ip5')
+
+    def test_read_mmap(self):
+        """ bulk mmap reader matches read_nets """
+        pytest.importorskip('numpy')
+        rng = random.Random(24)
+        rows = random_cidrs(rng, 3000)
+        rows += ['# header', '$x', ':y', '', '10.1.2.3/8 # host bits',
+                 '  172.16.0.0/12 leading', '10.0.0.0/255.0.0.0',
+                 'fe80::1%eth0/64', 'junk', '1.2.3.4/33', '2001:db8::/129']
+        rng.shuffle(rows)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'feed.txt')
+            _write(path, rows)
+            (ip4, ip6) = CidrFile.read_nets(path)
+            expect = (
+                    Cidr.cidrs_to_nets(Cidr.nets_to_cidrs(ip4), strict=False),
+                    Cidr.cidrs_to_nets(Cidr.nets_to_cidrs(ip6), strict=False))
+            assert CidrFile.read_mmap(path, as_nets=True) == expect
+
+            ((addrs, prefixlens4),
+             (_hi, _lo, prefixlens6)) = CidrFile.read_mmap(path)
+            network_ints = [int(net.network_address) for net in expect[0]]
+            assert addrs.tolist() == network_ints
+            assert prefixlens4.tolist() == [net.prefixlen for net in expect[0]]
+            assert prefixlens6.tolist() == [net.prefixlen for net in expect[1]]
+
+            missing = os.path.join(tmp_dir, 'missing.txt')
+            assert CidrFile.read_mmap(missing, as_nets=True) == ([], [])
+
+    def test_read_cidr_files_workers(self):
+        """ process pool reader with files split into byte ranges """
+        # pylint: disable=protected-access
+        rng = random.Random(25)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files: list[str] = []
+            for num in range(3):
+                file = f'feed-{num}.txt'
+                rows = ['# feed', 'junk'] + random_cidrs(rng, 3000)
+                _write(os.path.join(tmp_dir, file), rows)
+                files.append(file)
+            files.append('missing.txt')
+
+            expect = CidrFile.read_cidr_files(tmp_dir, files)
+            cidrs = CidrFile.read_cidr_files(tmp_dir, files, workers=2)
+            assert cidrs == expect
+
+            range_bytes = cidr_file_class._RANGE_BYTES
+            try:
+                cidr_file_class._RANGE_BYTES = 4096
+                cidrs = CidrFile.read_cidr_files(tmp_dir, files, workers=2)
+                assert cidrs == expect
+            finally:
+                cidr_file_class._RANGE_BYTES = range_bytes
@@ -0,0 +1,59 @@
+"""
+Test:
+    CidrSet - indexed set of cidrs for membership tests
+"""
+import random
+
+import pytest
+
+from py_cidr import (Cidr, CidrSet)
+
+from helpers import spaced_cidrs
+
+
+class TestCidrSet:
+    """
+    CidrSet Tests
+    """
+
+    def test_contains(self):
+        """ matches cidr_is_subnet() """
+        rng = random.Random(2)
+        cidrs = [f'10.{rng.randint(0, 7)}.{rng.randint(0, 255)}.0'
+                 f'/{rng.choice([20, 24, 28])}'
+                 for _ in range(200)]
+        cidrs += ['2001:db8::/32']
+        nets = Cidr.cidrs_to_nets(cidrs)
+        cset = CidrSet(nets)
+
+        ips = [f'10.{rng.randint(0, 8)}.{rng.randint(0, 255)}'
+               f'.{rng.randint(0, 255)}'
+               for _ in range(1500)]
+        ips += ['2001:db8::1', '2001:db9::1', '10.0.0.0/8']
+        expect = [Cidr.cidr_is_subnet(ip, nets) for ip in ips]
+
+        assert [cset.contains(ip) for ip in ips] == expect
+        assert cset.contains_many(ips) == expect
+        assert cset.contains_many(ips[-10:]) == expect[-10:]
+        assert cset.to_cidrs() == Cidr.compact(cidrs)
+        assert len(cset) == len(cset.to_cidrs())
+
+    def test_many_nets(self):
+        """ built from more nets than the numpy threshold """
+        cidrs = spaced_cidrs(1500)
+        cset = CidrSet(Cidr.cidrs_to_nets(cidrs))
+
+        assert len(cset) == len(cidrs)
+        assert cset.contains('10.0.0.1')
+        assert not cset.contains('10.0.1.1')
+        assert cset.to_cidrs() == Cidr.compact(cidrs)
+
+    def test_invalid(self):
+        """ bad input """
+        cset = CidrSet(['10.0.0.0/8', 'fc00::/7'])
+        assert 'junk' not in cset
+        found = cset.contains_many(['10.1.1.1', 'junk', None, 'fc00::1'])
+        assert found == [True, False, False, True]
+
+        with pytest.raises(ValueError):
+            CidrSet(['10.0.0.0/8', 'junk'])
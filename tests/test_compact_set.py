@@ -0,0 +1,56 @@
+"""
+Test:
+    CompactSet - incrementally compacted set of cidrs
+"""
+import random
+
+from py_cidr import (Cidr, CompactSet)
+
+from helpers import random_cidrs
+
+
+class TestCompactSet:
+    """
+    CompactSet Tests
+    """
+
+    def test_add(self):
+        """ adding one at a time or in batches matches compact() """
+        rng = random.Random(1)
+        for _ in range(20):
+            cidrs = random_cidrs(rng, rng.randint(1, 300), num_24s=16)
+            expect = Cidr.compact(cidrs)
+
+            cset = CompactSet()
+            for cidr in cidrs:
+                cset.add(cidr)
+            assert cset.to_cidrs() == expect
+            assert len(cset) == len(expect)
+            assert list(cset) == expect
+
+            cset = CompactSet(cidrs[:10])
+            cset.add_many(cidrs[10:])
+            assert cset.to_cidrs() == expect
+            nets = Cidr.cidrs_to_nets(expect)
+            num_addrs = sum(net.num_addresses for net in nets)
+            assert cset.num_addresses() == num_addrs
+
+    def test_discard(self):
+        """ discard splits networks """
+        cset = CompactSet(['10.0.0.0/22', '2001:db8::/32'])
+        cset.discard('10.0.1.0/24')
+        cset.discard('192.168.0.0/16')
+
+        assert cset.to_cidrs() == ['10.0.0.0/24', '10.0.2.0/23',
+                                   '2001:db8::/32']
+        assert len(cset) == 3
+        assert cset.num_addresses(4) == 768
+
+        assert '10.0.2.7' in cset
+        assert '10.0.1.7' not in cset
+        assert '10.0.0.0/22' not in cset
+        assert '2001:db8:1::/48' in cset
+        assert 'junk' not in cset
+
+        cset.add('10.0.1.0/24')
+        assert cset.to_cidrs() == ['10.0.0.0/22', '2001:db8::/32']